@@ -5,9 +5,23 @@ import numpy as np
 import pandas as pd
 
 from asreview.data.record import Record
+from asreview.data.utils import convert_series_to_int
+from asreview.data.utils import convert_series_to_list
 from asreview.data.utils import convert_value_to_int
 from asreview.data.utils import convert_value_to_list
 from asreview.data.utils import standardize_included_label
+from asreview.data.utils import standardize_included_labels
+
+# Number of rows that is read, cleaned and turned into records at once.
+DEFAULT_CHUNK_SIZE = 10000
+
+# Vectorized implementations of cleaning methods. They act on a whole column and give
+# the same result as applying the cleaning method to the individual values.
+VECTORIZED_CLEANING_METHODS = {
+    convert_value_to_int: convert_series_to_int,
+    convert_value_to_list: convert_series_to_list,
+    standardize_included_label: standardize_included_labels,
+}
 
 
 class BaseReader(ABC):
@@ -20,6 +34,10 @@ class BaseReader(ABC):
     `to_records`. They assume that `read_data` produces a pandas DataFrame. There are a
     number of ways to customize the default cleaning behavior, see the comments next to
     the class attributes.
+
+    Large files are processed in chunks of rows, see `read_data_chunks` and
+    `read_record_chunks`. Readers that can parse a file incrementally can overwrite
+    `read_data_chunks`.
     """
 
     # When a data reader reads a file and turns it into records, it needs to know
@@ -65,10 +83,86 @@ class BaseReader(ABC):
 
     @classmethod
     def read_records(cls, fp, dataset_id, record_cls=Record, *args, **kwargs):
-        df = cls.read_data(fp, *args, **kwargs)
-        df.replace([pd.NA, np.nan], cls.__fillna_default__[0], inplace=True)
-        df = cls.clean_data(df)
-        return cls.to_records(df, dataset_id=dataset_id, record_cls=record_cls)
+        return [
+            record
+            for records in cls.read_record_chunks(
+                fp, dataset_id, record_cls, *args, **kwargs
+            )
+            for record in records
+        ]
+
+    @classmethod
+    def read_record_chunks(
+        cls,
+        fp,
+        dataset_id,
+        record_cls=Record,
+        *args,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        **kwargs,
+    ):
+        """Read the records from a file in chunks.
+
+        Each chunk of raw data is cleaned and turned into records before the next
+        chunk is read, so the memory use does not depend on the size of the file.
+
+        Parameters
+        ----------
+        fp : Path
+            Filepath of the file to read.
+        dataset_id : str
+            Identifier of the dataset.
+        record_cls : asreview.data.record.Base, optional
+            Record class to use, by default Record
+        chunk_size : int, optional
+            Maximum number of records in a chunk, by default 10000.
+
+        Yields
+        ------
+        list[Record]
+            List of records.
+        """
+        for df in cls.read_data_chunks(fp, *args, chunk_size=chunk_size, **kwargs):
+            df.replace([pd.NA, np.nan], cls.__fillna_default__[0], inplace=True)
+            df = cls.clean_data(df)
+            yield cls.to_records(df, dataset_id=dataset_id, record_cls=record_cls)
+
+    @classmethod
+    def read_record_frames(
+        cls,
+        fp,
+        dataset_id,
+        record_cls=Record,
+        *args,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        **kwargs,
+    ):
+        """Read the record data from a file in chunks of dataframes.
+
+        Like `read_record_chunks`, but without creating a record object for every
+        row. The dataframes can be added to the data store with
+        `DataStore.add_record_chunks`, which validates them per column.
+
+        Parameters
+        ----------
+        fp : Path
+            Filepath of the file to read.
+        dataset_id : str
+            Identifier of the dataset.
+        record_cls : asreview.data.record.Base, optional
+            Record class to use, by default Record
+        chunk_size : int, optional
+            Maximum number of records in a chunk, by default 10000.
+
+        Yields
+        ------
+        pd.DataFrame
+            Record data, see `to_record_frame`.
+        """
+        for df in cls.read_data_chunks(fp, *args, chunk_size=chunk_size, **kwargs):
+            df.replace([pd.NA, np.nan], cls.__fillna_default__[0], inplace=True)
+            df = cls.clean_data(df)
+            yield cls.to_record_frame(df, dataset_id=dataset_id, record_cls=record_cls)
 
     @classmethod
     @abstractmethod
@@ -96,6 +190,30 @@ class BaseReader(ABC):
         """
         raise NotImplementedError
 
+    @classmethod
+    def read_data_chunks(cls, fp, *args, chunk_size=DEFAULT_CHUNK_SIZE, **kwargs):
+        """Read the raw data from a file in chunks of rows.
+
+        The index of each chunk is the row number in the file. The default
+        implementation reads all data with `read_data` and splits it. Readers that
+        can read a file incrementally should overwrite this method.
+
+        Parameters
+        ----------
+        fp : Path
+            Filepath of the file to read.
+        chunk_size : int, optional
+            Maximum number of rows in a chunk, by default 10000.
+
+        Yields
+        ------
+        pd.DataFrame
+            A dataframe of user input data that has not been cleaned yet.
+        """
+        df = cls.read_data(fp, *args, **kwargs)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start : start + chunk_size].copy()
+
     @classmethod
     def clean_data(cls, df):
         """Clean the raw data.
@@ -115,7 +233,12 @@ class BaseReader(ABC):
         for column, cleaning_methods in cls.__cleaning_methods__.items():
             if column in df.columns:
                 for cleaning_method in cleaning_methods:
-                    df[column] = df[column].apply(cleaning_method)
+                    if cleaning_method in VECTORIZED_CLEANING_METHODS:
+                        df[column] = VECTORIZED_CLEANING_METHODS[cleaning_method](
+                            df[column]
+                        )
+                    else:
+                        df[column] = df[column].apply(cleaning_method)
         if cls.__fillna_default__ is not None:
             df.replace([pd.NA, np.nan], cls.__fillna_default__[0], inplace=True)
         return df
@@ -152,6 +275,41 @@ class BaseReader(ABC):
                 raise ValueError(f"Error when reading row {idx} of dataset: {e}") from e
         return records
 
+    @classmethod
+    def to_record_frame(cls, df, dataset_id=None, record_cls=Record):
+        """Select the record data from the cleaned data.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Cleaned data.
+        dataset_id : str, optional
+            Identifier of the dataset, by default None
+        record_cls : asreview.data.record.Base, optional
+            Record class to use, by default Record
+
+        Returns
+        -------
+        pd.DataFrame
+            Dataframe with the data columns of the record class, see
+            `record_cls.get_data_columns`. Columns that are not in the cleaned data
+            are None. The data is not validated yet.
+        """
+        columns = record_cls.get_data_columns()
+        data = pd.DataFrame(
+            {
+                column: df[column]
+                if column in df.columns
+                else pd.Series([None] * len(df), index=df.index, dtype=object)
+                for column in columns
+            },
+            index=df.index,
+            columns=columns,
+        )
+        data["dataset_row"] = df.index
+        data["dataset_id"] = dataset_id
+        return data
+
     @classmethod
     def standardize_column_names(cls, df):
         """Standardize column names of input data.
@@ -1,8 +1,17 @@
 from io import StringIO
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
+from asreview.data.base import DEFAULT_CHUNK_SIZE
+from asreview.data.near_duplicates import identify_near_duplicate_pairs
+from asreview.data.near_duplicates import merge_groups
+from asreview.data.near_duplicates import minhash_signatures
 from asreview.data.record import Record
+from asreview.data.utils import identify_key_groups
 from asreview.data.utils import identify_record_groups
+from asreview.data.utils import record_keys
 from asreview.database.database import Database
 from asreview.datasets import DatasetManager
 from asreview.extensions import load_extension
@@ -54,7 +63,9 @@ def _get_writer(fp):
         raise ValueError(f"No writer found for file at location {fp}") from e
 
 
-def _from_file(fp, reader=None, dataset_id=None, **kwargs):
+def _from_file(
+    fp, reader=None, dataset_id=None, chunk_size=None, as_frames=False, **kwargs
+):
     """Create instance from supported file format.
 
     It works in two ways; either manual control where the conversion
@@ -67,15 +78,31 @@ def _from_file(fp, reader=None, dataset_id=None, **kwargs):
         Read the data from this file or url.
     reader: BaseReader
         Reader to import the file.
+    chunk_size: int
+        If not None, return a generator of chunks of at most this many records
+        instead of a list of records.
+    as_frames: bool
+        If True, the chunks are dataframes with record data instead of lists of
+        records, see `BaseReader.read_record_frames`.
     kwargs: dict
         Keyword arguments passed to `reader.read_records`.
     """
     if reader is None:
         reader = _get_reader(fp)
+    if as_frames:
+        return reader.read_record_frames(
+            fp, dataset_id=dataset_id, chunk_size=chunk_size, **kwargs
+        )
+    if chunk_size is not None:
+        return reader.read_record_chunks(
+            fp, dataset_id=dataset_id, chunk_size=chunk_size, **kwargs
+        )
     return reader.read_records(fp, dataset_id=dataset_id, **kwargs)
 
 
-def _from_extension(name, reader=None, dataset_id=None, **kwargs):
+def _from_extension(
+    name, reader=None, dataset_id=None, chunk_size=None, as_frames=False, **kwargs
+):
     """Load a dataset from extension.
 
     Parameters
@@ -84,6 +111,12 @@ def _from_extension(name, reader=None, dataset_id=None, **kwargs):
         Read the data from this file or url.
     reader: BaseReader
         Reader to import the file.
+    chunk_size: int
+        If not None, return a generator of chunks of at most this many records
+        instead of a list of records.
+    as_frames: bool
+        If True, the chunks are dataframes with record data instead of lists of
+        records, see `BaseReader.read_record_frames`.
     kwargs: dict
         Keyword arguments passed to `reader.read_records`.
     """
@@ -97,34 +130,110 @@ def _from_extension(name, reader=None, dataset_id=None, **kwargs):
         reader = dataset.reader()
         fp = StringIO(dataset.to_file())
 
-    if reader is None:
-        reader = _get_reader(fp)
-    return reader.read_records(fp, dataset_id=dataset_id, **kwargs)
+    return _from_file(
+        fp,
+        reader=reader,
+        dataset_id=dataset_id,
+        chunk_size=chunk_size,
+        as_frames=as_frames,
+        **kwargs,
+    )
+
+
+def _add_record_chunks(db, chunks, near_duplicate_threshold=None):
+    """Add chunks of records to a database and identify the groups of duplicates.
+
+    Parameters
+    ----------
+    db : asreview.database.database.Database
+        Database in which to load the records.
+    chunks : Iterable[list[Record] | pd.DataFrame]
+        Chunks of records or record data.
+    near_duplicate_threshold : float, optional
+        If not None, also group near-duplicate records whose estimated Jaccard
+        similarity is at least this value, see `asreview.data.near_duplicates`.
+        By default None, which only groups exact duplicates.
+    """
+    first_seen = {}
+    groups = set()
+    signatures = []
+    signature_record_ids = []
+
+    def _collect_groups(chunks):
+        for records in chunks:
+            yield records
+            # The data store adds a chunk before it requests the next one, so the
+            # records have a record_id at this point.
+            if isinstance(records, pd.DataFrame):
+                chunk_groups = identify_key_groups(
+                    record_keys(records["title"], records["abstract"]),
+                    records["record_id"],
+                    first_seen,
+                )
+            else:
+                records = list(records)
+                chunk_groups = identify_record_groups(records, first_seen=first_seen)
+            for group_id, record_id in chunk_groups:
+                if group_id != record_id:
+                    groups.update([(group_id, group_id), (group_id, record_id)])
+
+            if near_duplicate_threshold is not None:
+                if not isinstance(records, pd.DataFrame):
+                    records = pd.DataFrame(
+                        [
+                            (record.record_id, record.title, record.abstract)
+                            for record in records
+                        ],
+                        columns=["record_id", "title", "abstract"],
+                    )
+                signatures.append(
+                    minhash_signatures(records["title"], records["abstract"])
+                )
+                signature_record_ids.append(records["record_id"].to_numpy())
+
+    db.input.add_record_chunks(_collect_groups(chunks))
+
+    if signatures:
+        groups = merge_groups(
+            groups.union(
+                identify_near_duplicate_pairs(
+                    np.concatenate(signatures),
+                    np.concatenate(signature_record_ids),
+                    threshold=near_duplicate_threshold,
+                )
+            )
+        )
+    db.input.set_groups(sorted(groups))
 
 
-def load_records(name, dataset_id=None, **kwargs):
+def load_records(name, dataset_id=None, chunk_size=None, **kwargs):
     """Load records from file, URL, or plugin.
 
     Parameters
     ----------
     name: str, pathlib.Path
         File path, URL, or alias of extension dataset.
+    chunk_size: int
+        If not None, return a generator of chunks of at most this many records
+        instead of a list of records. Default is None.
     **kwargs:
         Keyword arguments passed to the reader.
 
     Returns
     -------
-    list[Record]
-        List of records.
+    list[Record], Iterator[list[Record]]
+        List of records, or chunks of records if chunk_size is given.
     """
 
     # check is file or URL
     if _is_url(name) or Path(name).exists():
-        return _from_file(name, dataset_id=dataset_id, **kwargs)
+        return _from_file(name, dataset_id=dataset_id, chunk_size=chunk_size, **kwargs)
 
     # check if dataset is plugin dataset
     try:
-        return _from_extension(name, dataset_id=dataset_id, **kwargs)
+        return _from_extension(
+            name, dataset_id=dataset_id, chunk_size=chunk_size, **kwargs
+        )
     except ValueError:
         pass
 
@@ -132,7 +241,15 @@ def load_records(name, dataset_id=None, **kwargs):
     raise FileNotFoundError(f"File, URL, or dataset does not exist: '{name}'")
 
 
-def load_dataset(name, dataset_id=None, db=None, record_cls=Record, **kwargs):
+def load_dataset(
+    name,
+    dataset_id=None,
+    db=None,
+    record_cls=Record,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    near_duplicate_threshold=None,
+    **kwargs,
+):
     """Load dataset from file, URL, or plugin.
 
     Parameters
@@ -147,6 +264,13 @@ def load_dataset(name, dataset_id=None, db=None, record_cls=Record, **kwargs):
         database is created. By default None.
     record_cls : Type[asreview.data.record.Base], optional
         Record type to use for the dataset records, by default Record
+    chunk_size : int, optional
+        Number of records that is read and added to the database at once, by
+        default 10000.
+    near_duplicate_threshold : float, optional
+        If not None, records with an estimated Jaccard similarity of at least
+        this value are grouped as near-duplicates, in addition to the exact
+        duplicates. By default None.
     kwargs : dict, optional
         Keyword arguments passed to `load_records`.
 
@@ -160,10 +284,16 @@ def load_dataset(name, dataset_id=None, db=None, record_cls=Record, **kwargs):
     if dataset_id is None:
         dataset_id = str(name)
     db.create_tables()
-    records = load_records(
-        name=name, dataset_id=dataset_id, record_cls=record_cls, **kwargs
+    _add_record_chunks(
+        db,
+        load_records(
+            name=name,
+            dataset_id=dataset_id,
+            record_cls=record_cls,
+            chunk_size=chunk_size,
+            as_frames=True,
+            **kwargs,
+        ),
+        near_duplicate_threshold=near_duplicate_threshold,
     )
-    db.input.add_records(records=records)
-    groups = identify_record_groups(records)
-    db.input.set_groups(groups)
     return db
@@ -0,0 +1,289 @@
+# Copyright 2019-2025 The ASReview Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Detection of near-duplicate records with MinHash and LSH.
+
+Every record is turned into a set of shingles: sequences of consecutive words
+of its title and abstract. The MinHash signature of a record is a short array
+of integers such that the fraction of equal positions in the signatures of two
+records estimates the Jaccard similarity of their shingle sets.
+
+To avoid comparing all pairs of records, the signatures are split into bands
+and records are only compared to records with an identical band (locality
+sensitive hashing, LSH). Within a bucket of records with an identical band,
+every record is compared to the first record of the bucket only, so the number
+of comparisons is linear in the number of records.
+"""
+
+__all__ = [
+    "DEFAULT_NEAR_DUPLICATE_THRESHOLD",
+    "identify_near_duplicate_pairs",
+    "merge_groups",
+    "minhash_signatures",
+]
+
+import unicodedata
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from asreview.data.utils import _as_object_array
+from asreview.data.utils import _strip_copyright
+
+DEFAULT_NEAR_DUPLICATE_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 128
+DEFAULT_N_BANDS = 16
+DEFAULT_SHINGLE_SIZE = 3
+
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# Translation table that replaces every byte except [a-z0-9] by a space.
+_WORD_TABLE = bytes(
+    c if chr(c) in "abcdefghijklmnopqrstuvwxyz0123456789" else ord(" ")
+    for c in range(256)
+)
+
+# Number of records and permutations processed at once. Limits the memory use to
+# about (number of shingles of the records) x (permutations) x 8 bytes.
+_BATCH_SIZE = 1000
+_PERM_BATCH_SIZE = 16
+
+
+def _words(text):
+    """Split a text into normalized words."""
+    if not text:
+        return []
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+    return text.lower().encode("ascii", "ignore").translate(_WORD_TABLE).split()
+
+
+def _shingle_hashes(docs, shingle_size):
+    """Hash the shingles of a batch of documents.
+
+    Returns the hashes of the shingles and the number of shingles per document.
+    A document with fewer words than the shingle size gets a single shingle of
+    all its words.
+    """
+    lengths = np.array([len(words) for words in docs], dtype=np.int64)
+    n_words = int(lengths.sum())
+    if n_words == 0:
+        return np.zeros(0, dtype=np.uint64), np.zeros(len(docs), dtype=np.int64)
+
+    word_hashes = pd.util.hash_array(
+        np.array([word for words in docs for word in words], dtype=object)
+    )
+    doc_ids = np.repeat(np.arange(len(docs)), lengths)
+    positions = np.arange(n_words) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+    # Combine the hashes of consecutive words within the same document. The
+    # multiplication overflows on purpose.
+    hashes = word_hashes.copy()
+    with np.errstate(over="ignore"):
+        for i in range(1, shingle_size):
+            shifted = np.zeros(n_words, dtype=np.uint64)
+            same_doc = doc_ids[i:] == doc_ids[:-i]
+            shifted[:-i][same_doc] = word_hashes[i:][same_doc]
+            hashes = hashes * np.uint64(0x100000001B3) + shifted
+
+    is_start = positions <= np.maximum(lengths - shingle_size, 0)[doc_ids]
+    n_shingles = np.minimum(lengths, np.maximum(lengths - shingle_size + 1, 1))
+    return hashes[is_start], n_shingles
+
+
+def minhash_signatures(
+    titles,
+    abstracts,
+    num_perm=DEFAULT_NUM_PERM,
+    shingle_size=DEFAULT_SHINGLE_SIZE,
+    seed=535,
+):
+    """Compute the MinHash signatures of records.
+
+    The shingles of a record are the sequences of shingle_size consecutive
+    words in the title and the abstract. Words are normalized like for the
+    exact duplicates and copyright notices are removed from the abstract.
+
+    Parameters
+    ----------
+    titles : array-like
+        Titles of the records.
+    abstracts : array-like
+        Abstracts of the records.
+    num_perm : int, optional
+        Length of the signatures. Default is 128.
+    shingle_size : int, optional
+        Number of words per shingle. Default is 3.
+    seed : int, optional
+        Seed of the hash functions. Only signatures computed with the same
+        seed can be compared. Default is 535.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of type uint32 and shape (number of records, num_perm). Records
+        without text get a signature with only the maximum value.
+    """
+    # Multiply-shift hash functions h -> (a * h + b) >> 32 with odd a. The
+    # arithmetic overflows on purpose.
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 1 << 63, (num_perm, 1), dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 1 << 63, (num_perm, 1), dtype=np.uint64)
+
+    titles = _as_object_array(titles)
+    abstracts = _as_object_array(abstracts)
+    signatures = np.full((len(titles), num_perm), _MAX_HASH, dtype=np.uint32)
+
+    for start in range(0, len(titles), _BATCH_SIZE):
+        docs = [
+            _words(title) + _words(_strip_copyright(abstract))
+            for title, abstract in zip(
+                titles[start : start + _BATCH_SIZE],
+                abstracts[start : start + _BATCH_SIZE],
+                strict=True,
+            )
+        ]
+        hashes, n_shingles = _shingle_hashes(docs, shingle_size)
+        if len(hashes) == 0:
+            continue
+
+        has_shingles = n_shingles > 0
+        offsets = (np.cumsum(n_shingles) - n_shingles)[has_shingles]
+        rows = start + np.flatnonzero(has_shingles)
+
+        values = np.empty((_PERM_BATCH_SIZE, len(hashes)), dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            for p in range(0, num_perm, _PERM_BATCH_SIZE):
+                perm = slice(p, p + _PERM_BATCH_SIZE)
+                out = values[: len(a[perm])]
+                np.multiply(a[perm], hashes, out=out)
+                np.add(out, b[perm], out=out)
+                np.right_shift(out, np.uint64(32), out=out)
+                signatures[rows, perm] = np.minimum.reduceat(out, offsets, axis=1).T
+
+    return signatures
+
+
+def identify_near_duplicate_pairs(
+    signatures,
+    record_ids,
+    threshold=DEFAULT_NEAR_DUPLICATE_THRESHOLD,
+    n_bands=DEFAULT_N_BANDS,
+):
+    """Find pairs of records with similar MinHash signatures.
+
+    Parameters
+    ----------
+    signatures : numpy.ndarray
+        MinHash signatures of the records, see `minhash_signatures`.
+    record_ids : array-like
+        Record id of every record.
+    threshold : float, optional
+        Minimum estimated Jaccard similarity of a pair. Default is 0.8.
+    n_bands : int, optional
+        Number of LSH bands. More bands find more pairs with a similarity
+        below the threshold, at the cost of more comparisons. The number of
+        permutations of the signatures should be a multiple of it. Default
+        is 16.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Sorted list of pairs `(record_id, record_id)` of similar records.
+    """
+    record_ids = np.asarray(record_ids)
+    has_text = ~(signatures == _MAX_HASH).all(axis=1)
+    signatures = signatures[has_text]
+    record_ids = record_ids[has_text]
+    if len(record_ids) < 2:
+        return []
+
+    n_rows = signatures.shape[1] // n_bands
+    multipliers = np.random.default_rng(0).integers(
+        1, 1 << 63, n_rows, dtype=np.uint64
+    ) | np.uint64(1)
+
+    candidates = []
+    with np.errstate(over="ignore"):
+        for band in range(n_bands):
+            band_values = signatures[:, band * n_rows : (band + 1) * n_rows]
+            keys = (band_values.astype(np.uint64) * multipliers).sum(
+                axis=1, dtype=np.uint64
+            )
+
+            # pair every record with the first record in its bucket
+            order = np.argsort(keys, kind="stable")
+            is_first = np.r_[True, keys[order][1:] != keys[order][:-1]]
+            first = order[is_first][np.cumsum(is_first) - 1]
+            candidates.append(np.stack([first, order], axis=1)[~is_first])
+
+    candidates = np.unique(np.concatenate(candidates), axis=0)
+
+    pairs = []
+    for start in range(0, len(candidates), 100000):
+        i, j = candidates[start : start + 100000].T
+        similarity = (signatures[i] == signatures[j]).mean(axis=1)
+        similar = similarity >= threshold
+        pairs.append(np.stack([record_ids[i[similar]], record_ids[j[similar]]], 1))
+
+    if len(pairs) == 0:
+        return []
+    return sorted(map(tuple, np.concatenate(pairs).tolist()))
+
+
+def merge_groups(pairs):
+    """Merge pairs of records into groups.
+
+    Two records end up in the same group if they are connected by a chain of
+    pairs.
+
+    Parameters
+    ----------
+    pairs : Iterable[tuple[int, int]]
+        Pairs of record ids of records that belong to the same group, for
+        example the groups of exact duplicates and near-duplicate pairs.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Sorted list of tuples `(group_id, record_id)` for the records in a
+        group of at least two records. The group_id is the smallest record_id
+        in the group.
+    """
+    pairs = np.array(list(pairs), dtype=np.int64).reshape(-1, 2)
+    if len(pairs) == 0:
+        return []
+
+    nodes, edges = np.unique(pairs, return_inverse=True)
+    edges = edges.reshape(-1, 2)
+    graph = coo_matrix(
+        (np.ones(len(edges)), (edges[:, 0], edges[:, 1])),
+        shape=(len(nodes), len(nodes)),
+    )
+    _, labels = connected_components(graph, directed=False)
+
+    group_ids = np.full(labels.max() + 1, np.iinfo(np.int64).max)
+    np.minimum.at(group_ids, labels, nodes)
+    sizes = np.bincount(labels)
+
+    in_group = sizes[labels] > 1
+    return sorted(
+        zip(
+            group_ids[labels][in_group].tolist(),
+            nodes[in_group].tolist(),
+            strict=True,
+        )
+    )
@@ -1,3 +1,4 @@
+import dataclasses
 from typing import Optional
 
 import pandas as pd
@@ -13,6 +14,7 @@ from sqlalchemy.types import JSON
 from sqlalchemy.types import Integer
 from sqlalchemy.types import String
 
+from asreview.data.utils import convert_series_to_int
 from asreview.data.utils import convert_value_to_int
 
 
@@ -82,6 +84,7 @@ class Base(DeclarativeBase, MappedAsDataclass):
         extra = getattr(cls, "__extra_table_args__", ())
         return (
             Index(f"idx_{cls.__tablename__}_group_id", "group_id"),
+            Index(f"idx_{cls.__tablename__}_duplicate_of", "duplicate_of"),
             *extra,
         )
 
@@ -95,6 +98,55 @@ class Base(DeclarativeBase, MappedAsDataclass):
         """
         return [column.name for column in cls.__mapper__.columns]
 
+    @classmethod
+    def get_data_columns(cls):
+        """Get the names of the columns that are given when creating a record.
+
+        Other columns, like `record_id` and `duplicate_of`, are set by the data store.
+
+        Returns
+        -------
+        list[str]
+        """
+        return [field.name for field in dataclasses.fields(cls) if field.init]
+
+    @classmethod
+    def validate_dataframe(cls, df):
+        """Validate the data of many records at once.
+
+        The result is the same as creating a record for every row of the dataframe
+        and reading back its data columns. This default implementation does exactly
+        that. Record classes can overwrite this method with a vectorized version.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Data of the records, with one row per record. Missing columns get their
+            default value.
+
+        Returns
+        -------
+        pd.DataFrame
+            Validated data with the columns of `get_data_columns` and the index of
+            the input.
+
+        Raises
+        ------
+        ValueError
+            If the data of a record is invalid.
+        """
+        columns = cls.get_data_columns()
+        records = [
+            cls(**{key: value for key, value in row.items() if key in columns})
+            for row in df.to_dict("records")
+        ]
+        return pd.DataFrame(
+            [[getattr(record, column) for column in columns] for record in records],
+            index=df.index,
+            columns=columns,
+            dtype=object,
+        )
+
     @classmethod
     def get_pandas_dtype_mapping(cls):
         """Get the mapping from record column name to pandas data type.
@@ -177,3 +229,85 @@ class Record(Base):
     @validates("year")
     def validate_optional_integer(self, key, value):
         return convert_value_to_int(value)
+
+    @classmethod
+    def validate_dataframe(cls, df):
+        """Validate the data of many records at once.
+
+        Vectorized version of the validators of the record. Missing values can be
+        None or NaN. If a check fails, the records are validated one by one, which
+        raises the error of the first invalid record.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Data of the records, with one row per record. Missing columns get their
+            default value.
+
+        Returns
+        -------
+        pd.DataFrame
+            Validated data with the columns of `get_data_columns` and the index of
+            the input.
+
+        Raises
+        ------
+        ValueError
+            If the data of a record is invalid.
+        """
+        data = df.reindex(columns=cls.get_data_columns())
+
+        for key in ["authors", "keywords"]:
+            if key not in df:
+                continue
+            is_null = data[key].isna()
+            values = data[key][~is_null]
+            if not values.map(type).eq(list).all():
+                return super().validate_dataframe(df)
+            # exploding gives one row per item, and one missing value per empty list
+            items = values.explode()
+            if items.notna().sum() != sum(map(len, values)) or (
+                pd.api.types.infer_dtype(items, skipna=True) not in ("string", "empty")
+            ):
+                return super().validate_dataframe(df)
+            data[key] = [
+                [] if null else value
+                for null, value in zip(is_null, data[key], strict=True)
+            ]
+
+        for key in ["title", "abstract", "doi", "url"]:
+            if key not in df:
+                continue
+            if pd.api.types.infer_dtype(data[key], skipna=True) not in (
+                "string",
+                "empty",
+            ):
+                return super().validate_dataframe(df)
+            data[key] = (
+                data[key]
+                .astype(object)
+                .where(data[key].notna() & data[key].ne(""), None)
+            )
+
+        if "included" in df:
+            is_null = data["included"].isna()
+            if not data["included"][~is_null].isin([0, 1]).all():
+                return super().validate_dataframe(df)
+            data["included"] = data["included"].astype(object).where(~is_null, None)
+
+        if "year" in df:
+            data["year"] = convert_series_to_int(data["year"])
+
+        # missing columns get the default value of the record
+        for field in dataclasses.fields(cls):
+            if not field.init or field.name in df:
+                continue
+            default = cls.__table__.columns[field.name].default
+            if field.default_factory is not dataclasses.MISSING:
+                data[field.name] = [field.default_factory() for _ in range(len(df))]
+            elif default is not None and default.is_scalar:
+                data[field.name] = [default.arg] * len(df)
+            else:
+                data[field.name] = [None] * len(df)
+
+        return data
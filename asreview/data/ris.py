@@ -23,6 +23,7 @@ from urllib.request import urlopen
 import pandas as pd
 import rispy
 
+from asreview.data.base import DEFAULT_CHUNK_SIZE
 from asreview.data.base import BaseReader
 from asreview.data.utils import convert_value_to_list
 from asreview.utils import _is_url
@@ -121,26 +122,7 @@ class RISReader(BaseReader):
         return entries
 
     @classmethod
-    def read_data(cls, fp):
-        """Import dataset.
-
-        Parameters
-        ----------
-        fp: str, pathlib.Path
-            File path to the RIS file.
-
-        Returns
-        -------
-        pd.DataFrame:
-            Dataframe with entries. If the notes field contains a note with the text
-            `ASReview_relevant`, `ASReview_irrelevant` or `ASReview_not_seen`, the
-            data frame will have a column `included` with the value `1`, `0` or `None`.
-
-        Raises
-        ------
-        ValueError
-            File with unrecognized encoding is used as input.
-        """
+    def _read_entries(cls, fp):
         encodings = ["utf-8", "utf-8-sig", "ISO-8859-1"]
         entries = None
         for encoding in encodings:
@@ -159,8 +141,12 @@ class RISReader(BaseReader):
         if entries is None:
             raise ValueError("Cannot find proper encoding for data file")
 
+        return entries
+
+    @classmethod
+    def _entries_to_df(cls, entries, start=0):
         # Turn the entries dictionary into a Pandas dataframe
-        df = pd.DataFrame(entries)
+        df = pd.DataFrame(entries, index=pd.RangeIndex(start, start + len(entries)))
 
         # Check if "notes" column is present
         if "notes" in df:
@@ -177,6 +163,52 @@ class RISReader(BaseReader):
 
         return df
 
+    @classmethod
+    def read_data(cls, fp):
+        """Import dataset.
+
+        Parameters
+        ----------
+        fp: str, pathlib.Path
+            File path to the RIS file.
+
+        Returns
+        -------
+        pd.DataFrame:
+            Dataframe with entries. If the notes field contains a note with the text
+            `ASReview_relevant`, `ASReview_irrelevant` or `ASReview_not_seen`, the
+            data frame will have a column `included` with the value `1`, `0` or `None`.
+
+        Raises
+        ------
+        ValueError
+            File with unrecognized encoding is used as input.
+        """
+        return cls._entries_to_df(cls._read_entries(fp))
+
+    @classmethod
+    def read_data_chunks(cls, fp, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Import dataset in chunks.
+
+        The entries of the RIS file are parsed at once, but the dataframe is built
+        per chunk of entries.
+
+        Parameters
+        ----------
+        fp: str, pathlib.Path
+            File path to the RIS file.
+        chunk_size: int
+            Maximum number of entries in a chunk.
+
+        Yields
+        ------
+        pd.DataFrame:
+            Dataframe with entries, see `read_data`.
+        """
+        entries = cls._read_entries(fp)
+        for start in range(0, len(entries), chunk_size):
+            yield cls._entries_to_df(entries[start : start + chunk_size], start=start)
+
     @classmethod
     def clean_data(cls, df):
         # We drop the 'label' column if it's available. For RIS files ASReview stores
@@ -198,6 +230,17 @@ class RISReader(BaseReader):
         return super().clean_data(df)
 
 
+class _NumberedRisWriter(rispy.RisWriter):
+    """RIS writer that numbers the references from an offset."""
+
+    def __init__(self, start=0, **kwargs):
+        super().__init__(**kwargs)
+        self.start = start
+
+    def set_header(self, count):
+        return super().set_header(self.start + count)
+
+
 class RISWriter:
     """RIS file writer."""
 
@@ -206,27 +249,9 @@ class RISWriter:
     caution = "Available only if you imported a RIS file when creating the project"
     write_format = ".ris"
 
-    @classmethod
-    def write_data(cls, df, fp):
-        """Export dataset.
-
-        Parameters
-        ----------
-        df: pd.Dataframe
-            Dataframe of all available record data.
-        fp: str, pathlib.Path
-            File path to the RIS file, if exists.
-
-        Returns
-        -------
-        RIS file
-            Dataframe of all available record data. Any column from the data frame that
-            starts with `asreview_` is added to the RIS file as note in the notes field
-            of the form: `asreview_{column_name}: json.dumps({column_value})`. If the
-            dataframe contains a column `asreview_label`, also a note is added with the
-            value `ASReview_relevant`, `ASReview_irrelevant` or `ASReview_not_seen`
-            corresponding to the value `1`, `0` or `None` in that column.
-        """
+    @staticmethod
+    def _to_ris_records(df):
+        """Convert a dataframe into a list of references for rispy."""
         # Turn pandas DataFrame into records (list of dictionaries) for rispy
         records = copy.deepcopy(df.to_dict("records"))
 
@@ -267,6 +292,31 @@ class RISWriter:
             # Append the deepcopied and updated record to a new array
             records_new.append(rec_copy)
 
+        return records_new
+
+    @classmethod
+    def write_data(cls, df, fp):
+        """Export dataset.
+
+        Parameters
+        ----------
+        df: pd.Dataframe
+            Dataframe of all available record data.
+        fp: str, pathlib.Path
+            File path to the RIS file, if exists.
+
+        Returns
+        -------
+        RIS file
+            Dataframe of all available record data. Any column from the data frame that
+            starts with `asreview_` is added to the RIS file as note in the notes field
+            of the form: `asreview_{column_name}: json.dumps({column_value})`. If the
+            dataframe contains a column `asreview_label`, also a note is added with the
+            value `ASReview_relevant`, `ASReview_irrelevant` or `ASReview_not_seen`
+            corresponding to the value `1`, `0` or `None` in that column.
+        """
+        records_new = cls._to_ris_records(df)
+
         # From buffered dataframe
         if fp is None:
             # Write the whole content to buffer
@@ -277,3 +327,28 @@ class RISWriter:
             # Write the whole content to a file
             with open(fp, "w", encoding="utf8") as fp:
                 rispy.dump(records_new, fp)
+
+    @classmethod
+    def write_data_chunks(cls, dfs):
+        """Export a dataset in chunks.
+
+        Parameters
+        ----------
+        dfs: iterable of pd.Dataframe
+            Dataframes with the record data. See `write_data` for the columns.
+
+        Yields
+        ------
+        str
+            The text of the RIS file, one chunk at a time. The references are
+            numbered in the same way as in the file written by `write_data`.
+        """
+        n = 0
+        for df in dfs:
+            records = cls._to_ris_records(df)
+            if not records:
+                continue
+            yield ("\n" if n > 0 else "") + rispy.dumps(
+                records, implementation=_NumberedRisWriter, start=n
+            )
+            n += len(records)
@@ -12,15 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-__all__ = ["fuzzy_find"]
+__all__ = ["clear_fuzzy_index_cache", "fuzzy_find"]
 
+import hashlib
 import re
+from collections import OrderedDict
+from collections import defaultdict
 from difflib import SequenceMatcher
 
 import numpy as np
+import pandas as pd
 
 from asreview.utils import _format_to_str
 
+# Number of fuzzy indexes kept in memory, see `_get_fuzzy_index`.
+FUZZY_INDEX_CACHE_SIZE = 8
+
+_fuzzy_index_cache = OrderedDict()
+
 
 def _create_inverted_index(match_strings):
     index = {}
@@ -36,6 +45,127 @@ def _create_inverted_index(match_strings):
     return index
 
 
+class _FuzzyIndex:
+    """Inverted index with candidate generation for fuzzy matching of tokens.
+
+    `SequenceMatcher.quick_ratio` of two tokens is 2 * M / (len(a) + len(b)), where
+    M is the number of characters they have in common. For a given threshold this
+    bounds both the length of a matching token and the number of characters of the
+    keyword it should contain. The tokens are stored in buckets by length, with
+    postings of the characters they contain. A token that misses more than
+    len(key) - M characters of the keyword can't match, so it is enough to look
+    up the tokens that contain one of the len(key) - M + 1 rarest characters of
+    the keyword. All other tokens are skipped without computing their ratio.
+
+    Parameters
+    ----------
+    match_strings: list
+        List of strings to index.
+    """
+
+    def __init__(self, match_strings):
+        self.n_match = len(match_strings)
+        self.inv_index = _create_inverted_index(match_strings)
+        self.tokens = list(self.inv_index)
+
+        self.postings = defaultdict(list)
+        for i, token in enumerate(self.tokens):
+            for char in set(token):
+                self.postings[(len(token), char)].append(i)
+
+        self.lengths = {len(token) for token in self.tokens}
+
+    def candidates(self, key, threshold):
+        """Get the tokens that can reach the threshold ratio with the keyword."""
+        # use the same float arithmetic as quick_ratio, so that no token on the
+        # boundary is skipped
+        lengths = [
+            n
+            for n in self.lengths
+            if 2.0 * min(n, len(key)) / (n + len(key)) >= threshold
+        ]
+        if not lengths:
+            return []
+
+        # minimal number of characters in common over the possible lengths
+        total = len(key) + min(lengths)
+        min_common = min(n for n in range(total + 1) if 2.0 * n / total >= threshold)
+        chars = sorted(
+            key,
+            key=lambda char: sum(
+                len(self.postings.get((n, char), ())) for n in lengths
+            ),
+        )[: max(len(key) - min_common + 1, 1)]
+
+        candidates = set()
+        for char in set(chars):
+            for n in lengths:
+                candidates.update(self.postings.get((n, char), ()))
+        return [self.tokens[i] for i in sorted(candidates)]
+
+    def scores(self, keywords, threshold=0.9):
+        """Score the indexed strings.
+
+        Parameters
+        ----------
+        keywords: str
+            Keywords that we are trying to find in the indexed strings.
+        threshold: float
+            Minimal ratio of a keyword and a token to count as a match.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of scores ordered in the same way as the indexed strings.
+        """
+        word = re.compile(r"['\w]+")
+        key_list = word.findall(keywords.lower())
+
+        ratios = np.zeros(self.n_match)
+        for key in key_list:
+            cur_ratios = {}
+            s = SequenceMatcher()
+            s.set_seq2(key)
+            for token in self.candidates(key, threshold):
+                s.set_seq1(token)
+                ratio = s.quick_ratio()
+                if ratio < threshold:
+                    continue
+                for idx in self.inv_index[token]:
+                    if ratio > cur_ratios.get(idx, 0.0):
+                        cur_ratios[idx] = ratio
+
+            for idx, rat in cur_ratios.items():
+                ratios[idx] += rat
+
+        return (100 * ratios) / len(key_list)
+
+
+def _get_fuzzy_index(match_strings):
+    """Get the fuzzy index of a list of strings from the cache or build it.
+
+    The cache key is a hash of the strings, so a changed dataset gets a new index.
+    The least recently used indexes are removed when the cache is full.
+    """
+    key = hashlib.sha256(
+        pd.util.hash_array(np.asarray(match_strings, dtype=object)).tobytes()
+    ).hexdigest()
+
+    if key in _fuzzy_index_cache:
+        _fuzzy_index_cache.move_to_end(key)
+    else:
+        _fuzzy_index_cache[key] = _FuzzyIndex(match_strings)
+        while len(_fuzzy_index_cache) > FUZZY_INDEX_CACHE_SIZE:
+            _fuzzy_index_cache.popitem(last=False)
+
+    return _fuzzy_index_cache[key]
+
+
+def clear_fuzzy_index_cache():
+    """Remove all fuzzy indexes from the in-memory cache."""
+    _fuzzy_index_cache.clear()
+
+
 def _get_fuzzy_scores(keywords, match_strings, threshold=0.9):
     """Rank a list of strings, depending on a set of keywords.
 
@@ -51,30 +181,7 @@ def _get_fuzzy_scores(keywords, match_strings, threshold=0.9):
     numpy.ndarray
         Array of scores ordered in the same way as the str_list input.
     """
-    inv_index = _create_inverted_index(match_strings)
-
-    n_match = len(match_strings)
-    word = re.compile(r"['\w]+")
-    key_list = word.findall(keywords.lower())
-
-    ratios = np.zeros(n_match)
-    for key in key_list:
-        cur_ratios = {}
-        s = SequenceMatcher()
-        s.set_seq2(key)
-        for token in inv_index:
-            s.set_seq1(token)
-            ratio = s.quick_ratio()
-            if ratio < threshold:
-                continue
-            for idx in inv_index[token]:
-                if ratio > cur_ratios.get(idx, 0.0):
-                    cur_ratios[idx] = ratio
-
-        for idx, rat in cur_ratios.items():
-            ratios[idx] += rat
-
-    return (100 * ratios) / len(key_list)
+    return _get_fuzzy_index(match_strings).scores(keywords, threshold=threshold)
 
 
 def fuzzy_find(
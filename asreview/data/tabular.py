@@ -15,10 +15,37 @@
 __all__ = ["CSVReader"]
 
 
+import csv
+from pathlib import Path
+
 import pandas as pd
 
+from asreview.data.base import DEFAULT_CHUNK_SIZE
 from asreview.data.base import BaseReader
 from asreview.data.record import Record
+from asreview.utils import _is_url
+
+CSV_ENCODINGS = ["utf-8", "ISO-8859-1"]
+
+
+def _detect_encoding(fp, encodings=CSV_ENCODINGS):
+    """Get the first encoding that can decode the whole file."""
+    for encoding in encodings:
+        try:
+            with open(fp, encoding=encoding) as f:
+                while f.read(2**20):
+                    pass
+            return encoding
+        except UnicodeDecodeError:
+            continue
+
+    raise ValueError("The encoding of the file is not supported.")
+
+
+def _sniff_delimiter(fp, encoding):
+    """Determine the delimiter from the first line, like `pandas.read_csv` does."""
+    with open(fp, encoding=encoding) as f:
+        return csv.Sniffer().sniff(f.readline()).delimiter
 
 
 class CSVReader(BaseReader):
@@ -47,7 +74,7 @@ class CSVReader(BaseReader):
         list:
             List with entries.
         """
-        for encoding in ["utf-8", "ISO-8859-1"]:
+        for encoding in CSV_ENCODINGS:
             try:
                 return pd.read_csv(fp, sep=None, encoding=encoding, engine="python")
             except UnicodeDecodeError:
@@ -56,6 +83,39 @@ class CSVReader(BaseReader):
 
         raise UnicodeDecodeError("The encoding of the file is not supported.")
 
+    @classmethod
+    def read_data_chunks(cls, fp, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Import dataset in chunks.
+
+        Files on disk are parsed incrementally. The encoding and delimiter are
+        determined first, after which the fast C parser of pandas reads the rows.
+        Other input, like URLs and buffers, is read at once.
+
+        Parameters
+        ----------
+        fp: str, pathlib.Path
+            File path to the CSV file.
+        chunk_size: int
+            Maximum number of rows in a chunk.
+
+        Yields
+        ------
+        pd.DataFrame:
+            Dataframe with entries.
+        """
+        if not isinstance(fp, (str, Path)) or _is_url(fp):
+            yield from super().read_data_chunks(fp, chunk_size=chunk_size)
+            return
+
+        encoding = _detect_encoding(fp)
+        with pd.read_csv(
+            fp,
+            sep=_sniff_delimiter(fp, encoding),
+            encoding=encoding,
+            chunksize=chunk_size,
+        ) as reader:
+            yield from reader
+
 
 class CSVWriter:
     """CSV file writer."""
@@ -84,6 +144,28 @@ class CSVWriter:
         """
         return df.to_csv(fp, sep=sep, index=True, date_format="%Y-%m-%d %H:%M:%S")
 
+    @classmethod
+    def write_data_chunks(cls, dfs, sep=","):
+        """Export a dataset in chunks.
+
+        Parameters
+        ----------
+        dfs: iterable of pandas.Dataframe
+            Dataframes with the record data, all with the same columns.
+        sep: str
+            Seperator of the file.
+
+        Yields
+        ------
+        str
+            The text of the file, one chunk at a time. The first chunk contains the
+            header.
+        """
+        for i, df in enumerate(dfs):
+            yield df.to_csv(
+                sep=sep, index=True, header=i == 0, date_format="%Y-%m-%d %H:%M:%S"
+            )
+
 
 class ExcelReader(BaseReader):
     """Excel file reader."""
@@ -182,3 +264,25 @@ class TSVWriter:
             Dataframe of all available record data.
         """
         return df.to_csv(fp, sep=sep, index=True, date_format="%Y-%m-%d %H:%M:%S")
+
+    @classmethod
+    def write_data_chunks(cls, dfs, sep="\t"):
+        """Export a dataset in chunks.
+
+        Parameters
+        ----------
+        dfs: iterable of pandas.Dataframe
+            Dataframes with the record data, all with the same columns.
+        sep: str
+            Seperator of the file.
+
+        Yields
+        ------
+        str
+            The text of the file, one chunk at a time. The first chunk contains the
+            header.
+        """
+        for i, df in enumerate(dfs):
+            yield df.to_csv(
+                sep=sep, index=True, header=i == 0, date_format="%Y-%m-%d %H:%M:%S"
+            )
@@ -1,5 +1,6 @@
 import re
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -19,6 +20,15 @@ RIS_LIST_COLUMNS = [TAG_KEY_MAPPING[list_type_tag] for list_type_tag in LIST_TYP
 PANDAS_CSV_MAX_CELL_LIMIT = 131072
 
 
+# Bytes that are removed from normalized text: everything except [a-z0-9].
+_NON_ALNUM_BYTES = bytes(
+    sorted(set(range(256)) - set(b"abcdefghijklmnopqrstuvwxyz0123456789"))
+)
+
+# The same for ASCII text, as translation table of `str.translate`.
+_NON_ALNUM_TABLE = dict.fromkeys(_NON_ALNUM_BYTES[:128])
+
+
 def _clean_text(text):
     """Normalize text for duplicate detection.
 
@@ -27,13 +37,18 @@ def _clean_text(text):
     """
     if not text:
         return ""
-    # Normalize unicode (e.g. é -> e, fi ligature -> fi)
-    text = unicodedata.normalize("NFKD", text)
-    text = text.lower()
+    # Normalize unicode (e.g. é -> e, fi ligature -> fi). ASCII text is already
+    # normalized.
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
     # Keep only alphanumeric characters (removes punctuation, whitespace,
     # and combining marks left over from NFKD decomposition)
-    text = re.sub(r"[^a-z0-9]", "", text)
-    return text
+    return (
+        text.lower()
+        .encode("ascii", "ignore")
+        .translate(None, _NON_ALNUM_BYTES)
+        .decode("ascii")
+    )
 
 
 # Matches copyright/license notices that commonly appear at the end of abstracts.
@@ -41,17 +56,24 @@ def _clean_text(text):
 _COPYRIGHT_RE = re.compile(
     r"(?:"
     r"©"
-    r"|\bcopyright\b"
-    r"|\ball\s+rights\s+reserved\b"
-    r"|\bpublished\s+by\s+\w"
-    r"|\bcreative\s+commons\b"
-    r"|\bcc\s+by\b"
-    r"|\bcrown\s+copyright\b"
-    r"|\bopen\s+access\s+article\b"
+    r"|\b(?:"
+    r"copyright\b"
+    r"|all\s+rights\s+reserved\b"
+    r"|published\s+by\s+\w"
+    r"|creative\s+commons\b"
+    r"|cc\s+by\b"
+    r"|crown\s+copyright\b"
+    r"|open\s+access\s+article\b"
+    r")"
     r").*",
     re.IGNORECASE | re.DOTALL,
 )
 
+# Every match of _COPYRIGHT_RE contains one of these substrings after lowercasing.
+# They contain no letters with special case folding rules (like i, k and s), so
+# a tail without any of them can skip the regular expression.
+_COPYRIGHT_SUBSTRINGS = ("©", "copyr", "rved", "publ", "creat", "cc", "open")
+
 
 def _strip_copyright(text):
     """Strip copyright/license notices from the end of an abstract."""
@@ -59,6 +81,9 @@ def _strip_copyright(text):
         return text
     tail_start = max(0, len(text) - 300)
     tail = text[tail_start:]
+    tail_lower = tail.lower()
+    if not any(substring in tail_lower for substring in _COPYRIGHT_SUBSTRINGS):
+        return text
     m = _COPYRIGHT_RE.search(tail)
     if m:
         return text[: tail_start + m.start()].rstrip()
@@ -72,12 +97,140 @@ DEFAULT_EXTRACTORS = (
 )
 
 
-def duplicated(df, pid="doi"):
+def _as_object_array(values):
+    """Convert a column to an object array with strings and None."""
+    values = pd.Series(values, dtype=object)
+    return values.where(values.notna(), None).to_numpy()
+
+
+def normalize_text(values):
+    """Normalize a column of texts for duplicate detection.
+
+    Vectorized version of `_clean_text`.
+
+    Parameters
+    ----------
+    values : array-like
+        Texts to normalize. Missing values are allowed.
+
+    Returns
+    -------
+    numpy.ndarray
+        Object array with the normalized texts. Missing values become an empty
+        string.
+    """
+    texts = pd.Series(_as_object_array(values), dtype=object).fillna("")
+
+    # Normalize unicode (e.g. é -> e, fi ligature -> fi) and drop what is not
+    # ASCII. ASCII text is already normalized.
+    non_ascii = ~texts.map(str.isascii).astype(bool)
+    texts = texts.mask(non_ascii, texts[non_ascii].str.normalize("NFKD")).str.lower()
+    texts = texts.mask(
+        non_ascii, texts[non_ascii].str.encode("ascii", "ignore").str.decode("ascii")
+    )
+    # Keep only alphanumeric characters (removes punctuation, whitespace, and
+    # combining marks left over from NFKD decomposition)
+    return texts.str.translate(_NON_ALNUM_TABLE).to_numpy(dtype=object)
+
+
+def normalize_doi(values):
+    """Normalize a column of Digital Object Identifiers.
+
+    Strips whitespace, lowercases and removes the resolver prefix
+    (``https://doi.org/``), so that the same DOI written in different ways
+    gets the same value.
+
+    Parameters
+    ----------
+    values : array-like
+        DOIs to normalize. Missing values are allowed.
+
+    Returns
+    -------
+    pandas.Series
+        Series with the normalized DOIs. Missing and empty values become None.
+    """
+    s = pd.Series(values, dtype=object).str.strip().replace("", None)
+    return s.str.lower().str.replace(r"^https?://(www\.)?doi\.org/", "", regex=True)
+
+
+def hash_text(*columns):
+    """Hash rows of normalized texts to 64-bit keys.
+
+    Parameters
+    ----------
+    *columns : array-like
+        Columns with normalized texts, see `normalize_text`. The texts should
+        not contain the character ``|``, which is used to join the columns.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of type uint64 with a key for every row.
+    """
+    first, *others = [pd.Series(column, dtype=object) for column in columns]
+    joined = first.str.cat(others, sep="|") if others else first
+    return pd.util.hash_array(joined.to_numpy(dtype=object))
+
+
+def _record_keys(titles, abstracts):
+    return hash_text(
+        normalize_text(titles),
+        normalize_text(
+            [_strip_copyright(text) for text in _as_object_array(abstracts)]
+        ),
+    )
+
+
+def record_keys(titles, abstracts, n_jobs=1):
+    """Compute the keys used to identify duplicate records.
+
+    Vectorized version of `DEFAULT_EXTRACTORS`: two records get the same key
+    if their titles and abstracts are equal after normalization with
+    `_clean_text` and, for the abstract, `_strip_copyright`.
+
+    Parameters
+    ----------
+    titles : array-like
+        Titles of the records.
+    abstracts : array-like
+        Abstracts of the records.
+    n_jobs : int, optional
+        Number of processes used to compute the keys. Default is 1, which
+        computes the keys in the current process. Only worthwhile for very
+        large datasets.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of type uint64 with a key for every record.
+    """
+    titles = _as_object_array(titles)
+    abstracts = _as_object_array(abstracts)
+
+    if n_jobs is None or n_jobs == 1 or len(titles) < n_jobs:
+        return _record_keys(titles, abstracts)
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        keys = executor.map(
+            _record_keys,
+            np.array_split(titles, n_jobs),
+            np.array_split(abstracts, n_jobs),
+        )
+        return np.concatenate(list(keys))
+
+
+# Key of a record without title and abstract.
+EMPTY_RECORD_KEY = record_keys([None], [None])[0]
+
+
+def duplicated(df, pid="doi", n_jobs=1):
     """Return boolean Series denoting duplicate rows.
 
     Identify duplicates based on titles and abstracts and if available,
     on a persistent identifier (PID) such as the Digital Object Identifier
-    (`DOI <https://www.doi.org/>`_).
+    (`DOI <https://www.doi.org/>`_). Titles and abstracts are compared in the
+    same way as for the groups of records, see `record_keys`.
 
     Parameters
     ----------
@@ -87,6 +240,9 @@ def duplicated(df, pid="doi"):
     pid: string
         Which persistent identifier to use for deduplication.
         Default is 'doi'.
+    n_jobs : int, optional
+        Number of processes used to compare titles and abstracts, see
+        `record_keys`. Default is 1.
 
     Returns
     -------
@@ -98,11 +254,10 @@ def duplicated(df, pid="doi"):
         if pd.api.types.is_string_dtype(df[pid]) or pd.api.types.is_object_dtype(
             df[pid]
         ):
-            s_pid = df[pid].str.strip().replace("", None)
             if pid == "doi":
-                s_pid = s_pid.str.lower().str.replace(
-                    r"^https?://(www\.)?doi\.org/", "", regex=True
-                )
+                s_pid = normalize_doi(df[pid])
+            else:
+                s_pid = df[pid].str.strip().replace("", None)
         else:
             s_pid = df[pid]
 
@@ -111,8 +266,6 @@ def duplicated(df, pid="doi"):
     else:
         s_dups_pid = None
 
-    # get the texts, clean them and replace empty strings with None
-
     try:
         titles = df["title"]
     except KeyError:
@@ -122,20 +275,14 @@ def duplicated(df, pid="doi"):
     except KeyError:
         return df["title"]
 
-    s_title = pd.Series(titles).fillna("")
-    s_abstract = pd.Series(abstracts).fillna("")
-
-    s = (
-        (s_title + " " + s_abstract)
-        .str.strip()
-        .str.replace("[^A-Za-z0-9]", "", regex=True)
-        .str.lower()
-        .str.strip()
-        .replace("", None)
+    keys = pd.Series(
+        record_keys(titles, abstracts, n_jobs=n_jobs),
+        index=getattr(titles, "index", None),
     )
 
-    # save boolean series for duplicates based on titles/abstracts
-    s_dups_text = (s.duplicated()) & (s.notnull())
+    # save boolean series for duplicates based on titles/abstracts, records
+    # without text are never duplicates
+    s_dups_text = keys.duplicated() & (keys != EMPTY_RECORD_KEY)
 
     # final boolean series for all duplicates
     if s_dups_pid is not None:
@@ -193,24 +340,114 @@ def convert_value_to_int(value):
         )
 
 
+INCLUDED_LABEL_MAPPING = {
+    "": None,
+    pd.NA: None,
+    np.nan: None,
+    "0": 0,
+    "1": 1,
+    "yes": 1,
+    "no": 0,
+    "y": 1,
+    "n": 0,
+}
+
+
 def standardize_included_label(value):
-    replacement_dict = {
-        "": None,
-        pd.NA: None,
-        np.nan: None,
-        "0": 0,
-        "1": 1,
-        "yes": 1,
-        "no": 0,
-        "y": 1,
-        "n": 0,
-    }
-    if value in replacement_dict:
-        return replacement_dict[value]
+    if value in INCLUDED_LABEL_MAPPING:
+        return INCLUDED_LABEL_MAPPING[value]
     else:
         return value
 
 
+def convert_series_to_list(s):
+    """Convert the values of a series to lists.
+
+    Vectorized version of :func:`convert_value_to_list`.
+
+    Parameters
+    ----------
+    s : pd.Series
+        Series to convert.
+
+    Returns
+    -------
+    pd.Series
+        Series with a list for every value.
+    """
+    inferred_type = pd.api.types.infer_dtype(s, skipna=True)
+    if inferred_type == "empty":
+        values = [[] for _ in range(len(s))]
+    elif inferred_type == "string":
+        values = [
+            value if isinstance(value, list) else []
+            for value in s.str.split(LIST_JOIN_CHAR)
+        ]
+    else:
+        return s.apply(convert_value_to_list)
+    return pd.Series(values, index=s.index, dtype=object)
+
+
+def convert_series_to_int(s):
+    """Convert the values of a series to integers.
+
+    Vectorized version of :func:`convert_value_to_int`. Missing values become
+    None.
+
+    Parameters
+    ----------
+    s : pd.Series
+        Series to convert.
+
+    Returns
+    -------
+    pd.Series
+        Series with an integer or None for every value.
+    """
+    inferred_type = pd.api.types.infer_dtype(s, skipna=True)
+    if inferred_type not in ("empty", "integer", "floating", "mixed-integer-float"):
+        return s.apply(convert_value_to_int)
+
+    is_null = s.isna()
+    values = pd.to_numeric(s[~is_null])
+    if not (np.isfinite(values) & (values % 1 == 0)).all():
+        # raises the error of the first invalid value
+        return s.apply(convert_value_to_int)
+
+    result = pd.Series([None] * len(s), index=s.index, dtype=object)
+    result[~is_null] = values.astype("int64").astype(object)
+    return result
+
+
+def standardize_included_labels(s):
+    """Standardize the values of a series with labels.
+
+    Vectorized version of :func:`standardize_included_label`.
+
+    Parameters
+    ----------
+    s : pd.Series
+        Series with labels.
+
+    Returns
+    -------
+    pd.Series
+        Series with standardized labels.
+    """
+    is_null = s.isna()
+    if pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s):
+        s = s.replace(
+            {
+                key: value
+                for key, value in INCLUDED_LABEL_MAPPING.items()
+                if isinstance(key, str)
+            }
+        )
+    if is_null.any():
+        s = s.astype(object).where(~is_null, None)
+    return s
+
+
 def identify_groups(s):
     """
     Identify groups of duplicate values.
@@ -239,7 +476,52 @@ def identify_groups(s):
     return groups
 
 
-def identify_record_groups(records, feature_extractors=DEFAULT_EXTRACTORS):
+def identify_key_groups(keys, record_ids, first_seen=None):
+    """Identify groups of records with the same key.
+
+    Parameters
+    ----------
+    keys : array-like
+        Key of every record, for example computed with `record_keys`.
+    record_ids : array-like
+        Record id of every record.
+    first_seen : dict, optional
+        Mapping from keys to the record_id of the first record with that key.
+        It is updated in place, so that groups can be identified over several
+        chunks of records. By default None, which starts with an empty mapping.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        A list of tuples `(group_id, record_id)`, where two records get the same value
+        for `group_id` if they have the same key.
+    """
+    if first_seen is None:
+        first_seen = {}
+
+    record_ids = np.asarray(record_ids)
+    codes, uniques = pd.factorize(np.asarray(keys))
+    if len(uniques) == 0:
+        return []
+
+    # record_id of the first record with each key within this chunk
+    first_positions = np.full(len(uniques), len(codes))
+    np.minimum.at(first_positions, codes, np.arange(len(codes)))
+    group_ids = np.array(
+        [
+            first_seen.setdefault(key, record_id)
+            for key, record_id in zip(
+                uniques.tolist(), record_ids[first_positions].tolist(), strict=True
+            )
+        ]
+    )
+
+    return list(zip(group_ids[codes].tolist(), record_ids.tolist(), strict=True))
+
+
+def identify_record_groups(
+    records, feature_extractors=DEFAULT_EXTRACTORS, first_seen=None, n_jobs=1
+):
     """Identify groups of duplicate records.
 
     Parameters
@@ -247,7 +529,17 @@ def identify_record_groups(records, feature_extractors=DEFAULT_EXTRACTORS):
     records : Iterable[Record]
         Records in which to identify groups.
     feature_extractors : Sequence[Callable[[Record], Hashable], optional
-        List of functions that extract a feature from a record.
+        List of functions that extract a feature from a record. With the default
+        extractors, the features are computed for all records at once, see
+        `record_keys`.
+    first_seen : dict, optional
+        Mapping from features to the record_id of the first record with those
+        features. It is updated in place, so that groups can be identified over
+        several chunks of records. By default None, which starts with an empty
+        mapping.
+    n_jobs : int, optional
+        Number of processes used to compute the features with the default
+        extractors, see `record_keys`. Default is 1.
 
     Returns
     -------
@@ -255,16 +547,30 @@ def identify_record_groups(records, feature_extractors=DEFAULT_EXTRACTORS):
         A list of tuples `(group_id, record_id)`, where two records get the same value
         for `group_id` if they have identical features.
     """
-    groups = identify_groups(
-        map(
-            lambda record: tuple(
-                feature_extractor(record) for feature_extractor in feature_extractors
-            ),
-            records,
+    if first_seen is None:
+        first_seen = {}
+
+    if feature_extractors is DEFAULT_EXTRACTORS:
+        records = list(records)
+        keys = record_keys(
+            [record.title for record in records],
+            [record.abstract for record in records],
+            n_jobs=n_jobs,
         )
-    )
-    index_to_id = [record.record_id for record in records]
+        return identify_key_groups(
+            keys, [record.record_id for record in records], first_seen
+        )
+
     return [
-        (index_to_id[group_id], index_to_id[record_id])
-        for (group_id, record_id) in groups
+        (
+            first_seen.setdefault(
+                tuple(
+                    feature_extractor(record)
+                    for feature_extractor in feature_extractors
+                ),
+                record.record_id,
+            ),
+            record.record_id,
+        )
+        for record in records
     ]
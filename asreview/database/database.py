@@ -3,15 +3,18 @@ import sqlite3
 import time
 from functools import cached_property
 
+import numpy as np
 import pandas as pd
 
 from asreview.data.record import Record
 from asreview.database.store import DataStore
 from asreview.database.store import _build_conn_uri
+from asreview.database.store import _connect
+from asreview.database.word_counts import WordCounts
 
 __all__ = ["Database"]
 
-CURRENT_DATABASE_VERSION = 3
+CURRENT_DATABASE_VERSION = 4
 
 MODEL_COLUMNS = [
     "classifier",
@@ -21,6 +24,39 @@ MODEL_COLUMNS = [
     "training_set",
 ]
 
+# SQLite pragmas set on every connection to the database. In write-ahead log (WAL)
+# mode readers don't block the writer and the writer doesn't block readers. With
+# synchronous=NORMAL a commit doesn't wait for the disk, which is safe in WAL mode:
+# a power loss can undo the last commits, but doesn't corrupt the database. The
+# journal mode is stored in the database file, so existing databases switch to WAL
+# mode the first time they are opened for writing.
+DEFAULT_PRAGMAS = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "cache_size": -16000,  # 16 MB
+    "mmap_size": 268435456,  # 256 MB
+}
+
+LAST_RANKING_MODEL_COLUMNS = MODEL_COLUMNS + ["time"]
+
+# Indexes on the results table, by index name.
+RESULTS_INDEXES = {
+    "idx_results_label": (
+        "CREATE INDEX IF NOT EXISTS idx_results_label ON results (label)"
+    ),
+}
+
+# Columns of the records to export, see `Database.iter_export_results`.
+EXPORT_RESULTS_COLUMNS = [
+    "record_id",
+    "group_id",
+    "label",
+    "time",
+    "note",
+    "tags",
+    "user_id",
+]
+
 REQUIRED_TABLES = [
     "results",
     "last_ranking",
@@ -53,7 +89,7 @@ RANKING_TABLE_COLUMNS_PANDAS_DTYPES = {
 }
 
 
-def open_db(fp, read_only=False):
+def open_db(fp, read_only=False, pragmas=None):
     """Open a database.
 
     Parameters
@@ -63,6 +99,8 @@ def open_db(fp, read_only=False):
     read_only : bool, optional
         Whether to create a new database if one doesn't exist yet and whether the opened
         database will be in read only mode or not.
+    pragmas : dict | None, optional
+        SQLite pragmas to set on the connections, see `Database`.
 
     Returns
     -------
@@ -83,7 +121,7 @@ def open_db(fp, read_only=False):
             )
         fp.parent.mkdir(parents=True, exist_ok=True)
 
-    db = Database(fp, read_only=read_only)
+    db = Database(fp, read_only=read_only, pragmas=pragmas)
     try:
         db._is_valid()
     except ValueError as e:
@@ -109,7 +147,14 @@ class Database:
         Return the version number of the database.
     """
 
-    def __init__(self, fp=":memory:", record_cls=Record, read_only=False):
+    def __init__(
+        self,
+        fp=":memory:",
+        record_cls=Record,
+        read_only=False,
+        pooled=False,
+        pragmas=None,
+    ):
         """Initialize the Database.
 
         Parameters
@@ -122,6 +167,14 @@ class Database:
             Whether to open the database in read only mode. If the database is opened in
             read only mode and an attempt to write to the database is made, an
             `sqlite3.OperationalError` will be raised.
+        pooled : bool, optional
+            Whether the input data store reuses its connections, see `DataStore`.
+            The connections of the data store stay open when leaving a `with`
+            block and are closed when the database is closed.
+        pragmas : dict | None, optional
+            Mapping {pragma name: value} of SQLite pragmas to set on every connection
+            to the database. If None, uses `DEFAULT_PRAGMAS`. The journal mode can't
+            be changed in read only mode and is ignored.
         """
         if fp == ":memory:" and read_only:
             raise ValueError("Can't open an in-memory database in read only mode")
@@ -130,12 +183,20 @@ class Database:
         self.record_cls = record_cls
         self.read_only = read_only
         self._in_memory = fp == ":memory:"
-        self._closed = False
         self._conn_uri = _build_conn_uri(fp, read_only)
 
+        self.pragmas = dict(DEFAULT_PRAGMAS if pragmas is None else pragmas)
+        if read_only:
+            self.pragmas.pop("journal_mode", None)
+
         self.input = DataStore(
-            conn_uri=self._conn_uri, record_cls=record_cls, read_only=read_only
+            conn_uri=self._conn_uri,
+            record_cls=record_cls,
+            read_only=read_only,
+            pooled=pooled,
+            pragmas=self.pragmas,
         )
+        self.word_counts = WordCounts(self)
 
         if self._in_memory:
             # Eagerly open the sqlite3 connection. For named in-memory databases,
@@ -148,7 +209,12 @@ class Database:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+        if self.input.pooled:
+            # Keep the pooled connections of the data store for the next use.
+            # They are released by `close`.
+            self._close_conn()
+        else:
+            self.close()
 
     def __del__(self):
         self.close()
@@ -162,22 +228,42 @@ class Database:
         sqlite3.Connection
             Connection to the SQLite database.
         """
-        return sqlite3.connect(self._conn_uri, uri=True)
+        return _connect(self._conn_uri, self.pragmas)
 
     def close(self):
         """Close the database and release all resources.
 
         For in-memory databases this will destroy the database. Safe to call multiple
-        times.
+        times. If the database is used again after closing it, new connections are
+        opened, which are released by the next call to `close`.
         """
-        if self._closed:
-            return
-        self._closed = True
-        self.input.engine.dispose()
+        self.input.close()
+        self._close_conn()
+
+    def _close_conn(self):
         if "_conn" in self.__dict__:
             self._conn.close()
             del self.__dict__["_conn"]
 
+    def backup(self, fp):
+        """Write a copy of the database to a file.
+
+        The copy is made with the SQLite backup API. It contains all committed
+        changes, including those in the write-ahead log, even if other
+        connections are using the database. Use this instead of copying the
+        database file.
+
+        Parameters
+        ----------
+        fp : str | Path
+            Path of the copy. An existing database at this path is overwritten.
+        """
+        target = sqlite3.connect(fp)
+        try:
+            self._conn.backup(target)
+        finally:
+            target.close()
+
     @property
     def user_version(self):
         """Version number of the state."""
@@ -213,18 +299,12 @@ class Database:
                             tags JSON,
                             user_id INTEGER)"""
         )
+        for statement in RESULTS_INDEXES.values():
+            cur.execute(statement)
+        self._create_label_counts_table(cur)
+        self._create_label_sequence_version_table(cur)
 
-        cur.execute(
-            """CREATE TABLE last_ranking
-                            (record_id INTEGER UNIQUE,
-                            ranking INT,
-                            classifier TEXT,
-                            querier TEXT,
-                            balancer TEXT,
-                            feature_extractor TEXT,
-                            training_set INTEGER,
-                            time FLOAT)"""
-        )
+        self._create_last_ranking_tables(cur)
 
         cur.execute(
             """CREATE TABLE decision_changes
@@ -238,8 +318,190 @@ class Database:
 
         self._set_results_changes_triggers()
 
-    def _is_valid(self):
-        if self.user_version != CURRENT_DATABASE_VERSION:
+    def _create_label_counts_table(self, cur):
+        # The number of labeled records per label, split by whether they are prior
+        # knowledge. Like the other statistics of the results, only the base record
+        # of each group is counted. The triggers keep the counts up to date on every
+        # change of the results table.
+        cur.execute(
+            """CREATE TABLE results_label_counts
+                            (label INTEGER NOT NULL,
+                            prior INTEGER NOT NULL,
+                            n INTEGER NOT NULL,
+                            PRIMARY KEY (label, prior))"""
+        )
+        cur.execute(
+            f"""INSERT INTO results_label_counts (label, prior, n)
+            {self._label_counts_query}"""
+        )
+
+        is_new_root = self._group_root_sql("NEW.record_id")
+        is_old_root = self._group_root_sql("OLD.record_id")
+        increment = f"""INSERT INTO results_label_counts (label, prior, n)
+                SELECT NEW.label, NEW.querier IS NULL, 1
+                WHERE NEW.label IS NOT NULL AND {is_new_root}
+                ON CONFLICT (label, prior) DO UPDATE SET n = n + 1;"""
+        decrement = f"""UPDATE results_label_counts SET n = n - 1
+                WHERE label = OLD.label AND prior = (OLD.querier IS NULL)
+                AND {is_old_root};"""
+
+        cur.execute(f"""
+            CREATE TRIGGER trg_results_label_counts_insert
+            AFTER INSERT ON results
+            FOR EACH ROW
+            BEGIN
+                {increment}
+            END
+        """)
+        cur.execute(f"""
+            CREATE TRIGGER trg_results_label_counts_delete
+            AFTER DELETE ON results
+            FOR EACH ROW
+            BEGIN
+                {decrement}
+            END
+        """)
+        cur.execute(f"""
+            CREATE TRIGGER trg_results_label_counts_update
+            AFTER UPDATE OF record_id, label, querier ON results
+            FOR EACH ROW
+            BEGIN
+                {decrement}
+                {increment}
+            END
+        """)
+        self._create_label_counts_group_triggers(cur)
+
+    def _create_label_counts_group_triggers(self, cur):
+        # A change of the group of a record changes whether its old and new group id
+        # are the id of a base record. The result of that record, if any, is removed
+        # from or added to the counts.
+        record = self.record_table_name
+        old_group_id = "coalesce(OLD.duplicate_of, OLD.record_id)"
+        new_group_id = "coalesce(NEW.duplicate_of, NEW.record_id)"
+        decrement = f"""UPDATE results_label_counts SET n = n - 1
+                WHERE EXISTS (
+                    SELECT 1 FROM results
+                    WHERE results.record_id = {old_group_id}
+                    AND results.label = results_label_counts.label
+                    AND (results.querier IS NULL) = results_label_counts.prior
+                )
+                AND NOT {self._group_root_sql(old_group_id)};"""
+        increment = f"""INSERT INTO results_label_counts (label, prior, n)
+                SELECT label, querier IS NULL, 1 FROM results
+                WHERE record_id = {new_group_id} AND label IS NOT NULL
+                AND NOT EXISTS (
+                    SELECT 1 FROM {record}
+                    WHERE {record}.group_id = {new_group_id}
+                    AND {record}.record_id != NEW.record_id
+                )
+                ON CONFLICT (label, prior) DO UPDATE SET n = n + 1;"""
+
+        cur.execute(f"""
+            CREATE TRIGGER trg_{record}_label_counts_insert
+            AFTER INSERT ON {record}
+            FOR EACH ROW
+            BEGIN
+                {increment}
+            END
+        """)
+        cur.execute(f"""
+            CREATE TRIGGER trg_{record}_label_counts_delete
+            AFTER DELETE ON {record}
+            FOR EACH ROW
+            BEGIN
+                {decrement}
+            END
+        """)
+        cur.execute(f"""
+            CREATE TRIGGER trg_{record}_label_counts_update
+            AFTER UPDATE OF record_id, duplicate_of ON {record}
+            FOR EACH ROW
+            WHEN {old_group_id} IS NOT {new_group_id}
+            BEGIN
+                {decrement}
+                {increment}
+            END
+        """)
+
+    def _create_label_sequence_version_table(self, cur):
+        # The version of the label sequence, see `get_label_sequence`. The triggers
+        # increase the version on every change other than adding labels to the end
+        # of the sequence: a label that is changed or removed, a pending record that
+        # is labeled after a record that was queried later, or a change of the
+        # groups of labeled records.
+        cur.execute("CREATE TABLE label_sequence_version (version INTEGER NOT NULL)")
+        cur.execute("INSERT INTO label_sequence_version (version) VALUES (0)")
+
+        record = self.record_table_name
+        old_group_id = "coalesce(OLD.duplicate_of, OLD.record_id)"
+        new_group_id = "coalesce(NEW.duplicate_of, NEW.record_id)"
+        increment = "UPDATE label_sequence_version SET version = version + 1;"
+
+        def is_labeled_sql(record_ids):
+            return (
+                "EXISTS (SELECT 1 FROM results "
+                f"WHERE record_id IN ({record_ids}) AND label IS NOT NULL)"
+            )
+
+        for table, event, condition in [
+            ("results", "DELETE", "OLD.label IS NOT NULL"),
+            (
+                "results",
+                "UPDATE OF record_id, label, querier",
+                """(
+                    OLD.label IS NOT NULL AND (
+                        OLD.label IS NOT NEW.label
+                        OR OLD.record_id IS NOT NEW.record_id
+                        OR (OLD.querier IS NULL) != (NEW.querier IS NULL)
+                    )
+                ) OR (
+                    OLD.label IS NULL AND NEW.label IS NOT NULL AND EXISTS (
+                        SELECT 1 FROM results
+                        WHERE rowid > NEW.rowid AND label IS NOT NULL
+                    )
+                )""",
+            ),
+            (record, "INSERT", is_labeled_sql(new_group_id)),
+            (record, "DELETE", is_labeled_sql(old_group_id)),
+            (
+                record,
+                "UPDATE OF record_id, duplicate_of",
+                f"""{old_group_id} IS NOT {new_group_id}
+                AND {is_labeled_sql(f"{old_group_id}, {new_group_id}")}""",
+            ),
+        ]:
+            cur.execute(f"""
+                CREATE TRIGGER trg_{table}_label_sequence_{event.split()[0].lower()}
+                AFTER {event} ON {table}
+                FOR EACH ROW
+                WHEN {condition}
+                BEGIN
+                    {increment}
+                END
+            """)
+
+    def _create_last_ranking_tables(self, cur):
+        # The ranking is stored in the order of the primary key, so reading it in
+        # ranking order doesn't need an extra index. The model that made the ranking
+        # is stored once in last_ranking_model.
+        cur.execute(
+            """CREATE TABLE last_ranking
+                            (record_id INTEGER NOT NULL,
+                            ranking INTEGER PRIMARY KEY)"""
+        )
+        cur.execute(
+            """CREATE TABLE last_ranking_model
+                            (classifier TEXT,
+                            querier TEXT,
+                            balancer TEXT,
+                            feature_extractor TEXT,
+                            training_set INTEGER,
+                            time FLOAT)"""
+        )
+
+    def _is_valid(self, version=CURRENT_DATABASE_VERSION):
+        if self.user_version != version:
             raise ValueError(
                 f"Database version {self.user_version} is not supported. "
                 "See migration guide."
@@ -302,6 +564,27 @@ class Database:
     def record_table_name(self):
         return self.input.record_cls.__tablename__
 
+    def _group_root_sql(self, record_id):
+        # SQL condition that a record id is the id of the base record of its group.
+        # The index on group_id is searched.
+        return (
+            f"EXISTS (SELECT 1 FROM {self.record_table_name} "
+            f"WHERE {self.record_table_name}.group_id = {record_id})"
+        )
+
+    @property
+    def _is_group_root_sql(self):
+        # SQL condition that the record of a row in the results table is the base
+        # record of its group.
+        return self._group_root_sql("results.record_id")
+
+    @property
+    def _label_counts_query(self):
+        return f"""SELECT label, querier IS NULL AS prior, COUNT(*) AS n
+            FROM results
+            WHERE label IS NOT NULL AND {self._is_group_root_sql}
+            GROUP BY label, prior"""
+
     @property
     def exist_new_labeled_records(self):
         """Return True if there are new labeled records.
@@ -311,12 +594,26 @@ class Database:
         model was trained yet, but priors have been added.
         """
         labeled = self.get_results_table("label")
-        last_training_set = self.get_last_ranking_table()["training_set"]
+        last_training_set = self.get_last_training_set()
 
-        if last_training_set.empty or pd.isna(last_training_set.max()):
+        if last_training_set is None:
             return len(labeled) > 0
         else:
-            return len(labeled) > last_training_set.max()
+            return len(labeled) > last_training_set
+
+    def get_last_training_set(self):
+        """Get the size of the training set of the last ranking.
+
+        Returns
+        -------
+        int | None
+            Number of labeled records the model of the last ranking was trained
+            on. None if there is no last ranking or if it was not made by a
+            trained model.
+        """
+        return self._conn.execute(
+            "SELECT max(training_set) FROM last_ranking_model"
+        ).fetchone()[0]
 
     def _replace_results_from_df(self, results):
         if not set(results.columns) == set(RESULTS_TABLE_COLUMNS_PANDAS_DTYPES):
@@ -339,10 +636,48 @@ class Database:
                 f"{list(RANKING_TABLE_COLUMNS_PANDAS_DTYPES.keys())}."
             )
 
-        last_ranking.to_sql(
-            "last_ranking", self._conn, if_exists="replace", index=False
+        last_ranking = last_ranking.sort_values("ranking")
+        model = (
+            None
+            if last_ranking.empty
+            else last_ranking[LAST_RANKING_MODEL_COLUMNS].iloc[0].tolist()
+        )
+        self._replace_last_ranking(
+            last_ranking["record_id"].tolist(),
+            model,
+            rankings=last_ranking["ranking"].tolist(),
         )
 
+    def _replace_last_ranking(self, record_ids, model, rankings=None):
+        """Replace the last ranking and its model in a single transaction.
+
+        Readers see either the old or the new ranking. If rankings is None, the
+        ranking of a record is its position in record_ids.
+        """
+        model_string = ", ".join(LAST_RANKING_MODEL_COLUMNS)
+        with self._conn as con:
+            con.execute("DELETE FROM last_ranking")
+            con.execute("DELETE FROM last_ranking_model")
+            if model is not None:
+                con.execute(
+                    f"INSERT INTO last_ranking_model ({model_string}) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    model,
+                )
+            if rankings is None:
+                # Passing the ranking as a single JSON array is much faster than an
+                # insert per record.
+                con.execute(
+                    """INSERT INTO last_ranking (record_id, ranking)
+                    SELECT value, key FROM json_each(?)""",
+                    (json.dumps(record_ids),),
+                )
+            else:
+                con.executemany(
+                    "INSERT INTO last_ranking (record_id, ranking) VALUES (?, ?)",
+                    zip(record_ids, rankings, strict=True),
+                )
+
     def add_last_ranking(
         self,
         ranked_record_ids,
@@ -372,19 +707,17 @@ class Database:
         training_set: int
             Number of labeled records available at the time of training.
         """
-
-        pd.DataFrame(
-            {
-                "record_id": ranked_record_ids,
-                "ranking": range(len(ranked_record_ids)),
-                "classifier": classifier,
-                "querier": querier,
-                "balancer": balancer,
-                "feature_extractor": feature_extractor,
-                "training_set": training_set,
-                "time": time.time(),
-            }
-        ).to_sql("last_ranking", self._conn, if_exists="replace", index=False)
+        self._replace_last_ranking(
+            np.asarray(ranked_record_ids, dtype=np.int64).tolist(),
+            [
+                classifier,
+                querier,
+                balancer,
+                feature_extractor,
+                None if training_set is None else int(training_set),
+                time.time(),
+            ],
+        )
 
     def get_last_ranking_table(self):
         """Get the ranking from the state.
@@ -397,8 +730,14 @@ class Database:
             'training_set' and 'time'. It has one row for each record in the
             dataset, and is ordered by ranking.
         """
+        model_string = ", ".join(
+            f"last_ranking_model.{col}" for col in LAST_RANKING_MODEL_COLUMNS
+        )
         return pd.read_sql_query(
-            "SELECT * FROM last_ranking",
+            f"""SELECT record_id, ranking, {model_string}
+            FROM last_ranking
+            CROSS JOIN last_ranking_model
+            ORDER BY ranking""",
             self._conn,
             dtype=RANKING_TABLE_COLUMNS_PANDAS_DTYPES,
         )
@@ -456,8 +795,9 @@ class Database:
         cur.execute(
             f"""INSERT INTO results (record_id, user_id, {model_string})
             WITH top_record AS (
-                SELECT last_ranking.*
+                SELECT last_ranking.record_id, last_ranking_model.*
                 FROM last_ranking
+                CROSS JOIN last_ranking_model
                 LEFT JOIN results USING (record_id)
                 WHERE results.record_id IS NULL
                 ORDER BY ranking
@@ -636,9 +976,7 @@ class Database:
             if not pending:
                 sql_where.append("label is not NULL")
             if not grouped:
-                sql_where.append(
-                    f"record_id IN ( SELECT group_id FROM {self.record_table_name})"
-                )
+                sql_where.append(self._is_group_root_sql)
             sql_where_str = "WHERE " + " AND ".join(sql_where)
         else:
             sql_where_str = ""
@@ -663,6 +1001,170 @@ class Database:
             df_results["tags"] = df_results["tags"].map(json.loads, na_action="ignore")
         return df_results
 
+    def _labeled_where(self, subset="all", has_note=False, is_prior=False):
+        sql_where = ["label IS NOT NULL", self._is_group_root_sql]
+        if subset == "relevant":
+            sql_where.append("label = 1")
+        elif subset == "irrelevant":
+            sql_where.append("label = 0")
+        if has_note:
+            sql_where.append("note IS NOT NULL")
+        if is_prior:
+            sql_where.append("querier IS NULL")
+        return " AND ".join(sql_where)
+
+    def get_labeled(
+        self,
+        subset="all",
+        has_note=False,
+        is_prior=False,
+        latest_first=False,
+        limit=None,
+        offset=0,
+    ):
+        """Get a page of the labeled records.
+
+        The records are filtered, sorted and paginated in the database, so only the
+        requested rows are read. If multiple records are in the same group, only the
+        base record of the group is returned.
+
+        Parameters
+        ----------
+        subset: str
+            Which labeled records to get: 'relevant', 'irrelevant' or 'all'.
+        has_note: bool
+            Only get the records with a note.
+        is_prior: bool
+            Only get the records of the prior knowledge.
+        latest_first: bool
+            Return the last labeled record first. By default returns the records in
+            the order they were added to the results.
+        limit: int
+            Maximum number of records to return. If None, returns all records.
+        offset: int
+            Number of records to skip.
+
+        Returns
+        -------
+        pd.DataFrame:
+            Dataframe with the results of the labeled records.
+        """
+        df_results = pd.read_sql_query(
+            f"""SELECT * FROM results
+            WHERE {self._labeled_where(subset, has_note, is_prior)}
+            ORDER BY rowid {"DESC" if latest_first else "ASC"}
+            LIMIT ? OFFSET ?""",
+            self._conn,
+            params=(-1 if limit is None else limit, offset),
+            dtype=RESULTS_TABLE_COLUMNS_PANDAS_DTYPES,
+        )
+        df_results["tags"] = df_results["tags"].map(json.loads, na_action="ignore")
+        return df_results
+
+    def count_labeled(self, subset="all", has_note=False, is_prior=False):
+        """Count the labeled records.
+
+        Parameters
+        ----------
+        subset: str
+            Which labeled records to count: 'relevant', 'irrelevant' or 'all'.
+        has_note: bool
+            Only count the records with a note.
+        is_prior: bool
+            Only count the records of the prior knowledge.
+
+        Returns
+        -------
+        int:
+            The number of labeled records, counting only the base record of each
+            group.
+        """
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM results "
+            f"WHERE {self._labeled_where(subset, has_note, is_prior)}"
+        ).fetchone()[0]
+
+    def get_label_counts(self, priors=True):
+        """Count the labeled records per label.
+
+        The counts are read from the label counts table, which is kept up to date by
+        triggers on the results table. If the table doesn't exist, for example in a
+        read only database created by an earlier version, the counts are computed
+        from the results table.
+
+        Parameters
+        ----------
+        priors: bool
+            Whether to count the records of the prior knowledge.
+
+        Returns
+        -------
+        dict:
+            The number of labeled records per label, with at least the labels 0
+            and 1. Only the base record of each group is counted.
+        """
+        has_table = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' "
+            "AND name='results_label_counts'"
+        ).fetchone()
+        query = (
+            "SELECT label, prior, n FROM results_label_counts"
+            if has_table
+            else self._label_counts_query
+        )
+
+        counts = {0: 0, 1: 0}
+        for label, prior, n in self._conn.execute(query):
+            if priors or not prior:
+                counts[label] = counts.get(label, 0) + n
+        return counts
+
+    @property
+    def label_sequence_version(self):
+        """Version of the label sequence, see `get_label_sequence`.
+
+        The version changes when labels are changed, removed or inserted before the
+        end of the sequence. Adding labels to the end doesn't change the version.
+        """
+        return self._conn.execute(
+            "SELECT version FROM label_sequence_version"
+        ).fetchone()[0]
+
+    def get_label_sequence(self, priors=True, after=0):
+        """Get the labels in the order the records were labeled.
+
+        Parameters
+        ----------
+        priors: bool
+            Whether to include the labels of the prior knowledge.
+        after: int
+            Cursor returned by an earlier call. Only the labels added to the sequence
+            since that call are returned. The labels of the earlier call are only
+            still valid if `label_sequence_version` didn't change in the meantime.
+            Read the version before the labels, so changes in between show up as a
+            new version.
+
+        Returns
+        -------
+        list[int], int:
+            The labels, counting only the base record of each group, and the cursor
+            to get the labels added after this call.
+        """
+        sql_where = ["label IS NOT NULL", "rowid > ?", self._is_group_root_sql]
+        if not priors:
+            sql_where.append("querier IS NOT NULL")
+
+        rows = self._conn.execute(
+            f"""SELECT rowid, label FROM results
+            WHERE {" AND ".join(sql_where)}
+            ORDER BY rowid""",
+            (after,),
+        ).fetchall()
+
+        if not rows:
+            return [], after
+        return [label for _, label in rows], rows[-1][0]
+
     def get_priors(self):
         """Get the record ids of the priors.
 
@@ -678,9 +1180,7 @@ class Database:
             SELECT * FROM results
             WHERE results.querier is NULL
             AND results.label is not NULL
-            AND record_id IN (
-                SELECT group_id FROM {self.record_table_name}
-            )
+            AND {self._is_group_root_sql}
             ORDER BY rowid
             """,
             self._conn,
@@ -727,6 +1227,75 @@ class Database:
             self._conn,
         )["record_id"]
 
+    def iter_export_results(self, collections, grouped=True, chunk_size=1000):
+        """Iterate over the records to export and their results, in export order.
+
+        The relevant records come first, in the order they were labeled, then the
+        unlabeled records in ranking order and then the irrelevant records in the
+        order they were labeled.
+
+        Parameters
+        ----------
+        collections: list[str]
+            Which records to export: 'relevant', 'not_seen' and/or 'irrelevant'.
+        grouped: bool
+            Export all records of a group, right after each other. By default
+            only the base record of each group is exported.
+        chunk_size: int
+            Maximum number of records in a chunk.
+
+        Yields
+        ------
+        pd.DataFrame:
+            Dataframe with the columns 'record_id' and 'group_id' of the exported
+            records and the columns 'label', 'time', 'note', 'tags' and 'user_id' of
+            the result of the base record of their group, if it is labeled. At least
+            one dataframe is yielded, even if there are no records to export.
+        """
+        queries = {
+            "relevant": f"""SELECT record_id, 0, rowid
+                FROM results WHERE label = 1 AND {self._is_group_root_sql}""",
+            "not_seen": f"""SELECT last_ranking.record_id, 1, ranking
+                FROM last_ranking
+                LEFT JOIN results USING (record_id)
+                WHERE (results.record_id IS NULL OR results.label IS NULL)
+                AND {self._group_root_sql("last_ranking.record_id")}""",
+            "irrelevant": f"""SELECT record_id, 2, rowid
+                FROM results WHERE label = 0 AND {self._is_group_root_sql}""",
+        }
+        export_groups = " UNION ALL ".join(
+            query for collection, query in queries.items() if collection in collections
+        )
+        if not export_groups:
+            export_groups = "SELECT NULL, NULL, NULL LIMIT 0"
+
+        record_table = self.record_table_name
+        join_column = "group_id" if grouped else "record_id"
+        chunks = pd.read_sql_query(
+            f"""WITH export_groups (group_root, collection, position) AS (
+                {export_groups}
+            )
+            SELECT {record_table}.record_id, {record_table}.group_id,
+                {", ".join(f"results.{col}" for col in EXPORT_RESULTS_COLUMNS[2:])}
+            FROM export_groups
+            JOIN {record_table}
+                ON {record_table}.{join_column} = export_groups.group_root
+            LEFT JOIN results
+                ON results.record_id = export_groups.group_root
+                AND results.label IS NOT NULL
+            ORDER BY export_groups.collection, export_groups.position,
+                {record_table}.record_id""",
+            self._conn,
+            dtype={
+                col: RESULTS_TABLE_COLUMNS_PANDAS_DTYPES.get(col, "Int64")
+                for col in EXPORT_RESULTS_COLUMNS
+            },
+            chunksize=chunk_size,
+        )
+        for chunk in chunks:
+            chunk["tags"] = chunk["tags"].map(json.loads, na_action="ignore")
+            yield chunk
+
     def get_pending(self, user_id=None):
         """Get pending records from the results table.
 
@@ -740,9 +1309,9 @@ class Database:
         pd.DataFrame
             DataFrame with pending results records.
         """
-        query = f"""SELECT * FROM results WHERE label is null AND record_id IN (
-            SELECT group_id FROM {self.record_table_name}
-        )"""
+        query = (
+            f"SELECT * FROM results WHERE label is null AND {self._is_group_root_sql}"
+        )
         params = None
         if user_id is not None:
             query += " AND user_id=?"
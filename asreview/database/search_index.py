@@ -0,0 +1,350 @@
+import functools
+import json
+import re
+import sqlite3
+from collections import Counter
+from collections import defaultdict
+from difflib import SequenceMatcher
+from math import ceil
+from math import floor
+
+from sqlalchemy.types import JSON
+
+from asreview.data.search import fuzzy_find
+
+__all__ = ["SearchIndex"]
+
+# Columns of the record table that are searched.
+SEARCH_COLUMNS = ["title", "authors", "keywords"]
+
+# Minimal `SequenceMatcher.quick_ratio` between a keyword and a term of the index.
+FUZZY_THRESHOLD = 0.9
+
+# Keywords shorter than this are compared with all terms of similar length. A
+# transposition or an extra character can change all trigrams of a short keyword,
+# like "teh" and "the", so the trigram index would miss these terms.
+SCAN_KEY_LENGTH = 10
+
+_TOKEN_RE = re.compile(r"['\w]+")
+
+
+def tokenize(text):
+    """Split a text into terms in the same way as the full-text search index.
+
+    Terms are lowercased sequences of word characters and apostrophes, like in
+    `asreview.data.search.fuzzy_find`.
+
+    Parameters
+    ----------
+    text : str
+        Text to split.
+
+    Returns
+    -------
+    list[str]
+        The terms of the text.
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+@functools.cache
+def fts5_trigram_available():
+    """Check whether SQLite supports the full-text search index.
+
+    The index needs the FTS5 extension and its trigram tokenizer, which is
+    available from SQLite 3.34.
+
+    Returns
+    -------
+    bool
+        True if the index can be created.
+    """
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE probe USING fts5(term, tokenize='trigram')")
+        conn.execute("CREATE VIRTUAL TABLE probe_vocab USING fts5vocab(probe, 'row')")
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+    return True
+
+
+class SearchIndex:
+    """Full-text search index of the records in a data store.
+
+    The index consists of an SQLite FTS5 table with the searched columns of the
+    records and a second FTS5 table with the vocabulary of the first one, indexed
+    by trigrams. Records are added to the index in bulk when they are added to the
+    data store. Triggers on the record table keep the index up to date when
+    records are changed or deleted.
+
+    To find a keyword, the trigram index gives the terms of similar length that
+    share a trigram with the keyword. Short keywords are compared with all terms
+    of similar length instead. The terms that are close enough to the keyword are
+    looked up in the full-text index. This way, the cost of a search
+    depends on the number of matching terms and records, not on the size of the
+    dataset.
+
+    If SQLite doesn't support FTS5 with the trigram tokenizer, no index is
+    created and the search falls back to `asreview.data.search.fuzzy_find`.
+
+    Parameters
+    ----------
+    store : asreview.database.store.DataStore
+        Data store with the records to index.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.record_table = store.record_cls.__tablename__
+        self.fts_table = f"{self.record_table}_search"
+        self.vocab_table = f"{self.record_table}_search_vocab"
+        self.term_table = f"{self.record_table}_search_term"
+        self.columns = [col for col in SEARCH_COLUMNS if col in store.columns]
+
+    def exists(self, conn):
+        """Check whether the index exists.
+
+        Parameters
+        ----------
+        conn : sqlalchemy.Connection
+            Connection to the database.
+
+        Returns
+        -------
+        bool
+            True if the index exists.
+        """
+        return (
+            conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+                (self.term_table,),
+            ).first()
+            is not None
+        )
+
+    def create(self, conn):
+        """Create the index and add the records in the data store to it.
+
+        Parameters
+        ----------
+        conn : sqlalchemy.Connection
+            Connection to the database.
+        """
+        if "title" not in self.columns or not fts5_trigram_available():
+            return
+
+        columns = ", ".join(self.columns)
+        delete = (
+            f"INSERT INTO {self.fts_table}({self.fts_table}, rowid, {columns}) "
+            f"VALUES ('delete', old.record_id, {self._values('old.')});"
+        )
+        insert = (
+            f"INSERT INTO {self.fts_table}(rowid, {columns}) "
+            f"VALUES (new.record_id, {self._values('new.')});"
+        )
+        # Keep the terms in sync with the vocabulary of the records. Records are
+        # rarely changed or deleted, so the vocabulary is compared as a whole.
+        remove_terms = (
+            f"DELETE FROM {self.term_table} "
+            f"WHERE term NOT IN (SELECT term FROM {self.vocab_table});"
+        )
+        add_terms = (
+            f"INSERT INTO {self.term_table} (term, length) "
+            f"SELECT term, length(term) FROM {self.vocab_table} "
+            f"WHERE term NOT IN (SELECT term FROM {self.term_table});"
+        )
+
+        for statement in [
+            # The index is contentless, because the indexed values of the list
+            # columns differ from the JSON stored in the record table.
+            f"""CREATE VIRTUAL TABLE IF NOT EXISTS {self.fts_table} USING fts5(
+                {columns},
+                content='',
+                tokenize="unicode61 remove_diacritics 0 tokenchars '''_'"
+            )""",
+            f"""CREATE VIRTUAL TABLE IF NOT EXISTS {self.vocab_table}
+                USING fts5vocab({self.fts_table}, 'row')""",
+            f"""CREATE VIRTUAL TABLE IF NOT EXISTS {self.term_table}
+                USING fts5(term, length UNINDEXED, tokenize='trigram')""",
+            f"""CREATE TRIGGER IF NOT EXISTS trg_{self.fts_table}_delete
+                AFTER DELETE ON {self.record_table}
+                BEGIN {delete} {remove_terms} END""",
+            f"""CREATE TRIGGER IF NOT EXISTS trg_{self.fts_table}_update
+                AFTER UPDATE OF {columns} ON {self.record_table}
+                BEGIN {delete} {insert} {remove_terms} {add_terms} END""",
+            f"INSERT INTO {self.fts_table}({self.fts_table}) VALUES ('delete-all')",
+            f"INSERT INTO {self.fts_table}(rowid, {columns}) "
+            f"SELECT record_id, {self._values()} FROM {self.record_table}",
+        ]:
+            conn.exec_driver_sql(statement)
+
+        self._update_terms(conn)
+
+    def _values(self, prefix=""):
+        """SQL expressions for the indexed values of the columns of a record."""
+        values = []
+        for col in self.columns:
+            if isinstance(self.store.record_cls.__table__.columns[col].type, JSON):
+                # index the items of a list, instead of its JSON representation
+                values.append(
+                    f"(SELECT group_concat(value, ' ') FROM json_each({prefix}{col}))"
+                )
+            else:
+                values.append(f"{prefix}{col}")
+        return ", ".join(values)
+
+    def add(self, conn, record_ids):
+        """Add new records to the index.
+
+        Parameters
+        ----------
+        conn : sqlalchemy.Connection
+            Connection to the database.
+        record_ids : list[int]
+            Record ids of the records to add.
+        """
+        if len(record_ids) == 0:
+            return
+
+        conn.exec_driver_sql(
+            f"INSERT INTO {self.fts_table}(rowid, {', '.join(self.columns)}) "
+            f"SELECT record_id, {self._values()} FROM {self.record_table} "
+            "WHERE record_id IN (SELECT value FROM json_each(?))",
+            (json.dumps([int(record_id) for record_id in record_ids]),),
+        )
+        self._update_terms(conn)
+
+    def _update_terms(self, conn):
+        terms = conn.exec_driver_sql(
+            f"SELECT term FROM {self.vocab_table} "
+            f"WHERE term NOT IN (SELECT term FROM {self.term_table})"
+        ).scalars()
+        rows = [(term, len(term)) for term in terms]
+        if rows:
+            conn.exec_driver_sql(
+                f"INSERT INTO {self.term_table} (term, length) VALUES (?, ?)", rows
+            )
+
+    def _find_terms(self, conn, key):
+        # quick_ratio is at most 2 * min(len) / (sum of len), which bounds the
+        # length of the matching terms
+        min_length = ceil(len(key) * FUZZY_THRESHOLD / (2 - FUZZY_THRESHOLD) - 1e-9)
+        max_length = floor(len(key) * (2 - FUZZY_THRESHOLD) / FUZZY_THRESHOLD + 1e-9)
+
+        if len(key) < SCAN_KEY_LENGTH:
+            # quick_ratio is 2 * M / (sum of len), with M the number of characters
+            # in common, so skip the terms that contain too few of the characters
+            total = len(key) + min_length
+            min_common = min(
+                m for m in range(total + 1) if 2.0 * m / total >= FUZZY_THRESHOLD
+            )
+            counts = Counter(key)
+            common = " + ".join(["(instr(term, ?) > 0) * ?"] * len(counts))
+            terms = conn.exec_driver_sql(
+                f"SELECT term FROM {self.term_table} "
+                f"WHERE length BETWEEN ? AND ? AND {common} >= ?",
+                (
+                    min_length,
+                    max_length,
+                    *(value for item in counts.items() for value in item),
+                    min_common,
+                ),
+            )
+        else:
+            trigrams = {key[i : i + 3] for i in range(len(key) - 2)}
+            terms = conn.exec_driver_sql(
+                f"SELECT term FROM {self.term_table} "
+                f"WHERE {self.term_table} MATCH ? AND length BETWEEN ? AND ?",
+                (
+                    " OR ".join(f'"{trigram}"' for trigram in trigrams),
+                    min_length,
+                    max_length,
+                ),
+            )
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(key)
+        for term in terms.scalars():
+            matcher.set_seq1(term)
+            ratio = matcher.quick_ratio()
+            if ratio >= FUZZY_THRESHOLD:
+                yield term, ratio
+
+    def search(self, keywords, threshold=60, max_return=10, exclude=None):
+        """Find records using keywords.
+
+        The scores of the records are computed like in
+        `asreview.data.search.fuzzy_find`, but only records that contain a term
+        similar to one of the keywords are scored. If the index does not exist
+        yet, it is created first. If the data store is read only or SQLite
+        doesn't support the index, the search falls back to `fuzzy_find`.
+
+        Parameters
+        ----------
+        keywords : str
+            A string of keywords together, can be a combination.
+        threshold : float
+            Don't return records below this threshold.
+        max_return : int
+            Maximum number of records to return.
+        exclude : list, numpy.ndarray
+            Record ids that should be excluded from the search, for example the
+            records that were already labeled.
+
+        Returns
+        -------
+        list[int]
+            Record ids of the best matching records, best match first.
+        """
+        if "title" not in self.columns:
+            raise ValueError("Cannot search dataset without titles.")
+
+        keys = tokenize(keywords)
+        if not keys:
+            return []
+
+        with self.store.engine.begin() as conn:
+            if not self.exists(conn):
+                if self.store.read_only or not fts5_trigram_available():
+                    return fuzzy_find(
+                        self.store,
+                        keywords,
+                        threshold=threshold,
+                        max_return=max_return,
+                        exclude=exclude,
+                    )
+                self.create(conn)
+
+            scores = defaultdict(float)
+            for key in keys:
+                key_scores = {}
+                for term, ratio in self._find_terms(conn, key):
+                    record_ids = conn.exec_driver_sql(
+                        f"SELECT rowid FROM {self.fts_table} "
+                        f"WHERE {self.fts_table} MATCH ?",
+                        (f'"{term}"',),
+                    ).scalars()
+                    for record_id in record_ids:
+                        if ratio > key_scores.get(record_id, 0.0):
+                            key_scores[record_id] = ratio
+                for record_id, ratio in key_scores.items():
+                    scores[record_id] += ratio
+
+        exclude = set() if exclude is None else set(exclude)
+        ranking = sorted(
+            (
+                (100 * score / len(keys), record_id)
+                for record_id, score in scores.items()
+                if record_id not in exclude
+            ),
+            key=lambda item: (-item[0], item[1]),
+        )
+
+        result = []
+        for score, record_id in ranking[:max_return]:
+            if len(result) > 0 and score < threshold:
+                break
+            result.append(record_id)
+        return result
@@ -6,8 +6,11 @@ from uuid import uuid4
 import numpy as np
 import pandas as pd
 from sqlalchemy import NullPool
+from sqlalchemy import QueuePool
 from sqlalchemy import create_engine
 from sqlalchemy import event
+from sqlalchemy import func
+from sqlalchemy import insert
 from sqlalchemy import select
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
@@ -15,6 +18,7 @@ from sqlalchemy.orm import sessionmaker
 
 from asreview.data.record import Base
 from asreview.data.record import Record
+from asreview.database.search_index import SearchIndex
 
 CURRENT_DATASTORE_VERSION = 0
 
@@ -142,6 +146,29 @@ def _build_conn_uri(fp, read_only=False):
     return uri
 
 
+def _connect(conn_uri, pragmas=None, **kwargs):
+    """Open a connection to an SQLite database and apply connection settings.
+
+    Parameters
+    ----------
+    conn_uri : str
+        SQLite connection URI, see `_build_conn_uri`.
+    pragmas : dict | None, optional
+        Mapping {pragma name: value} of the pragmas to set on the connection.
+    **kwargs
+        Keyword arguments passed to `sqlite3.connect`.
+
+    Returns
+    -------
+    sqlite3.Connection
+        Connection to the database.
+    """
+    conn = sqlite3.connect(conn_uri, uri=True, **kwargs)
+    for name, value in (pragmas or {}).items():
+        conn.execute(f"PRAGMA {name} = {value}")
+    return conn
+
+
 class DataStore:
     """Data store to hold user input data.
 
@@ -158,7 +185,13 @@ class DataStore:
     the database."""
 
     def __init__(
-        self, fp=":memory:", record_cls=Record, read_only=False, conn_uri=None
+        self,
+        fp=":memory:",
+        record_cls=Record,
+        read_only=False,
+        conn_uri=None,
+        pooled=False,
+        pragmas=None,
     ):
         """Initialize the data store.
 
@@ -180,6 +213,13 @@ class DataStore:
             are ignored for URI construction and this URI is used directly. This is
             useful when embedding the DataStore inside a `Database` that already owns
             the connection URI.
+        pooled : bool, optional
+            Whether to keep connections open in a pool and reuse them. By default a
+            new connection is opened for every session or query. Call `close` to
+            close the connections in the pool.
+        pragmas : dict | None, optional
+            Mapping {pragma name: value} of SQLite pragmas to set on every new
+            connection, for example `{"synchronous": "normal"}`.
         """
         if conn_uri is None and fp == ":memory:" and read_only:
             raise ValueError("Can't open an in-memory database in read only mode")
@@ -191,15 +231,40 @@ class DataStore:
         )
         self._in_memory = conn_uri is not None or fp == ":memory:"
 
-        # I'm using NullPool here, indicating that the engine should not use a
-        # connection pool, but just create and dispose of a connection every time a
-        # request comes. This makes it very easy dispose of the engine, but is less
-        # efficient.
-        self.engine = create_engine(
-            "sqlite://",
-            creator=lambda: sqlite3.connect(self._conn_uri, uri=True),
-            poolclass=NullPool,
-        )
+        self.pooled = pooled
+        self.pragmas = pragmas
+
+        if pooled:
+            # Connections are returned to the pool after use and reused by the next
+            # request, in any thread. This saves opening a connection and setting
+            # the connection pragmas for every query. The connections stay open
+            # until the data store is closed.
+            self.engine = create_engine(
+                "sqlite://",
+                creator=lambda: _connect(
+                    self._conn_uri, self.pragmas, check_same_thread=False
+                ),
+                poolclass=QueuePool,
+            )
+        else:
+            # I'm using NullPool here, indicating that the engine should not use a
+            # connection pool, but just create and dispose of a connection every
+            # time a request comes. This makes it very easy dispose of the engine,
+            # but is less efficient.
+            self.engine = create_engine(
+                "sqlite://",
+                creator=lambda: _connect(self._conn_uri, self.pragmas),
+                poolclass=NullPool,
+            )
+
+        self._connection_counts = {"opened": 0, "closed": 0, "checkouts": 0}
+        for event_name, key in [
+            ("connect", "opened"),
+            ("close", "closed"),
+            ("close_detached", "closed"),
+            ("checkout", "checkouts"),
+        ]:
+            event.listen(self.engine, event_name, functools.partial(self._count, key))
 
         # I put expire_on_commit=False, so that after you put records in the database,
         # you can still use them in your code without having access to the database.
@@ -210,6 +275,39 @@ class DataStore:
         self.record_cls = record_cls
         self._columns = self.record_cls.get_columns()
         self._pandas_dtype_mapping = self.record_cls.get_pandas_dtype_mapping()
+        self.search_index = SearchIndex(self)
+
+    def _count(self, key, *args):
+        self._connection_counts[key] += 1
+
+    @property
+    def connection_stats(self):
+        """Counts of the database connections of the data store.
+
+        Returns
+        -------
+        dict
+            Dictionary with the number of connections `opened` and `closed` since
+            the data store was created, the number of `checkouts` of a connection by
+            a session or query, the number of connections currently `checked_out`
+            and the number of idle connections `in_pool`.
+        """
+        stats = dict(self._connection_counts)
+        stats["checked_out"] = (
+            self.engine.pool.checkedout()
+            if self.pooled
+            else (stats["opened"] - stats["closed"])
+        )
+        stats["in_pool"] = self.engine.pool.checkedin() if self.pooled else 0
+        return stats
+
+    def close(self):
+        """Close the connections in the pool of the data store.
+
+        The data store can still be used after closing it, but new connections will
+        have to be opened.
+        """
+        self.engine.dispose()
 
     @property
     def columns(self):
@@ -227,6 +325,8 @@ class DataStore:
         If you are creating a new data store, you will need to call this method before
         adding data to the data store."""
         Base.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            self.search_index.create(conn)
 
     @unwrap_operational_errors
     def add_records(self, records):
@@ -242,15 +342,148 @@ class DataStore:
         ValueError
             If some `record.duplicate_of` points to a non-existing record_id.
         """
+        self.add_record_chunks([records])
+
+    @unwrap_operational_errors
+    def add_dataframe(self, data):
+        """Add records from column data to the data store.
+
+        This is the fast way to add many records. The data is validated per column
+        by `record_cls.validate_dataframe`, instead of by creating a record object
+        per row, and inserted with a single `executemany`.
+
+        Parameters
+        ----------
+        data : pd.DataFrame | dict[str, array-like]
+            Data of the records, with one row per record and the columns of
+            `record_cls.get_data_columns()`. Missing columns get their default
+            value. A `record_id` column is added to the data.
+
+        Raises
+        ------
+        ValueError
+            If the data of a record is invalid.
+        """
+        self.add_record_chunks([data])
+
+    @unwrap_operational_errors
+    def add_record_chunks(self, chunks):
+        """Add chunks of records to the data store in a single transaction.
+
+        A chunk is either a list of records or column data, see `add_dataframe`.
+        Chunks without duplicate information are inserted with one `executemany`,
+        instead of through the ORM unit of work. The chunks are consumed one at a
+        time, so they can be produced while reading a large file. If an exception is
+        raised while consuming the chunks, none of the records are added.
+
+        Parameters
+        ----------
+        chunks : Iterable[list[self.record_cls] | pd.DataFrame | dict]
+            Chunks of records to add to the store. After a chunk is added, the
+            `record_id` of its records is set, or the `record_id` column is added to
+            its data.
+
+        Raises
+        ------
+        ValueError
+            If some `record.duplicate_of` points to a non-existing record_id, or if
+            the data of a record is invalid.
+        """
         # SQLite makes an autoincremented primary key column start at 1. We want it to
         # start at 0, so that the record_id is equal to the row number of the record in
-        # feature matrix. By making sure that the first record has record_id 0, we force
-        # the autoincremented column to start at 0.
-        if self.is_empty():
-            records[0].record_id = 0
+        # feature matrix. The record_id is therefore set explicitly, starting at 0 for
+        # an empty store.
+        columns = [
+            column.name
+            for column in self.record_cls.__table__.columns
+            if column.computed is None
+        ]
+        # The ORM leaves out columns that are None, so that their default is used.
+        # An executemany needs the same columns for every row, so the default is
+        # filled in here.
+        defaults = {
+            column.name: column.default.arg
+            for column in self.record_cls.__table__.columns
+            if column.default is not None and column.default.is_scalar
+        }
 
         with self.Session() as session, session.begin():
-            session.add_all(records)
+            record_id = session.scalar(
+                select(func.coalesce(func.max(self.record_cls.record_id) + 1, 0))
+            )
+            added_record_ids = []
+            for records in chunks:
+                if isinstance(records, (pd.DataFrame, dict)):
+                    data = self.record_cls.validate_dataframe(pd.DataFrame(records))
+                    record_ids = np.arange(record_id, record_id + len(data))
+                    records["record_id"] = record_ids
+                    data["record_id"] = record_ids
+                    record_id += len(data)
+                    added_record_ids.extend(record_ids.tolist())
+
+                    for column, default in defaults.items():
+                        if column in data:
+                            data[column] = data[column].where(
+                                data[column].notna(), default
+                            )
+                    rows = data.to_dict("records")
+                else:
+                    for record in records:
+                        if record.record_id is None:
+                            record.record_id = record_id
+                        record_id = max(record_id, record.record_id + 1)
+                    added_record_ids.extend(record.record_id for record in records)
+
+                    if any(record.duplicate_of is not None for record in records):
+                        session.add_all(records)
+                        session.flush()
+                        continue
+
+                    rows = [
+                        {
+                            column: value
+                            if (value := getattr(record, column)) is not None
+                            else defaults.get(column)
+                            for column in columns
+                        }
+                        for record in records
+                    ]
+
+                if rows:
+                    session.execute(insert(self.record_cls.__table__), rows)
+
+            # Adding the records to the search index at once is much faster than
+            # adding them one at a time with a trigger.
+            conn = session.connection()
+            if self.search_index.exists(conn):
+                self.search_index.add(conn, added_record_ids)
+
+    @unwrap_operational_errors
+    def search(self, keywords, threshold=60, max_return=10, exclude=None):
+        """Find records using keywords.
+
+        Searches the title, authors and keywords of the records with the full-text
+        search index, see `asreview.database.search_index.SearchIndex`.
+
+        Parameters
+        ----------
+        keywords : str
+            A string of keywords together, can be a combination.
+        threshold : float
+            Don't return records below this threshold.
+        max_return : int
+            Maximum number of records to return.
+        exclude : list, numpy.ndarray
+            Record ids that should be excluded from the search.
+
+        Returns
+        -------
+        list[int]
+            Record ids of the best matching records, best match first.
+        """
+        return self.search_index.search(
+            keywords, threshold=threshold, max_return=max_return, exclude=exclude
+        )
 
     @unwrap_operational_errors
     def delete_record(self, record_id):
@@ -301,6 +534,19 @@ class DataStore:
         with self.Session() as session:
             return session.query(self.record_cls).first() is None
 
+    def count_included(self):
+        """Count the records that are included according to the dataset.
+
+        Returns
+        -------
+        int
+            Sum of the 'included' column, without reading the column.
+        """
+        with self.Session() as session:
+            return session.scalar(
+                select(func.coalesce(func.sum(self.record_cls.included), 0))
+            )
+
     def get_records(self, record_id=None):
         """Get the records with the given record identifiers.
 
@@ -0,0 +1,171 @@
+from collections import Counter
+
+from sklearn.feature_extraction.text import CountVectorizer
+
+__all__ = ["WordCounts"]
+
+# Analyzer that splits an abstract into its terms: words and pairs of words, without
+# English stop words.
+_analyze = CountVectorizer(ngram_range=(1, 2), stop_words="english").build_analyzer()
+
+
+class WordCounts:
+    """Counts of the terms in the abstracts of the labeled records, per label.
+
+    The counts are stored in the database in two tables: the number of times each
+    term occurs in the relevant and in the irrelevant records, and the label of every
+    record that was counted. When the counts are read, only the records that were
+    labeled, relabeled or unlabeled since the previous read are counted again. Like
+    the other statistics of the results, only the base record of each group is
+    counted.
+
+    From the counts, the terms that are most typical of the relevant and of the
+    irrelevant records are found in the same way as with a multinomial naive Bayes
+    model fitted on the labeled abstracts with balanced sample weights.
+
+    In read only mode, the counts are kept in temporary tables, which are filled on
+    the first read.
+
+    Parameters
+    ----------
+    db : asreview.database.Database
+        Database with the records and the results.
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def _create_tables(self, conn):
+        temp = "TEMP" if self.db.read_only else ""
+        conn.execute(
+            f"""CREATE {temp} TABLE IF NOT EXISTS word_counts
+                            (term TEXT PRIMARY KEY,
+                            n_irrelevant INTEGER NOT NULL,
+                            n_relevant INTEGER NOT NULL)"""
+        )
+        conn.execute(
+            f"""CREATE {temp} TABLE IF NOT EXISTS word_counts_records
+                            (record_id INTEGER PRIMARY KEY,
+                            label INTEGER NOT NULL)"""
+        )
+
+    def update(self):
+        """Count the terms of the records of which the label changed."""
+        conn = self.db._conn
+        record_table = self.db.record_table_name
+
+        with conn:
+            cur = conn.cursor()
+            if not self.db.read_only:
+                cur.execute("BEGIN IMMEDIATE")
+            self._create_tables(cur)
+
+            removed = cur.execute(
+                f"""SELECT word_counts_records.record_id, word_counts_records.label,
+                    {record_table}.abstract
+                FROM word_counts_records
+                LEFT JOIN {record_table} USING (record_id)
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM results
+                    WHERE results.record_id = word_counts_records.record_id
+                    AND results.label = word_counts_records.label
+                    AND {self.db._is_group_root_sql}
+                )"""
+            ).fetchall()
+            added = cur.execute(
+                f"""SELECT results.record_id, results.label, {record_table}.abstract
+                FROM results
+                JOIN {record_table} USING (record_id)
+                WHERE results.label IS NOT NULL
+                AND {self.db._is_group_root_sql}
+                AND NOT EXISTS (
+                    SELECT 1 FROM word_counts_records
+                    WHERE word_counts_records.record_id = results.record_id
+                    AND word_counts_records.label = results.label
+                )"""
+            ).fetchall()
+
+            if not removed and not added:
+                return
+
+            counts = {0: Counter(), 1: Counter()}
+            for _, label, abstract in removed:
+                counts[label].subtract(_analyze(abstract or ""))
+            for _, label, abstract in added:
+                counts[label].update(_analyze(abstract or ""))
+
+            cur.executemany(
+                """INSERT INTO word_counts (term, n_irrelevant, n_relevant)
+                VALUES (?, ?, ?)
+                ON CONFLICT (term) DO UPDATE SET
+                    n_irrelevant = n_irrelevant + excluded.n_irrelevant,
+                    n_relevant = n_relevant + excluded.n_relevant""",
+                [
+                    (term, counts[0][term], counts[1][term])
+                    for term in counts[0].keys() | counts[1].keys()
+                ],
+            )
+            if removed:
+                cur.execute(
+                    "DELETE FROM word_counts WHERE n_irrelevant = 0 AND n_relevant = 0"
+                )
+
+            cur.executemany(
+                "DELETE FROM word_counts_records WHERE record_id = ?",
+                [(record_id,) for record_id, _, _ in removed],
+            )
+            cur.executemany(
+                "INSERT OR REPLACE INTO word_counts_records (record_id, label) "
+                "VALUES (?, ?)",
+                [(record_id, label) for record_id, label, _ in added],
+            )
+
+    def top_terms(self, n=15):
+        """Get the terms that are most typical of the relevant and irrelevant records.
+
+        Parameters
+        ----------
+        n : int
+            Number of terms to return for each label.
+
+        Returns
+        -------
+        tuple[list[str], list[str]] | tuple[None, None]
+            The terms of the relevant records and the terms of the irrelevant
+            records, most typical term first. None if there are no labeled records
+            of one of the labels, or if their abstracts have no terms.
+        """
+        self.update()
+        conn = self.db._conn
+
+        n_records = dict(
+            conn.execute(
+                "SELECT label, COUNT(*) FROM word_counts_records GROUP BY label"
+            ).fetchall()
+        )
+        if (
+            n_records.get(0, 0) == 0
+            or n_records.get(1, 0) == 0
+            or conn.execute("SELECT 1 FROM word_counts").fetchone() is None
+        ):
+            return None, None
+
+        # With balanced sample weights, the records of a label get the weight
+        # n_total / (2 * n_label). The log-probability ratios of the naive Bayes model,
+        # with additive smoothing, are in the same order as these ratios of the
+        # smoothed, weighted term counts.
+        n_total = n_records[0] + n_records[1]
+        weights = (n_total / (2 * n_records[1]), n_total / (2 * n_records[0]))
+
+        def terms(order):
+            return [
+                term
+                for (term,) in conn.execute(
+                    f"""SELECT term FROM word_counts
+                    ORDER BY (n_relevant * ? + 1) / (n_irrelevant * ? + 1) {order}, term
+                    LIMIT ?""",
+                    (*weights, n),
+                )
+            ]
+
+        return terms("DESC"), terms("ASC")
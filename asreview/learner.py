@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+import inspect
 import json
 from dataclasses import asdict
 from dataclasses import dataclass
@@ -20,6 +21,8 @@ from dataclasses import field
 from typing import Any
 from typing import Optional
 
+import numpy as np
+
 from asreview.extensions import load_extension
 from asreview.utils import _read_config_file
 
@@ -62,7 +65,9 @@ class ActiveLearningCycleData:
     balancer_param: Optional[dict[str, Any]] = field(default_factory=dict)
     feature_extractor_param: Optional[dict[str, Any]] = field(default_factory=dict)
     stopper_param: Optional[dict[str, Any]] = field(default_factory=dict)
-    n_query: int = 1
+    n_query: int | str = 1
+    n_query_param: dict[str, Any] | None = field(default_factory=dict)
+    incremental: bool = False
 
 
 class ActiveLearningCycle:
@@ -86,8 +91,16 @@ class ActiveLearningCycle:
         The feature extraction method to use. Default is None.
     stopper: BaseStopper
         The stopping criteria. Default is None.
-    n_query: int, callable
-        The number of instances to query at once. Default is 1.
+    n_query: int, callable, schedule
+        The number of instances to query at once. Can be an integer, a function
+        of the results or a schedule from ``asreview.models.schedules``. Default
+        is 1.
+    incremental: bool
+        Train the classifier incrementally. Classifiers with a ``partial_fit``
+        method are only updated with the newly labeled instances, linear
+        classifiers with a ``warm_start`` parameter start from the previous
+        solution. Other classifiers are retrained from scratch. Default is
+        False.
 
     """
 
@@ -99,6 +112,7 @@ class ActiveLearningCycle:
         feature_extractor=None,
         stopper=None,
         n_query=1,
+        incremental=False,
     ):
         self.querier = querier
         self.classifier = classifier
@@ -106,21 +120,25 @@ class ActiveLearningCycle:
         self.feature_extractor = feature_extractor
         self.stopper = stopper
         self.n_query = n_query
+        self.incremental = incremental
 
-    def get_n_query(self, results, labels):
+    def get_n_query(self, results, labels, ranking=None):
         """Get the number of records to query at each step in the active learning.
 
-        n_query can be an integer or a function that takes the results of the
-        simulation as input. If n_query is a function, it should return an integer.
-        n_query can not be larger than the number of records left to label.
+        n_query can be an integer, a function that takes the results of the
+        simulation as input, or a schedule with a ``compute`` method. If n_query
+        is a function, it should return an integer. n_query can not be larger
+        than the number of records left to label.
 
         Parameters
         ----------
-        n_query: int | callable
-            Number of records to query at each step in the active learning
-            process. Default is 1.
         results: pd.DataFrame
             The results of the simulation.
+        labels: np.array
+            The labels of all records.
+        ranking: np.array
+            The record ids of the pool in ranked order. Only passed to
+            schedules. Default is None.
 
         Returns
         -------
@@ -129,7 +147,12 @@ class ActiveLearningCycle:
 
         """
 
-        n_query = self.n_query(results) if callable(self.n_query) else self.n_query
+        if hasattr(self.n_query, "compute"):
+            n_query = self.n_query.compute(results, labels, ranking=ranking)
+        elif callable(self.n_query):
+            n_query = self.n_query(results)
+        else:
+            n_query = self.n_query
         return min(n_query, len(labels) - len(results))
 
     def transform(self, X):
@@ -147,44 +170,112 @@ class ActiveLearningCycle:
         """
         return self.feature_extractor.fit_transform(X)
 
-    def fit(self, X, y):
+    def fit(self, X, y, record_ids=None):
         """Fit the classifier to the data.
 
+        If the cycle is incremental and the records of the previous call are
+        the first records of X, with the same labels, the classifier is updated
+        instead of retrained. New instances should therefore be appended to the
+        end of X.
+
         Parameters
         ----------
         X: np.array
             The instances to fit.
         y: np.array
             The labels of the instances.
+        record_ids: np.array
+            The record ids of the instances. Incremental cycles use them to
+            check which records were fitted before. Without record ids, the
+            classifier is always retrained. Default is None.
         """
         if self.balancer is None:
             sample_weight = None
         else:
             sample_weight = self.balancer.compute_sample_weight(y)
 
-        self.classifier.fit(X, y, sample_weight=sample_weight)
+        if self.incremental:
+            self._fit_incremental(X, y, sample_weight, record_ids)
+        else:
+            self.classifier.fit(X, y, sample_weight=sample_weight)
         return self
 
-    def rank(self, X):
+    def _fit_incremental(self, X, y, sample_weight, record_ids):
+        y = np.asarray(y)
+        if record_ids is not None:
+            record_ids = np.asarray(record_ids)
+        y_fitted = getattr(self, "_y_fitted", None)
+        record_ids_fitted = getattr(self, "_record_ids_fitted", None)
+        is_update = (
+            record_ids is not None
+            and record_ids_fitted is not None
+            and len(record_ids_fitted) <= len(record_ids)
+            and np.array_equal(record_ids_fitted, record_ids[: len(record_ids_fitted)])
+            and np.array_equal(y_fitted, y[: len(y_fitted)])
+        )
+
+        if is_update and hasattr(self.classifier, "partial_fit"):
+            # Only feed the new instances. The sample weights of the new
+            # instances are computed on the full training set, the instances
+            # seen before keep the weight they were fitted with.
+            n_fitted = len(y_fitted)
+            if n_fitted < len(y):
+                self.classifier.partial_fit(
+                    X[n_fitted:],
+                    y[n_fitted:],
+                    sample_weight=None
+                    if sample_weight is None
+                    else sample_weight[n_fitted:],
+                )
+        elif (
+            is_update
+            and hasattr(self.classifier, "coef_")
+            and "warm_start" in self.classifier.get_params(deep=False)
+        ):
+            # Start from the previous solution. The parameter is restored after
+            # fitting to keep the configuration of the classifier unchanged.
+            warm_start = self.classifier.get_params(deep=False)["warm_start"]
+            self.classifier.set_params(warm_start=True)
+            try:
+                self.classifier.fit(X, y, sample_weight=sample_weight)
+            finally:
+                self.classifier.set_params(warm_start=warm_start)
+        else:
+            self.classifier.fit(X, y, sample_weight=sample_weight)
+
+        self._y_fitted = y.copy()
+        self._record_ids_fitted = None if record_ids is None else record_ids.copy()
+
+    def rank(self, X, pool=None, k=None):
         """Rank the instances in X.
 
         Parameters
         ----------
         X: np.array
             The instances to rank.
+        pool: np.array
+            Row indices of X to rank. If given, the classifier scores all rows
+            of X at once and only the rows in pool are ranked. This avoids
+            copying the pool rows out of X. Default is None, which ranks all
+            rows of X.
+        k: int
+            Number of top ranked instances to return. Queriers that support it
+            only sort the top k instances. Default is None, which returns the
+            full ranking.
 
         Returns
         -------
         np.array:
-            The ranking of the instances.
+            The ranking of the instances. If pool is given, the ranking
+            contains positions in pool.
         """
 
         if self.classifier is None:
-            return self.querier.query(X)
+            return self._query(X if pool is None else pool, k)
 
         try:
-            proba = self.classifier.predict_proba(X)
-            return self.querier.query(proba[:, 1])
+            proba = self.classifier.predict_proba(X)[:, 1]
+            return self._query(proba if pool is None else proba[pool], k)
         except AttributeError:
             try:
                 scores = self.classifier.decision_function(X)
@@ -192,7 +283,7 @@ class ActiveLearningCycle:
                 if "proba" in self.querier.get_params(deep=False):
                     self.querier.set_params(proba=False)
 
-                return self.querier.query(scores)
+                return self._query(scores if pool is None else scores[pool], k)
 
             except AttributeError:
                 raise AttributeError(
@@ -200,6 +291,15 @@ class ActiveLearningCycle:
                     "decision function for this classifier."
                 )
 
+    def _query(self, p, k=None):
+        if k is None:
+            return self.querier.query(p)
+
+        # queriers without support for k return the full ranking
+        if "k" in inspect.signature(self.querier.query).parameters:
+            return self.querier.query(p, k=k)
+        return self.querier.query(p)[:k]
+
     def stop(self, results, data):
         """Check if the stopping criteria is met.
 
@@ -261,6 +361,12 @@ class ActiveLearningCycle:
         else:
             feature_model = None
 
+        if isinstance(cycle_meta_data.n_query, str):
+            schedule_class = load_extension("models.schedules", cycle_meta_data.n_query)
+            n_query = schedule_class(**_unpack_params(cycle_meta_data.n_query_param))
+        else:
+            n_query = cycle_meta_data.n_query
+
         if cycle_meta_data.stopper is not None:
             stopper_class = load_extension("models.stoppers", cycle_meta_data.stopper)
             stopper_model = stopper_class(**cycle_meta_data.stopper_param)
@@ -273,7 +379,8 @@ class ActiveLearningCycle:
             balancer=balance_model,
             feature_extractor=feature_model,
             stopper=stopper_model,
-            n_query=cycle_meta_data.n_query,
+            n_query=n_query,
+            incremental=cycle_meta_data.incremental,
         )
 
     @classmethod
@@ -314,7 +421,13 @@ class ActiveLearningCycle:
             stopper_param=self.stopper.get_params(deep=False)
             if self.stopper is not None
             else None,
-            n_query=self.n_query,
+            n_query=self.n_query.name
+            if hasattr(self.n_query, "compute")
+            else self.n_query,
+            n_query_param=self.n_query.get_params(deep=False)
+            if hasattr(self.n_query, "compute")
+            else None,
+            incremental=self.incremental,
         )
 
     def to_file(self, fp):
@@ -20,6 +20,7 @@ __all__ = [
     "classifiers",
     "feature_extractors",
     "queriers",
+    "schedules",
     "stoppers",
     "AI_MODEL_CONFIGURATIONS",
     "get_ai_config",
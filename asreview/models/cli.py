@@ -62,4 +62,10 @@ def cli_algorithms(argv):  # noqa
         description="balance strategies",
     )
 
+    s += _format_algorithm(
+        values=extensions("models.schedules"),
+        name="n_query_schedules",
+        description="n_query schedules",
+    )
+
     print(s)
@@ -0,0 +1,326 @@
+# Copyright 2019-2025 The ASReview Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed cache for feature matrices.
+
+Feature matrices are stored under a key that is computed from the name and
+parameters of the feature extractor and a hash of the data it transforms. A
+change of a parameter or of the data results in a new key, so a stale matrix
+is never reused.
+"""
+
+__all__ = [
+    "FeatureCache",
+    "feature_cache_key",
+    "hash_data",
+    "load_feature_matrix",
+    "save_feature_matrix",
+]
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+DEFAULT_MAX_SIZE = 2 * 1024**3
+
+
+def save_feature_matrix(feature_matrix, directory):
+    """Store a feature matrix in a format that can be memory-mapped.
+
+    Dense matrices are stored as a single ``.npy`` file. Sparse matrices are
+    stored as CSR with the ``data``, ``indices`` and ``indptr`` arrays in
+    separate ``.npy`` files. The values are stored as float32, to halve the
+    memory of the mapped matrix.
+
+    Parameters
+    ----------
+    feature_matrix: numpy.ndarray, scipy.sparse.spmatrix, list
+        The feature matrix to store.
+    directory: str, Path
+        Directory to store the matrix in. It is created if it does not exist.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    if sp.issparse(feature_matrix):
+        feature_matrix = sp.csr_matrix(feature_matrix)
+        np.save(directory / "data.npy", feature_matrix.data.astype(np.float32))
+        np.save(directory / "indices.npy", feature_matrix.indices)
+        np.save(directory / "indptr.npy", feature_matrix.indptr)
+        np.save(directory / "shape.npy", np.array(feature_matrix.shape))
+    elif isinstance(feature_matrix, (np.ndarray, list)):
+        feature_matrix = np.asarray(feature_matrix)
+        if feature_matrix.dtype.hasobject:
+            raise ValueError("Feature matrices with objects can't be memory-mapped")
+        np.save(directory / "dense.npy", feature_matrix.astype(np.float32))
+    else:
+        raise ValueError("Unsupported feature matrix type")
+
+
+def load_feature_matrix(directory, mmap_mode="r"):
+    """Open a feature matrix stored with :func:`save_feature_matrix`.
+
+    The arrays are memory-mapped, so processes that open the same matrix share
+    its pages through the OS cache instead of each reading a copy.
+
+    Parameters
+    ----------
+    directory: str, Path
+        Directory with the stored matrix.
+    mmap_mode: str
+        Memory-map mode, see :func:`numpy.load`. Default is 'r', read-only. If
+        None, the matrix is read into memory.
+
+    Returns
+    -------
+    numpy.ndarray, scipy.sparse.csr_matrix
+        The feature matrix.
+    """
+    directory = Path(directory)
+
+    if (directory / "dense.npy").exists():
+        return np.load(directory / "dense.npy", mmap_mode=mmap_mode)
+
+    return sp.csr_matrix(
+        (
+            np.load(directory / "data.npy", mmap_mode=mmap_mode),
+            np.load(directory / "indices.npy", mmap_mode=mmap_mode),
+            np.load(directory / "indptr.npy", mmap_mode=mmap_mode),
+        ),
+        shape=tuple(np.load(directory / "shape.npy")),
+        copy=False,
+    )
+
+
+def hash_data(X):
+    """Compute a hash of the data to transform.
+
+    Parameters
+    ----------
+    X: pandas.DataFrame, numpy.ndarray, scipy.sparse.spmatrix
+        The data to hash.
+
+    Returns
+    -------
+    str:
+        The hexadecimal SHA-256 hash of the data.
+    """
+    h = hashlib.sha256()
+
+    if isinstance(X, pd.DataFrame):
+        for col in X.columns:
+            h.update(str(col).encode())
+            try:
+                values = pd.util.hash_pandas_object(X[col], index=False)
+            except TypeError:
+                # columns with lists, like authors or keywords
+                values = pd.util.hash_pandas_object(X[col].astype(str), index=False)
+            h.update(values.to_numpy().tobytes())
+    elif sp.issparse(X):
+        X = sp.csr_matrix(X)
+        h.update(str(X.shape).encode())
+        for values in (X.data, X.indices, X.indptr):
+            h.update(np.ascontiguousarray(values).tobytes())
+    else:
+        X = np.ascontiguousarray(X)
+        h.update(f"{X.shape}{X.dtype}".encode())
+        h.update(X.tobytes())
+
+    return h.hexdigest()
+
+
+def feature_cache_key(name, params, data_hash):
+    """Compute the cache key of a feature matrix.
+
+    Parameters
+    ----------
+    name: str
+        Name of the feature extractor.
+    params: dict
+        Parameters of the feature extractor.
+    data_hash: str
+        Hash of the transformed data, see :func:`hash_data`.
+
+    Returns
+    -------
+    str:
+        The hexadecimal SHA-256 cache key.
+    """
+    meta = json.dumps([name, params or {}, data_hash], sort_keys=True, default=str)
+    return hashlib.sha256(meta.encode()).hexdigest()
+
+
+class FeatureCache:
+    """Cache of feature matrices on disk.
+
+    Each feature matrix is stored in a directory named after its key, see
+    :func:`feature_cache_key`, and opened memory-mapped. If the total size of
+    the cache exceeds max_size, the least recently used matrices are removed.
+
+    Arguments
+    ---------
+    cache_dir: str, Path
+        Directory of the cache. It is created if it does not exist.
+    max_size: int
+        Maximum size of the cache in bytes. Default is 2 GB. If None, the
+        size of the cache is not limited.
+    """
+
+    def __init__(self, cache_dir, max_size=DEFAULT_MAX_SIZE):
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+
+    def _entries(self):
+        if not self.cache_dir.exists():
+            return []
+
+        return [
+            fp for fp in self.cache_dir.iterdir() if fp.is_dir() and len(fp.name) == 64
+        ]
+
+    def path(self, key):
+        """Get the path of a cached feature matrix.
+
+        Parameters
+        ----------
+        key: str
+            The cache key.
+
+        Returns
+        -------
+        Path, None:
+            The directory of the matrix, or None if the key is not in the cache.
+        """
+        fp = Path(self.cache_dir, key)
+        if fp.is_dir():
+            return fp
+
+    def __contains__(self, key):
+        return self.path(key) is not None
+
+    def get(self, key):
+        """Get a feature matrix from the cache.
+
+        Parameters
+        ----------
+        key: str
+            The cache key.
+
+        Returns
+        -------
+        numpy.memmap, scipy.sparse.csr_matrix, None:
+            The read-only, memory-mapped feature matrix, or None if the key is
+            not in the cache.
+        """
+        fp = self.path(key)
+        if fp is None:
+            return None
+
+        try:
+            # mark the matrix as recently used
+            os.utime(fp)
+            return load_feature_matrix(fp)
+        except FileNotFoundError:
+            # removed by another process
+            return None
+
+    def put(self, key, feature_matrix):
+        """Add a feature matrix to the cache.
+
+        Parameters
+        ----------
+        key: str
+            The cache key.
+        feature_matrix: numpy.ndarray, scipy.sparse.spmatrix, list
+            The feature matrix to store.
+
+        Returns
+        -------
+        Path:
+            The directory of the stored feature matrix.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fp = Path(self.cache_dir, key)
+
+        # write to a temporary directory first, so other processes never read
+        # a partially written matrix
+        fp_tmp = Path(tempfile.mkdtemp(dir=self.cache_dir, suffix=".tmp"))
+        try:
+            save_feature_matrix(feature_matrix, fp_tmp)
+            os.replace(fp_tmp, fp)
+        except OSError:
+            if not fp.is_dir():
+                raise
+            # stored by another process in the meantime
+        finally:
+            shutil.rmtree(fp_tmp, ignore_errors=True)
+
+        self._evict(keep=fp)
+        return fp
+
+    def _evict(self, keep=None):
+        if self.max_size is None:
+            return
+
+        entries = []
+        for fp in self._entries():
+            try:
+                size = sum(f.stat().st_size for f in fp.iterdir())
+                entries.append((fp.stat().st_mtime, size, fp))
+            except FileNotFoundError:
+                continue
+
+        total_size = sum(entry[1] for entry in entries)
+        for _, size, fp in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size:
+                break
+            if fp == keep:
+                continue
+            shutil.rmtree(fp, ignore_errors=True)
+            total_size -= size
+
+    def transform(self, feature_extractor, X):
+        """Transform the data with the feature extractor or read from the cache.
+
+        Parameters
+        ----------
+        feature_extractor: BaseEstimator
+            The feature extractor.
+        X: pandas.DataFrame
+            The data to transform.
+
+        Returns
+        -------
+        numpy.memmap, scipy.sparse.csr_matrix:
+            The feature matrix, memory-mapped from the cache.
+        """
+        key = feature_cache_key(
+            feature_extractor.name,
+            feature_extractor.get_params(deep=False),
+            hash_data(X),
+        )
+
+        feature_matrix = self.get(key)
+        if feature_matrix is None:
+            self.put(key, feature_extractor.fit_transform(X))
+            feature_matrix = self.get(key)
+
+        return feature_matrix
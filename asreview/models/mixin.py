@@ -18,19 +18,22 @@ __all__ = ["QueryMixin"]
 class QueryMixin:
     """Mixin class for all query strategies in ASReview."""
 
-    def query(self, p):
+    def query(self, p, k=None):
         """Rank the instances of the feature matrix.
 
         Arguments
         ---------
         p: numpy.ndarray
             The probability of inclusion for each record in the feature matrix.
+        k: int
+            Number of top ranked instances to return. If None, all instances are
+            ranked. Default is None.
 
         Returns
         -------
         numpy.ndarray
             The QueryStrategy ranks the row numbers of the feature matrix. It returns
             an array of shape (len(X),) containing the row indices in ranked
-            order.
+            order, or only the first k row indices if k is given.
         """
         raise NotImplementedError
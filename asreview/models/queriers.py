@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numbers
 
 import numpy as np
 from sklearn.base import BaseEstimator
@@ -35,21 +36,153 @@ def _random_array(n, random_state=None):
     return row_indices
 
 
+def _argsort(scores, k=None):
+    """Sort the scores in ascending order, or only the k lowest scores.
+
+    With k, the k lowest scores are selected with a partition and only these
+    are sorted. If these scores are tied, the full sort is used to keep the
+    same order of the tied records as without k.
+    """
+    scores = np.asarray(scores)
+
+    if k is None or k >= len(scores):
+        return np.argsort(scores)
+
+    kth = np.partition(scores, k - 1)[k - 1]
+    top_k = np.flatnonzero(scores <= kth)
+    top_k = top_k[np.argsort(scores[top_k])]
+    if len(top_k) == k and np.all(np.diff(scores[top_k]) > 0):
+        return top_k
+
+    return np.argsort(scores)[:k]
+
+
+def _n_mix_steps(from_1, n_1, n_2):
+    """Number of coin flips until one of the rankings is exhausted."""
+    n_taken_1 = np.cumsum(from_1)
+    n_taken_2 = np.arange(1, len(from_1) + 1) - n_taken_1
+    exhausted = np.flatnonzero((n_taken_1 >= n_1) | (n_taken_2 >= n_2))
+    return exhausted[0] + 1 if len(exhausted) > 0 else len(from_1)
+
+
+def _draw_mix(n_1, n_2, mix_probability=0.95, random_state=None):
+    """Draw the coin flips to mix two rankings of length n_1 and n_2.
+
+    The flips are drawn at once, but the random state is advanced by exactly
+    one draw per flip, as if the flips were drawn one at a time.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array, True if the record at that position comes from the
+        first ranking.
+    """
+    if n_1 == 0 or n_2 == 0:
+        return np.zeros(0, dtype=bool)
+
+    if isinstance(random_state, numbers.Integral):
+        # an integer seed creates a new random state for every flip, so all
+        # flips have the same outcome
+        from_1 = check_random_state(random_state).rand() < mix_probability
+        return np.full(n_1 if from_1 else n_2, from_1)
+
+    random_state = check_random_state(random_state)
+    state = random_state.get_state()
+    from_1 = random_state.rand(n_1 + n_2 - 1) < mix_probability
+    n_steps = _n_mix_steps(from_1, n_1, n_2)
+
+    random_state.set_state(state)
+    random_state.rand(n_steps)
+    return from_1[:n_steps]
+
+
+def _merge_mix(query_idx_1, query_idx_2, from_1):
+    """Merge two rankings by the coin flips and keep the first occurrences."""
+    query_idx_1 = np.asarray(query_idx_1)
+    query_idx_2 = np.asarray(query_idx_2)
+
+    n_taken_1 = np.count_nonzero(from_1)
+    merged = np.empty(len(from_1), dtype=np.result_type(query_idx_1, query_idx_2))
+    merged[from_1] = query_idx_1[:n_taken_1]
+    merged[~from_1] = query_idx_2[: len(from_1) - n_taken_1]
+
+    if len(merged) == 0:
+        return merged
+
+    # position of each record in the merged ranking, per source ranking
+    positions = np.arange(len(merged))
+    pos_1 = np.full(merged.max() + 1, len(merged))
+    pos_1[merged[from_1]] = positions[from_1]
+    pos_2 = np.full(merged.max() + 1, len(merged))
+    pos_2[merged[~from_1]] = positions[~from_1]
+
+    seen = np.where(from_1, pos_2[merged], pos_1[merged]) < positions
+    return merged[~seen]
+
+
 def _mix_indices(query_idx_1, query_idx_2, mix_probability=0.95, random_state=None):
-    query_idx_mix = []
-    i = 0
-    j = 0
-
-    while i < len(query_idx_1) and j < len(query_idx_2):
-        if check_random_state(random_state).rand() < mix_probability:
-            query_idx_mix.append(query_idx_1[i])
-            i = i + 1
-        else:
-            query_idx_mix.append(query_idx_2[j])
-            j = j + 1
+    """Mix two rankings with a coin flip for every position.
+
+    Each position is taken from the first ranking with probability
+    mix_probability, until one of the rankings is exhausted. Records already
+    in the mixed ranking are skipped.
+
+    Arguments
+    ---------
+    query_idx_1: numpy.ndarray
+        The first ranking, with unique record indices.
+    query_idx_2: numpy.ndarray
+        The second ranking, with unique record indices.
+    mix_probability: float
+        Probability of taking the next record from the first ranking.
+    random_state: int, RandomState
+        Random state for the coin flips.
+
+    Returns
+    -------
+    numpy.ndarray:
+        The mixed ranking.
+    """
+    from_1 = _draw_mix(
+        len(query_idx_1), len(query_idx_2), mix_probability, random_state
+    )
+    return _merge_mix(query_idx_1, query_idx_2, from_1)
+
+
+def _mix_indices_top_k(
+    query_idx_1, query_idx_2, k, n, mix_probability=0.95, random_state=None
+):
+    """Mix two rankings and return only the first k positions.
+
+    The result equals the first k positions of :func:`_mix_indices` and the
+    random state is advanced in the same way. Only the first k records of both
+    rankings are used.
+
+    Arguments
+    ---------
+    query_idx_1: numpy.ndarray
+        The first ranking, or at least its first k records.
+    query_idx_2: numpy.ndarray
+        The second ranking, or at least its first k records.
+    k: int
+        Number of positions to return.
+    n: int
+        Length of the full rankings.
+    mix_probability: float
+        Probability of taking the next record from the first ranking.
+    random_state: int, RandomState
+        Random state for the coin flips.
+
+    Returns
+    -------
+    numpy.ndarray:
+        The first k positions of the mixed ranking.
+    """
+    from_1 = _draw_mix(n, n, mix_probability, random_state)
 
-    indexes = np.unique(query_idx_mix, return_index=True)[1]
-    return [query_idx_mix[i] for i in sorted(indexes)]
+    # after k records from one of the rankings, at least k records are unique
+    from_1 = from_1[: _n_mix_steps(from_1, k, k)]
+    return _merge_mix(query_idx_1[:k], query_idx_2[:k], from_1)[:k]
 
 
 class Random(QueryMixin, BaseEstimator):
@@ -64,22 +197,22 @@ class Random(QueryMixin, BaseEstimator):
     def __init__(self, random_state=None):
         self.random_state = random_state
 
-    def query(self, p):
+    def query(self, p, k=None):
         """Query instances.
 
         Arguments
         ---------
         p: np.array
             The probabilities of the instances.
-        random_state: int, RandomState
-            Random state for shuffling the indices.
+        k: int
+            Number of instances to return. Default is None, all instances.
 
         Returns
         -------
         np.array:
             The indices of the instances to be queried.
         """
-        return _random_array(len(p), random_state=self.random_state)
+        return _random_array(len(p), random_state=self.random_state)[:k]
 
 
 class TopDown(QueryMixin, BaseEstimator):
@@ -91,20 +224,22 @@ class TopDown(QueryMixin, BaseEstimator):
     name = "top_down"
     label = "Top-down"
 
-    def query(self, p):
+    def query(self, p, k=None):
         """Query instances.
 
         Arguments
         ---------
         p: np.array
             The probabilities of the instances.
+        k: int
+            Number of instances to return. Default is None, all instances.
 
         Returns
         -------
         np.array:
             The indices of the instances to be queried.
         """
-        return np.arange(len(p))
+        return np.arange(len(p) if k is None else min(k, len(p)))
 
 
 class Uncertainty(QueryMixin, BaseEstimator):
@@ -123,13 +258,15 @@ class Uncertainty(QueryMixin, BaseEstimator):
         self.u = u
         self.proba = proba
 
-    def query(self, p):
+    def query(self, p, k=None):
         """Query instances.
 
         Arguments
         ---------
         p: np.array
             The probabilities of the instances.
+        k: int
+            Number of instances to return. Default is None, all instances.
 
         Returns
         -------
@@ -145,7 +282,7 @@ class Uncertainty(QueryMixin, BaseEstimator):
             u = self.u
 
         try:
-            return np.argsort(np.abs(p - u))
+            return _argsort(np.abs(p - u), k)
         except TypeError:
             raise TypeError("Probabilities or decision functions should be provided")
 
@@ -159,9 +296,9 @@ class Max(QueryMixin, BaseEstimator):
     name = "max"
     label = "Maximum"
 
-    def query(self, p):
+    def query(self, p, k=None):
         try:
-            return np.argsort(-p)
+            return _argsort(-p, k)
         except TypeError:
             raise TypeError("Probabilities or decision functions should be provided")
 
@@ -184,10 +321,20 @@ class HybridMaxUncertainty(QueryMixin, BaseEstimator):
         self.proba = proba
         self.random_state = random_state
 
-    def query(self, p):
-        return _mix_indices(
-            Max().query(p),
-            Uncertainty(u=self.u, proba=self.proba).query(p),
+    def query(self, p, k=None):
+        if k is None:
+            return _mix_indices(
+                Max().query(p),
+                Uncertainty(u=self.u, proba=self.proba).query(p),
+                self.probability,
+                self.random_state,
+            )
+
+        return _mix_indices_top_k(
+            Max().query(p, k),
+            Uncertainty(u=self.u, proba=self.proba).query(p, k),
+            k,
+            len(p),
             self.probability,
             self.random_state,
         )
@@ -217,10 +364,20 @@ class HybridMaxRandom(QueryMixin, BaseEstimator):
         self.probability = probability
         self.random_state = random_state
 
-    def query(self, p):
-        return _mix_indices(
-            Max().query(p),
+    def query(self, p, k=None):
+        if k is None:
+            return _mix_indices(
+                Max().query(p),
+                _random_array(len(p), self.random_state),
+                self.probability,
+                self.random_state,
+            )
+
+        return _mix_indices_top_k(
+            Max().query(p, k),
             _random_array(len(p), self.random_state),
+            k,
+            len(p),
             self.probability,
             self.random_state,
         )
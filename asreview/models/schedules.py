@@ -0,0 +1,194 @@
+# Copyright 2019-2025 The ASReview Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Schedules for the number of records to query.
+
+A schedule determines how many records are labeled before the model is
+retrained. Larger batches mean fewer retrains, at the cost of a ranking that
+is less up to date.
+
+
+.. warning::
+    This module is experimental and might change.
+
+"""
+
+import math
+
+import numpy as np
+from sklearn.base import BaseEstimator
+
+__all__ = [
+    "Geometric",
+    "PoolFraction",
+    "NewRelevant",
+]
+
+
+def _clip_n_query(n_query, min_n_query, max_n_query):
+    n_query = max(int(n_query), min_n_query)
+    if max_n_query is not None:
+        n_query = min(n_query, max_n_query)
+    return n_query
+
+
+class Geometric(BaseEstimator):
+    """Grow the training set geometrically.
+
+    The number of records to query is chosen such that the training set grows
+    with a constant factor between two retrains. The number of retrains is
+    therefore logarithmic in the number of labeled records.
+
+    Arguments
+    ---------
+    factor: float
+        The growth factor of the training set between two retrains.
+    min_n_query: int
+        Minimum number of records to query.
+    max_n_query: int
+        Maximum number of records to query. Default is None, no maximum.
+    """
+
+    name = "geometric"
+    label = "Geometric"
+
+    def __init__(self, factor=1.1, min_n_query=1, max_n_query=None):
+        self.factor = factor
+        self.min_n_query = min_n_query
+        self.max_n_query = max_n_query
+
+    def compute(self, results, data, ranking=None):
+        """Compute the number of records to query.
+
+        Arguments
+        ---------
+        results: pandas.DataFrame
+            DataFrame with the results of the review.
+        data: pandas.DataFrame, list, np.array
+            pandas.DataFrame, list, np.array with all records.
+        ranking: np.array
+            Record ids of the pool in ranked order. Not used.
+
+        Returns
+        -------
+        int:
+            Number of records to query.
+        """
+        return _clip_n_query(
+            math.ceil(len(results) * (self.factor - 1)),
+            self.min_n_query,
+            self.max_n_query,
+        )
+
+
+class PoolFraction(BaseEstimator):
+    """Query a fixed fraction of the pool.
+
+    Arguments
+    ---------
+    fraction: float
+        Fraction of the unlabeled records to query.
+    min_n_query: int
+        Minimum number of records to query.
+    max_n_query: int
+        Maximum number of records to query. Default is None, no maximum.
+    """
+
+    name = "pool_fraction"
+    label = "Fraction of Pool"
+
+    def __init__(self, fraction=0.01, min_n_query=1, max_n_query=None):
+        self.fraction = fraction
+        self.min_n_query = min_n_query
+        self.max_n_query = max_n_query
+
+    def compute(self, results, data, ranking=None):
+        """Compute the number of records to query.
+
+        Arguments
+        ---------
+        results: pandas.DataFrame
+            DataFrame with the results of the review.
+        data: pandas.DataFrame, list, np.array
+            pandas.DataFrame, list, np.array with all records. Used to determine
+            the size of the pool.
+        ranking: np.array
+            Record ids of the pool in ranked order. Not used.
+
+        Returns
+        -------
+        int:
+            Number of records to query.
+        """
+        return _clip_n_query(
+            math.ceil((len(data) - len(results)) * self.fraction),
+            self.min_n_query,
+            self.max_n_query,
+        )
+
+
+class NewRelevant(BaseEstimator):
+    """Retrain after k new relevant records.
+
+    Records are queried from the same ranking until k relevant records are
+    found. This requires the labels of the ranked records: in a simulation
+    these are the labels of the dataset, during a review these are the labels
+    of the records labeled since the last retrain.
+
+    Arguments
+    ---------
+    k: int
+        Number of new relevant records to find before retraining.
+    max_n_query: int
+        Maximum number of records to query. Default is None, no maximum.
+    """
+
+    name = "new_relevant"
+    label = "New Relevant"
+    requires_ranking = True
+
+    def __init__(self, k=1, max_n_query=None):
+        self.k = k
+        self.max_n_query = max_n_query
+
+    def compute(self, results, data, ranking=None):
+        """Compute the number of records to query.
+
+        Arguments
+        ---------
+        results: pandas.DataFrame
+            DataFrame with the results of the review.
+        data: pandas.DataFrame, list, np.array
+            pandas.DataFrame, list, np.array with the labels of all records.
+        ranking: np.array
+            Record ids of the pool in ranked order.
+
+        Returns
+        -------
+        int:
+            Number of records to query. If the ranking contains fewer than k
+            relevant records, the length of the ranking plus one.
+        """
+        if ranking is None:
+            raise ValueError(f"Schedule '{self.name}' requires the ranking.")
+
+        ranked_labels = np.asarray(data, dtype=float)[np.asarray(ranking, dtype=int)]
+        relevant_positions = np.flatnonzero(ranked_labels == 1)
+
+        if len(relevant_positions) >= self.k:
+            n_query = relevant_positions[self.k - 1] + 1
+        else:
+            n_query = len(ranking) + 1
+
+        return _clip_n_query(n_query, 1, self.max_n_query)
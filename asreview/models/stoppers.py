@@ -23,8 +23,8 @@ This can be based on the properties of the results table or the input dataset.
 
 """
 
+import numpy as np
 import pandas as pd
-
 from sklearn.base import BaseEstimator
 
 __all__ = [
@@ -104,7 +104,7 @@ class LastRelevant(BaseEstimator):
             True if the review should be stopped, False otherwise.
         """
 
-        if sum(data) == sum(results["label"]):
+        if np.sum(data) == results["label"].sum():
             return True
 
         return False
@@ -159,10 +159,9 @@ class NLabeled(BaseEstimator):
 
         if isinstance(self.n, tuple):
             n_relevant, n_irrelevant = self.n
-            if (
-                sum(results["label"] == 1) >= n_relevant
-                and sum(results["label"] == 0) >= n_irrelevant
-            ):
+            n_relevant_found = (results["label"] == 1).sum()
+            n_irrelevant_found = (results["label"] == 0).sum()
+            if n_relevant_found >= n_relevant and n_irrelevant_found >= n_irrelevant:
                 return True
 
         return False
@@ -257,7 +256,7 @@ class NConsecutiveIrrelevant(BaseEstimator):
             True if the review should be stopped, False otherwise.
         """
 
-        if len(results) > self.n and sum(results["label"].iloc[-self.n :]) == 0:
+        if len(results) > self.n and results["label"].iloc[-self.n :].sum() == 0:
             return True
 
         return False
@@ -35,14 +35,20 @@ import numpy as np
 import scipy.sparse as sp
 from filelock import FileLock
 
+from asreview.data.base import DEFAULT_CHUNK_SIZE
+from asreview.data.loader import _add_record_chunks
 from asreview.data.loader import _from_file
 from asreview.data.loader import _get_reader
-from asreview.data.utils import identify_record_groups
 from asreview.database.database import Database
 from asreview.datasets import DatasetManager
 from asreview.learner import ActiveLearningCycle
 from asreview.learner import ActiveLearningCycleData
 from asreview.models import get_ai_config
+from asreview.models.feature_cache import DEFAULT_MAX_SIZE
+from asreview.models.feature_cache import FeatureCache
+from asreview.models.feature_cache import hash_data
+from asreview.models.feature_cache import load_feature_matrix
+from asreview.models.feature_cache import save_feature_matrix
 from asreview.project.exceptions import ProjectError
 from asreview.project.exceptions import ProjectNotFoundError
 from asreview.project.migration import detect_version
@@ -57,6 +63,38 @@ except ImportError:
     __version__ = "0.0.0"
 
 
+def _check_fully_labeled(chunks):
+    """Pass through chunks of record data and check that all records are labeled.
+
+    Raises
+    ------
+    ValueError
+        After the last chunk, if some or all of the records are not labeled.
+    """
+    n_records = 0
+    n_unlabeled = 0
+    for data in chunks:
+        n_records += len(data)
+        # Internals of the records are leaking out here. We are checking for a
+        # specific field and a specific value. If the presence of the field
+        # `included` is necessary in the input data, we should move it from `Record`
+        # to the `Base` class, so that all record implementations have it.
+        n_unlabeled += data["included"].isna().sum()
+        yield data
+
+    if n_unlabeled == n_records:
+        raise ValueError(
+            "Dataset for simulation mode must have labels for all records - "
+            "got dataset without any labels"
+        )
+
+    if n_unlabeled > 0:
+        raise ValueError(
+            "Dataset for simulation mode must be fully labeled - "
+            "got records with missing labels"
+        )
+
+
 def is_project(project_dir):
     """
     Check if the given path is a valid ASReview project.
@@ -104,11 +142,12 @@ class Project:
     `asreview/state` for information on the model and the labeling decisions.
     """
 
-    VERSION = 3
+    VERSION = 4
     MODE_SIMULATE = "simulate"
     PATH_CONFIG = "project.json"
     PATH_CONFIG_LOCK = "project.json.lock"
     PATH_FEATURE_MATRICES = "feature_matrices"
+    FEATURE_MATRICES_MAX_SIZE = DEFAULT_MAX_SIZE
     PATH_DATA_DIR = "data"
     PATH_DB = "results.db"
     PATH_ERROR = "error.json"
@@ -137,7 +176,7 @@ class Project:
 
     @functools.cached_property
     def db(self):
-        return Database(self.db_path)
+        return Database(self.db_path, pooled=True)
 
     @property
     def input_data_fp(self):
@@ -249,7 +288,9 @@ class Project:
         self.config = config
         return config
 
-    def add_dataset(self, fp, dataset_id=None, file_writer=None):
+    def add_dataset(
+        self, fp, dataset_id=None, file_writer=None, near_duplicate_threshold=None
+    ):
         """Add a dataset to the project file.
 
         Parameters
@@ -257,6 +298,10 @@ class Project:
         fp: str, Path
             Filepath to the dataset. It will be copied to the correct location in the
             project file.
+        near_duplicate_threshold: float
+            If not None, records with an estimated Jaccard similarity of at least
+            this value are grouped as near-duplicates, in addition to the exact
+            duplicates. Default is None.
         """
         if dataset_id is None:
             dataset_id = uuid4().hex
@@ -284,31 +329,20 @@ class Project:
             dataset.to_file(save_fp)
         file_name = save_fp.name
 
-        records = _from_file(save_fp, dataset_id=dataset_id)
-
-        # Internals of the records are leaking out here. We are checking for a specific
-        # field and a specific value. If the presence of the field `included` is
-        # necessary in the input data, we should move it from `Record` to the `Base`
-        # class, so that all record implementations have it.
-        if self.config["mode"] == self.MODE_SIMULATE and (
-            all([r.included is None for r in records])
-        ):
-            raise ValueError(
-                "Dataset for simulation mode must have labels for all records - "
-                "got dataset without any labels"
-            )
-
-        if self.config["mode"] == self.MODE_SIMULATE and (
-            any([r.included is None for r in records])
-        ):
-            raise ValueError(
-                "Dataset for simulation mode must be fully labeled - "
-                "got records with missing labels"
-            )
+        chunks = _from_file(
+            save_fp,
+            dataset_id=dataset_id,
+            chunk_size=DEFAULT_CHUNK_SIZE,
+            as_frames=True,
+        )
+        if self.config["mode"] == self.MODE_SIMULATE:
+            chunks = _check_fully_labeled(chunks)
 
-        self.db.input.add_records(records=records)
-        groups = identify_record_groups(records)
-        self.db.input.set_groups(groups)
+        # The records are added in a single transaction, so nothing is added if the
+        # dataset turns out to be invalid.
+        _add_record_chunks(
+            self.db, chunks, near_duplicate_threshold=near_duplicate_threshold
+        )
 
         # This config update assumes that the project only has one dataset.
         self.update_config(
@@ -334,7 +368,34 @@ class Project:
         except Exception:
             return []
 
-    def add_feature_matrix(self, feature_matrix, name):
+    @property
+    def _feature_cache(self):
+        return FeatureCache(
+            Path(self.project_path, self.PATH_FEATURE_MATRICES),
+            max_size=self.FEATURE_MATRICES_MAX_SIZE,
+        )
+
+    def get_dataset_hash(self):
+        """Get the hash of the records in the project.
+
+        The hash is computed once and stored in the project config.
+
+        Returns
+        -------
+        str:
+            The hash of the records.
+        """
+        datasets = self.config.get("datasets")
+        if not datasets:
+            raise ValueError("Project has no dataset")
+
+        if "hash" not in datasets[0]:
+            datasets[0]["hash"] = hash_data(self.db.input.get_df())
+            self.update_config(datasets=datasets)
+
+        return datasets[0]["hash"]
+
+    def add_feature_matrix(self, feature_matrix, name, key=None):
         """Add feature matrix to project file.
 
         Parameters
@@ -343,21 +404,22 @@ class Project:
             The feature matrix to add to the project file.
         name: str
             Name of the feature extractor.
+        key: str
+            Cache key of the feature matrix, see
+            :func:`asreview.models.feature_cache.feature_cache_key`. If given, the
+            matrix is stored in the feature cache of the project, which removes
+            the least recently used matrices if it grows too large. Default is
+            None.
         """
-        file_name = f"{name}_feature_matrix"
-        file_path = Path(self.project_path, self.PATH_FEATURE_MATRICES, file_name)
-
-        if sp.issparse(feature_matrix):
-            sp.save_npz(str(file_path), feature_matrix)
-            file_name += ".npz"
-        elif isinstance(feature_matrix, np.ndarray):
-            np.save(file_path, feature_matrix)
-            file_name += ".npy"
-        elif isinstance(feature_matrix, list):
-            np.save(file_path, np.array(feature_matrix))
-            file_name += ".npy"
+        if key is not None:
+            file_name = self._feature_cache.put(key, feature_matrix).name
         else:
-            raise ValueError("Unsupported feature matrix type")
+            file_name = f"{name}_feature_matrix"
+            file_path = Path(self.project_path, self.PATH_FEATURE_MATRICES, file_name)
+
+            if file_path.exists():
+                shutil.rmtree(file_path)
+            save_feature_matrix(feature_matrix, file_path)
 
         # Add the feature matrix to the project config.
         config = self.config
@@ -366,45 +428,72 @@ class Project:
             "id": name,
             "filename": file_name,
         }
+        if key is not None:
+            feature_matrix_config["key"] = key
 
         # Add container for feature matrices.
         if "feature_matrices" not in config:
             config["feature_matrices"] = []
 
+        # Remove matrices that were evicted from the feature cache.
+        config["feature_matrices"] = [
+            x
+            for x in config["feature_matrices"]
+            if x["filename"] != file_name
+            and Path(
+                self.project_path, self.PATH_FEATURE_MATRICES, x["filename"]
+            ).exists()
+        ]
+
         config["feature_matrices"].append(feature_matrix_config)
 
         self.config = config
 
-    def get_feature_matrix(self, name):
+    def get_feature_matrix(self, name, key=None):
         """Get the feature matrix from the project file.
 
         Parameters
         ----------
         name : str
             Name of the feature extractor for which to get the cached matrix.
+        key: str
+            Cache key of the feature matrix. If given, only a matrix stored with
+            this key is returned. Default is None.
 
         Returns
         -------
         numpy.ndarray, scipy.sparse:
-            (Sparse) feature matrix.
+            (Sparse) feature matrix. Matrices stored by this version are
+            memory-mapped read-only, such that processes training on the same
+            project share the pages of the matrix.
         """
         feature_matrix_config = [
-            x for x in self.config["feature_matrices"] if x["id"] == name
+            x
+            for x in self.config["feature_matrices"]
+            if x["id"] == name and (key is None or x.get("key") == key)
         ]
 
         if len(feature_matrix_config) == 0:
             raise ValueError("Feature matrix not found")
 
+        if key is not None:
+            feature_matrix = self._feature_cache.get(key)
+            if feature_matrix is None:
+                raise ValueError("Feature matrix not found")
+            return feature_matrix
+
         file_path = Path(
             self.project_path,
             self.PATH_FEATURE_MATRICES,
             feature_matrix_config[0]["filename"],
         )
 
-        if file_path.suffix == ".npz":
+        if file_path.is_dir():
+            return load_feature_matrix(file_path)
+        elif file_path.suffix == ".npz":
             return sp.load_npz(str(file_path))
         elif file_path.suffix == ".npy":
-            return np.load(file_path, allow_pickle=False)
+            return np.load(file_path, mmap_mode="r", allow_pickle=False)
         else:
             raise ValueError("Unsupported file extension")
 
@@ -484,13 +573,19 @@ class Project:
 
         export_fp_tmp = Path(export_fp).with_suffix(".asreview.zip")
 
-        # copy the source tree, but ignore pickle files
+        # copy the source tree, but ignore pickle files and the database, which
+        # can't be copied consistently while it is in use
         shutil.copytree(
             self.project_path,
             export_fp_tmp,
-            ignore=shutil.ignore_patterns("tmp", "*.lock"),
+            ignore=shutil.ignore_patterns(
+                "tmp", "*.lock", self.PATH_DB, "*-wal", "*-shm"
+            ),
         )
 
+        if self.db_path.exists():
+            self.db.backup(Path(export_fp_tmp, self.PATH_DB))
+
         # create the archive
         shutil.make_archive(export_fp_tmp, "zip", root_dir=export_fp_tmp)
 
@@ -136,4 +136,4 @@ def _validate(project):
         raise ValueError("Migrated project is missing results.db.")
 
     with Database(results_db_fp) as db:
-        db._is_valid()
+        db._is_valid(version=3)
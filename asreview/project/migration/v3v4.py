@@ -0,0 +1,120 @@
+import json
+from pathlib import Path
+
+import jsonschema
+from sqlalchemy.schema import CreateIndex
+
+from asreview.database.database import LAST_RANKING_MODEL_COLUMNS
+from asreview.database.database import RESULTS_INDEXES
+from asreview.database.database import Database
+from asreview.project.schema import SCHEMA
+
+
+def _migrate(project):
+    """Migrate a valid project file from version 3 to version 4.
+
+    From version 3 to version 4 the changes to the project file are:
+
+    In results.db:
+    - The model of the last ranking is moved from every row of the `last_ranking`
+    table to the new `last_ranking_model` table.
+    - The indexes on the label of the results and on the `duplicate_of` column of the
+    records are added.
+    - The `results_label_counts` table is added, with the triggers that keep it up to
+    date.
+    - The `label_sequence_version` table is added, with the triggers that update it.
+    - The database version is updated.
+    In project.json:
+    - The project file version is updated.
+
+    Parameters
+    ----------
+    Project : str | Path
+        Path to the root of the project (unzipped).
+    """
+    config_fp = Path(project, "project.json")
+    with open(config_fp) as f:
+        project_config = json.load(f)
+    project_config["project_file_version"] = 4
+    with open(config_fp, "w") as f:
+        json.dump(project_config, f)
+
+    _migrate_database(Path(project, "results.db"))
+
+
+def _migrate_database(fp):
+    with Database(fp) as db:
+        cur = db._conn.cursor()
+        _split_last_ranking(db, cur)
+        _create_indexes(db, cur)
+        db._create_label_counts_table(cur)
+        db._create_label_sequence_version_table(cur)
+        db._conn.commit()
+
+        db.user_version = 4
+
+
+def _split_last_ranking(db, cur):
+    # Version 3 stores the model of the ranking in every row of the last ranking.
+    columns = cur.execute("SELECT name FROM pragma_table_info('last_ranking')")
+    if ("classifier",) not in columns.fetchall():
+        return
+
+    model_string = ", ".join(LAST_RANKING_MODEL_COLUMNS)
+    cur.execute("ALTER TABLE last_ranking RENAME TO last_ranking_old")
+    db._create_last_ranking_tables(cur)
+    cur.execute(
+        f"""INSERT INTO last_ranking_model
+        SELECT {model_string} FROM last_ranking_old ORDER BY ranking LIMIT 1"""
+    )
+    cur.execute(
+        """INSERT INTO last_ranking (record_id, ranking)
+        SELECT record_id, ranking FROM last_ranking_old ORDER BY ranking"""
+    )
+    cur.execute("DROP TABLE last_ranking_old")
+
+
+def _create_indexes(db, cur):
+    for statement in RESULTS_INDEXES.values():
+        cur.execute(statement)
+    for index in db.input.record_cls.__table__.indexes:
+        cur.execute(
+            str(
+                CreateIndex(index, if_not_exists=True).compile(
+                    dialect=db.input.engine.dialect
+                )
+            )
+        )
+
+
+def _validate(project):
+    """Validate a migrated v4 project.
+
+    Parameters
+    ----------
+    project : Path
+        Path to the migrated project folder.
+
+    Raises
+    ------
+    ValueError
+        If the migrated project is not valid.
+    """
+    config_fp = Path(project, "project.json")
+    with open(config_fp) as f:
+        config = json.load(f)
+
+    jsonschema.validate(instance=config, schema=SCHEMA)
+
+    if config.get("project_file_version") != 4:
+        raise ValueError(
+            f"Expected project file version 4, "
+            f"got {config.get('project_file_version')}."
+        )
+
+    results_db_fp = Path(project, "results.db")
+    if not results_db_fp.exists():
+        raise ValueError("Migrated project is missing results.db.")
+
+    with Database(results_db_fp) as db:
+        db._is_valid(version=4)
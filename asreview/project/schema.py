@@ -24,7 +24,7 @@ SCHEMA = {
     "examples": [
         {
             "version": "1.0",
-            "project_file_version": 3,
+            "project_file_version": 4,
             "id": "example",
             "mode": "oracle",
             "name": "example",
@@ -250,6 +250,16 @@ SCHEMA = {
                                 "default": "",
                                 "examples": ["example.ris"],
                             },
+                            "hash": {
+                                "$id": (
+                                    "#/properties/datasets/items/anyOf/0/"
+                                    "properties/hash"
+                                ),
+                                "type": "string",
+                                "title": "The hash of the dataset.",
+                                "description": "A hash of the records in the dataset.",
+                                "default": "",
+                            },
                         },
                         "additionalProperties": False,
                         "examples": [
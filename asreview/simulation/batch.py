@@ -0,0 +1,252 @@
+# Copyright 2019-2025 The ASReview Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Run a grid of simulations in parallel.
+
+The feature matrix of each feature extractor in the grid is computed once and
+stored on disk. The simulation runs open it memory-mapped, so all worker
+processes share the same pages of the matrix through the OS cache. The dataset
+is read once into a template project, which is copied for every run.
+"""
+
+__all__ = []
+
+import json
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+
+from asreview.learner import ActiveLearningCycle
+from asreview.learner import ActiveLearningCycleData
+from asreview.models.feature_cache import FeatureCache
+from asreview.models.feature_cache import load_feature_matrix
+from asreview.models.feature_cache import save_feature_matrix
+from asreview.models.queriers import TopDown
+from asreview.models.stoppers import IsFittable
+from asreview.models.stoppers import LastRelevant
+from asreview.models.stoppers import NLabeled
+from asreview.project.api import Project
+from asreview.simulation.simulate import Simulate
+
+PATH_RUNS = "runs.json"
+
+
+def _feature_extractor_key(cycle_data):
+    return json.dumps(
+        [cycle_data.feature_extractor, cycle_data.feature_extractor_param],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def expand_grid(cycles, seeds=None, priors=None):
+    """Expand a grid of simulation settings into a list of runs.
+
+    Parameters
+    ----------
+    cycles: list[ActiveLearningCycleData | dict]
+        The learning cycles to simulate.
+    seeds: list[int | None]
+        The seeds of the simulation runs. The seed of a run seeds the global
+        random state and the random state of the querier, unless the querier
+        has one already. Default is None, which runs each configuration once
+        without seed.
+    priors: list[list[int]]
+        Sets of prior knowledge, given as row numbers. Default is None, which
+        runs each configuration once without prior knowledge.
+
+    Returns
+    -------
+    list[dict]
+        One dictionary per run with the keys 'cycle', 'seed' and 'prior_idx'.
+    """
+    cycles = [
+        c if isinstance(c, ActiveLearningCycleData) else ActiveLearningCycleData(**c)
+        for c in cycles
+    ]
+
+    return [
+        {"cycle": cycle, "seed": seed, "prior_idx": list(prior_idx)}
+        for cycle, seed, prior_idx in product(cycles, seeds or [None], priors or [[]])
+    ]
+
+
+def _simulate_run(
+    template_path, run_path, output_fp, matrix_dir, run, n_stop, group_similar_records
+):
+    shutil.copytree(template_path, run_path)
+    np.random.seed(run["seed"])
+
+    with Project(run_path, project_id=output_fp.stem) as project:
+        project.update_config(id=output_fp.stem, name=output_fp.stem)
+
+        cycle = ActiveLearningCycle.from_meta(run["cycle"])
+        # queriers with a random component draw from their own random state,
+        # not from the global one
+        querier_params = cycle.querier.get_params()
+        if (
+            run["seed"] is not None
+            and "random_state" in querier_params
+            and querier_params["random_state"] is None
+        ):
+            cycle.querier.set_params(random_state=run["seed"])
+
+        cycles = [
+            ActiveLearningCycle(querier=TopDown(), stopper=IsFittable()),
+            cycle,
+        ]
+
+        sim = Simulate(
+            load_feature_matrix(matrix_dir),
+            project.db.input["included"],
+            cycles,
+            stopper=LastRelevant() if n_stop is None else NLabeled(n_stop),
+            skip_transform=True,
+            print_progress=False,
+            groups=project.db.input.get_groups() if group_similar_records else None,
+        )
+        if len(run["prior_idx"]) > 0:
+            sim.label(run["prior_idx"])
+        sim.review()
+
+        project.add_review(cycle=run["cycle"], reviewer=sim, status="finished")
+        project.export(output_fp)
+
+    shutil.rmtree(run_path)
+    return output_fp
+
+
+def simulate_batch(
+    dataset,
+    output_dir,
+    runs,
+    n_jobs=1,
+    n_stop=None,
+    group_similar_records=False,
+    near_duplicate_threshold=None,
+    feature_cache=None,
+):
+    """Run a batch of simulations across a process pool.
+
+    Each run is stored in its own project file ``run_<i>.asreview`` in the
+    output directory. The settings of all runs are written to ``runs.json``.
+
+    Parameters
+    ----------
+    dataset: str, Path
+        File path, URL or name of a benchmark dataset.
+    output_dir: str, Path
+        Directory to store the project files in. Should not exist yet.
+    runs: list[dict]
+        The simulation runs, see :func:`expand_grid`.
+    n_jobs: int
+        Number of worker processes. Default is 1, which runs the simulations in
+        the current process.
+    n_stop: int
+        The number of label actions to simulate. If None, the simulation stops
+        after the last relevant record was found. Default is None.
+    group_similar_records: bool
+        Label records in the same group at the same time. Default is False.
+    near_duplicate_threshold: float
+        If not None, near-duplicate records with an estimated Jaccard similarity
+        of at least this value are also grouped. Default is None.
+    feature_cache: FeatureCache, str, Path
+        Cache for the feature matrices, or the directory of the cache. Default
+        is None, which computes the feature matrices for this batch only.
+
+    Returns
+    -------
+    list[Path]
+        The file paths of the project files, in the order of the runs.
+    """
+    output_dir = Path(output_dir)
+    if output_dir.exists():
+        raise ValueError("Output path already exists.")
+
+    # the feature matrices are shared by the runs through a memory-mapped file,
+    # which can't hold the text of the records
+    for run in runs:
+        if run["cycle"].feature_extractor is None:
+            raise ValueError(
+                "Batch simulations require a feature extractor for every "
+                "learning cycle."
+            )
+
+    if isinstance(feature_cache, (str, Path)):
+        feature_cache = FeatureCache(feature_cache)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        template_path = Path(tmpdir, "template")
+        with Project.create(template_path, project_mode="simulate") as project:
+            project.add_dataset(
+                dataset, near_duplicate_threshold=near_duplicate_threshold
+            )
+            df = project.db.input.get_df()
+
+        # compute the feature matrix once for every feature extractor
+        matrix_dirs = {}
+        for i, run in enumerate(runs):
+            key = _feature_extractor_key(run["cycle"])
+            if key not in matrix_dirs:
+                matrix_dirs[key] = Path(tmpdir, "feature_matrices", str(i))
+                cycle = ActiveLearningCycle.from_meta(run["cycle"])
+                if feature_cache is not None:
+                    feature_matrix = feature_cache.transform(
+                        cycle.feature_extractor, df
+                    )
+                else:
+                    feature_matrix = cycle.transform(df)
+                save_feature_matrix(feature_matrix, matrix_dirs[key])
+
+        output_dir.mkdir(parents=True)
+        tasks = [
+            (
+                template_path,
+                Path(tmpdir, f"run_{i}"),
+                Path(output_dir, f"run_{i}.asreview"),
+                matrix_dirs[_feature_extractor_key(run["cycle"])],
+                run,
+                n_stop,
+                group_similar_records,
+            )
+            for i, run in enumerate(runs)
+        ]
+
+        if n_jobs == 1:
+            output_fps = [_simulate_run(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                futures = [executor.submit(_simulate_run, *task) for task in tasks]
+                output_fps = [future.result() for future in futures]
+
+    with open(Path(output_dir, PATH_RUNS), "w") as f:
+        json.dump(
+            [
+                {
+                    "filename": fp.name,
+                    "cycle": asdict(run["cycle"]),
+                    "seed": run["seed"],
+                    "prior_idx": run["prior_idx"],
+                }
+                for fp, run in zip(output_fps, runs, strict=True)
+            ],
+            f,
+            default=str,
+        )
+
+    return output_fps
@@ -18,6 +18,7 @@ import contextlib
 import logging
 import re
 import shutil
+from dataclasses import replace
 from pathlib import Path
 
 import numpy as np
@@ -33,6 +34,8 @@ from asreview.models.stoppers import IsFittable
 from asreview.models.stoppers import LastRelevant
 from asreview.models.stoppers import NLabeled
 from asreview.project.api import Project
+from asreview.simulation.batch import expand_grid
+from asreview.simulation.batch import simulate_batch
 from asreview.simulation.simulate import Simulate
 from asreview.utils import _format_to_str
 from asreview.utils import _read_config_file
@@ -108,6 +111,75 @@ def _print_record(record, use_cli_colors=True):
     print(f"\n{header:-<60}\n{title}{authors}{abstract}")
 
 
+def _n_query_type(value):
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _get_cycle_meta(args):
+    if args.config_file:
+        cycle_meta = ActiveLearningCycleData(**_read_config_file(args.config_file))
+    elif args.classifier or args.querier or args.balancer or args.feature_extractor:
+        cycle_meta = ActiveLearningCycleData(
+            querier=args.querier,
+            classifier=args.classifier,
+            balancer=args.balancer,
+            feature_extractor=args.feature_extractor,
+            n_query=args.n_query,
+        )
+    else:
+        cycle_meta = get_ai_config(args.ai.lower())["value"]
+
+    if args.incremental:
+        cycle_meta = replace(cycle_meta, incremental=True)
+
+    return cycle_meta
+
+
+def _cli_simulate_batch(args):
+    if args.output is None:
+        raise ValueError("Batch simulations require an output directory (-o).")
+
+    # prior knowledge is only selected by row number in batch simulations
+    for option, value in [
+        ("--prior-record-id", args.prior_record_id),
+        ("--n-prior-included", args.n_prior_included),
+        ("--n-prior-excluded", args.n_prior_excluded),
+        ("--prior-seed", args.prior_seed),
+    ]:
+        if value:
+            raise ValueError(
+                f"Option {option} is not supported for batch simulations. Use "
+                "--prior-idx or 'priors' in the batch file instead."
+            )
+
+    batch_config = _read_config_file(args.batch_file)
+
+    priors = batch_config.get("priors")
+    if priors is None and len(args.prior_idx) > 0:
+        priors = [args.prior_idx]
+
+    runs = expand_grid(
+        batch_config.get("cycles", [_get_cycle_meta(args)]),
+        seeds=batch_config.get("seeds", [args.seed]),
+        priors=priors,
+    )
+
+    output_fps = simulate_batch(
+        args.dataset,
+        args.output,
+        runs,
+        n_jobs=args.n_jobs,
+        n_stop=args.n_stop,
+        group_similar_records=args.group_similar_records,
+        near_duplicate_threshold=args.near_duplicate_threshold,
+        feature_cache=args.feature_cache,
+    )
+    print(f"Finished {len(output_fps)} simulations in {args.output}")
+
+
 def _cli_simulate(argv):
     # parse arguments
     parser = _simulate_parser()
@@ -116,6 +188,9 @@ def _cli_simulate(argv):
     # change the verbosity
     _set_log_verbosity(args.verbose)
 
+    if args.batch_file:
+        return _cli_simulate_batch(args)
+
     if args.output and Path(args.output).exists():
         raise ValueError("Project path already exists.")
 
@@ -150,10 +225,18 @@ def _cli_simulate(argv):
                 project_name=Path(args.output).stem,
             )
             stack.enter_context(project)
-            project.add_dataset(args.dataset, dataset_id=filename)
+            project.add_dataset(
+                args.dataset,
+                dataset_id=filename,
+                near_duplicate_threshold=args.near_duplicate_threshold,
+            )
             db = project.db
         else:
-            db = load_dataset(args.dataset, dataset_id=filename)
+            db = load_dataset(
+                args.dataset,
+                dataset_id=filename,
+                near_duplicate_threshold=args.near_duplicate_threshold,
+            )
             stack.enter_context(db)
 
         prior_idx = args.prior_idx
@@ -162,18 +245,7 @@ def _cli_simulate(argv):
 
         stopper = LastRelevant() if args.n_stop is None else NLabeled(args.n_stop)
 
-        if args.config_file:
-            cycle_meta = ActiveLearningCycleData(**_read_config_file(args.config_file))
-        elif args.classifier or args.querier or args.balancer or args.feature_extractor:
-            cycle_meta = ActiveLearningCycleData(
-                querier=args.querier,
-                classifier=args.classifier,
-                balancer=args.balancer,
-                feature_extractor=args.feature_extractor,
-                n_query=args.n_query,
-            )
-        else:
-            cycle_meta = get_ai_config(args.ai.lower())["value"]
+        cycle_meta = _get_cycle_meta(args)
 
         cycles = [
             ActiveLearningCycle(
@@ -191,6 +263,7 @@ def _cli_simulate(argv):
             cycles,
             stopper=stopper,
             groups=groups,
+            feature_cache=args.feature_cache,
         )
 
         # select or sample prior knowledge and then label it
@@ -339,8 +412,9 @@ def _simulate_parser(prog="simulate", description=DESCRIPTION_SIMULATE):
     parser.add_argument(
         "--n-query",
         default=1,
-        type=int,
-        help="Number of records queried each query. Default: 1.",
+        type=_n_query_type,
+        help="Number of records queried each query, or the name of an n_query "
+        "schedule (e.g. 'geometric', 'pool_fraction', 'new_relevant'). Default: 1.",
     )
     parser.add_argument(
         "--n-stop",
@@ -348,11 +422,25 @@ def _simulate_parser(prog="simulate", description=DESCRIPTION_SIMULATE):
         help="The number of label actions to simulate. If not set, simulation stops "
         "after last relevant was found. Use -1 to simulate all label actions. Default: None.",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Train the classifier incrementally on the newly labeled records "
+        "where the classifier supports it.",
+    )
     parser.add_argument(
         "--group-similar-records",
         action="store_true",
         help="Put identical records in groups and label these records at the same time.",
     )
+    parser.add_argument(
+        "--near-duplicate-threshold",
+        type=float,
+        help="Also put near-duplicate records in groups when grouping similar "
+        "records. Records are near-duplicates if the estimated Jaccard similarity "
+        "of their titles and abstracts is at least this value, e.g. 0.8. "
+        "Default: None.",
+    )
 
     # configuration file
     parser.add_argument(
@@ -361,12 +449,38 @@ def _simulate_parser(prog="simulate", description=DESCRIPTION_SIMULATE):
         help="Configuration file for learning cycle.",
     )
 
+    # batch simulations
+    parser.add_argument(
+        "--batch-file",
+        type=Path,
+        help="Configuration file with a grid of simulations to run. The file can "
+        "contain the keys 'cycles' (list of learning cycle configurations), "
+        "'seeds' (list of seeds) and 'priors' (list of lists of prior indices). "
+        "Each combination is stored in its own project file in the output "
+        "directory.",
+    )
+    parser.add_argument(
+        "--n-jobs",
+        default=1,
+        type=int,
+        help="Number of processes for batch simulations. Default: 1.",
+    )
+    parser.add_argument(
+        "--feature-cache",
+        type=str,
+        default=None,
+        help="Directory to cache feature matrices in. Feature matrices are reused "
+        "by simulations with the same dataset, feature extractor and parameters. "
+        "Default: no cache.",
+    )
+
     # output and verbosity
     parser.add_argument(
         "--output",
         "-o",
         type=str,
-        help="Location to ASReview project file of simulation.",
+        help="Location to ASReview project file of simulation. For batch "
+        "simulations, the directory to store the project files in.",
     )
 
     parser.add_argument(
@@ -16,6 +16,7 @@ __all__ = []
 
 import time
 from collections import defaultdict
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
@@ -24,6 +25,7 @@ from tqdm import tqdm
 from asreview.database.database import open_db
 from asreview.metrics import loss
 from asreview.metrics import ndcg
+from asreview.models.feature_cache import FeatureCache
 from asreview.models.stoppers import LastRelevant
 from asreview.models.stoppers import NLabeled
 
@@ -149,6 +151,189 @@ def _assert_no_conflicts_in_groups(labels, groups):
         group_to_label[group_id] = label
 
 
+class _ResultsBuffer:
+    """Column-oriented store for the results of a simulation.
+
+    The results are kept in preallocated NumPy arrays that grow geometrically
+    when full, so appending a batch of labels costs O(n_query) instead of a
+    copy of the full results table. The names of the models are interned and
+    stored as a single integer code per row. A ``pandas.DataFrame`` with the
+    columns of the results table is only materialized on request with
+    :meth:`to_frame`.
+
+    The buffer supports ``len(results)`` and column access like
+    ``results["label"]``, which is what the stoppers and n_query schedules
+    read. Other attributes are looked up on the materialized DataFrame.
+
+    Parameters
+    ----------
+    capacity: int
+        The initial number of rows to allocate.
+    """
+
+    MODEL_NAME_COLUMNS = ["classifier", "querier", "balancer", "feature_extractor"]
+    COLUMNS = [
+        "record_id",
+        "label",
+        "classifier",
+        "querier",
+        "balancer",
+        "feature_extractor",
+        "training_set",
+        "time",
+        "note",
+        "tags",
+        "user_id",
+    ]
+
+    def __init__(self, capacity=0):
+        capacity = max(int(capacity), 1)
+        self._n = 0
+        self._record_id = np.empty(capacity, dtype=np.int64)
+        self._label = np.empty(capacity, dtype=np.int64)
+        self._training_set = np.empty(capacity, dtype=np.int64)
+        self._time = np.empty(capacity, dtype=np.float64)
+        self._model_code = np.empty(capacity, dtype=np.int32)
+        self._model_names = []
+        self._model_name_codes = {}
+        self._frame = None
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, column):
+        n = self._n
+        if column == "record_id":
+            return pd.Series(self._record_id[:n], name=column, copy=False)
+        if column == "label":
+            return pd.Series(self._label[:n], name=column, copy=False)
+        if column == "time":
+            return pd.Series(self._time[:n], name=column, copy=False)
+        if column == "training_set":
+            # Same dtype as a DataFrame built from the rows: None for the prior
+            # knowledge makes the column an object column.
+            training_set = self._training_set[:n]
+            is_prior = training_set < 0
+            if not is_prior.any():
+                return pd.Series(training_set, name=column, copy=True)
+            values = training_set.astype(object)
+            values[is_prior] = None
+            return pd.Series(values, name=column, dtype=object)
+        if column in self.MODEL_NAME_COLUMNS:
+            i = self.MODEL_NAME_COLUMNS.index(column)
+            names = np.array(
+                [names[i] for names in self._model_names] or [None], dtype=object
+            )
+            return pd.Series(names[self._model_code[:n]], name=column)
+        return self.to_frame()[column]
+
+    def __getattr__(self, name):
+        # Fall back on the DataFrame API for everything that is not a column of
+        # the buffer. Private attributes are never forwarded.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.to_frame(), name)
+
+    @property
+    def empty(self):
+        return self._n == 0
+
+    @property
+    def record_ids(self):
+        """numpy.ndarray: The labeled record ids, in labeling order."""
+        return self._record_id[: self._n]
+
+    @property
+    def labels(self):
+        """numpy.ndarray: The labels, in labeling order."""
+        return self._label[: self._n]
+
+    def _intern_model_names(self, model_names):
+        try:
+            return self._model_name_codes[model_names]
+        except KeyError:
+            code = len(self._model_names)
+            self._model_names.append(model_names)
+            self._model_name_codes[model_names] = code
+            return code
+
+    def _reserve(self, n_new):
+        capacity = len(self._record_id)
+        if self._n + n_new <= capacity:
+            return
+
+        new_capacity = max(2 * capacity, self._n + n_new)
+        for attr in [
+            "_record_id",
+            "_label",
+            "_training_set",
+            "_time",
+            "_model_code",
+        ]:
+            old = getattr(self, attr)
+            new = np.empty(new_capacity, dtype=old.dtype)
+            new[: self._n] = old[: self._n]
+            setattr(self, attr, new)
+
+    def append(self, record_ids, labels, model_names, training_set, labeling_time):
+        """Append a batch of labeled records.
+
+        Parameters
+        ----------
+        record_ids: numpy.ndarray
+            The record ids of the labeled records.
+        labels: numpy.ndarray
+            The labels of the records.
+        model_names: tuple
+            The names of the classifier, querier, balancer and feature extractor
+            that produced the batch.
+        training_set: int | None
+            The size of the training set when the batch was queried. None for
+            prior knowledge.
+        labeling_time: float
+            The time of labeling.
+        """
+        n_new = len(record_ids)
+        self._reserve(n_new)
+
+        batch = slice(self._n, self._n + n_new)
+        self._record_id[batch] = record_ids
+        self._label[batch] = labels
+        self._training_set[batch] = -1 if training_set is None else training_set
+        self._time[batch] = labeling_time
+        self._model_code[batch] = self._intern_model_names(model_names)
+        self._n += n_new
+
+    def to_frame(self):
+        """Materialize the results as a DataFrame.
+
+        The DataFrame is cached until new records are appended.
+
+        Returns
+        -------
+        pandas.DataFrame
+            DataFrame with the columns of the results table.
+        """
+        if self._frame is not None and len(self._frame) == self._n:
+            return self._frame
+
+        n = self._n
+        frame = pd.DataFrame(
+            {
+                "record_id": self._record_id[:n].copy(),
+                "label": self._label[:n].copy(),
+                **{col: self[col] for col in self.MODEL_NAME_COLUMNS},
+                "training_set": self["training_set"],
+                "time": self._time[:n].copy(),
+                "note": pd.Series([None] * n, dtype=object),
+                "tags": pd.Series([None] * n, dtype=object),
+                "user_id": pd.Series([None] * n, dtype=object),
+            }
+        )
+        self._frame = frame
+        return frame
+
+
 class Simulate:
     """ASReview simulation class.
 
@@ -185,6 +370,10 @@ class Simulate:
     groups: list[tuple[int, int]] | None
         List of tuples (group_id, record_id). If this is not None, records in the same
         group will be labeled at the same time in the simulation.
+    feature_cache: FeatureCache, str, Path | None
+        Cache for the feature matrices, or the directory of the cache. Feature
+        matrices computed before with the same feature extractor, parameters and
+        data are read from the cache instead of recomputed. Default is None.
     """
 
     def __init__(
@@ -196,6 +385,7 @@ class Simulate:
         skip_transform=False,
         print_progress=True,
         groups=None,
+        feature_cache=None,
     ):
         self.X = X
         self.labels = labels
@@ -212,15 +402,15 @@ class Simulate:
                 ) from e
         self.groups = groups
 
+        if isinstance(feature_cache, (str, Path)):
+            feature_cache = FeatureCache(feature_cache)
+        self.feature_cache = feature_cache
+
     @property
     def _results(self):
         if not hasattr(self, "_Simulate__results"):
             raise AttributeError("No results. Label records or call review.")
-        return self._Simulate__results
-
-    @_results.setter
-    def _results(self, value):
-        self._Simulate__results = value
+        return self._Simulate__results.to_frame()
 
     @property
     def _last_ranking(self):
@@ -232,35 +422,39 @@ class Simulate:
     def _last_ranking(self, value):
         self._Simulate__last_ranking = value
 
+    @property
+    def _results_buffer(self):
+        if not hasattr(self, "_Simulate__results"):
+            self._Simulate__results = _ResultsBuffer(capacity=len(self.labels))
+        return self._Simulate__results
+
+    @property
+    def _labeled_mask(self):
+        if not hasattr(self, "_Simulate__labeled_mask"):
+            self._Simulate__labeled_mask = np.zeros(len(self.labels), dtype=bool)
+        return self._Simulate__labeled_mask
+
+    @property
+    def _label_values(self):
+        if not hasattr(self, "_Simulate__label_values"):
+            self._Simulate__label_values = np.asarray(self.labels)
+        return self._Simulate__label_values
+
     def review(self):
         """Start the review process."""
 
-        if not hasattr(self, "_results"):
-            self._results = pd.DataFrame(
-                columns=[
-                    "record_id",
-                    "label",
-                    "classifier",
-                    "querier",
-                    "balancer",
-                    "feature_extractor",
-                    "training_set",
-                    "time",
-                    "note",
-                    "tags",
-                    "user_id",
-                ]
-            )
+        results = self._results_buffer
+        labels = self._label_values
 
         pbar_rel = tqdm(
-            initial=sum(self._results["label"]) if hasattr(self, "_results") else 0,
-            total=sum(self.labels),
+            initial=int(results.labels.sum()),
+            total=int(labels.sum()),
             desc="Relevant records found",
             disable=not self.print_progress,
         )
         pbar_total = tqdm(
-            initial=len(self._results) if hasattr(self, "_results") else 0,
-            total=len(self.labels),
+            initial=len(results),
+            total=len(labels),
             desc="Records labeled       ",
             disable=not self.print_progress,
         )
@@ -276,14 +470,17 @@ class Simulate:
 
         for cycle in cycles:
             # first run the overall simulation until the default stopper is met
-            while not stopper.stop(self._results, self.labels) and not cycle.stop(
-                self._results, self.labels
-            ):
+            while not stopper.stop(results, labels) and not cycle.stop(results, labels):
                 # compute the feature matrix for the labeled records if not in
                 # _X_features cache
                 if not hasattr(self, "_X_features"):
                     if not self.skip_transform and cycle.feature_extractor is not None:
-                        self._X_features = cycle.transform(self.X)
+                        if self.feature_cache is not None:
+                            self._X_features = self.feature_cache.transform(
+                                cycle.feature_extractor, self.X
+                            )
+                        else:
+                            self._X_features = cycle.transform(self.X)
                     elif isinstance(self.X, pd.DataFrame):
                         self._X_features = self.X.values
                     else:
@@ -292,27 +489,41 @@ class Simulate:
                 # fit the estimator to the labeled records
                 if cycle.classifier is not None:
                     cycle.fit(
-                        self._X_features[self._results["record_id"].values],
-                        self._results["label"].values,
+                        self._X_features[results.record_ids],
+                        results.labels,
+                        record_ids=results.record_ids,
                     )
 
-                # collect the records in the pool
-                pool_record_ids = np.setdiff1d(
-                    np.arange(len(self.labels)), self._results["record_id"].values
-                )
+                # collect the records in the pool from the labeled mask, which
+                # is kept up to date when records are labeled
+                pool_record_ids = np.flatnonzero(~self._labeled_mask)
 
-                # rank the pool and convert the ranked pool to record ids
-                ranked_pool = cycle.rank(self._X_features[pool_record_ids])
-                ranked_pool_record_ids = pool_record_ids[ranked_pool]
+                # schedules that depend on the ranking need the full ranking of
+                # the pool, otherwise only the top n_query records are ranked
+                if getattr(cycle.n_query, "requires_ranking", False):
+                    ranked_pool = cycle.rank(self._X_features, pool=pool_record_ids)
+                    n_query = cycle.get_n_query(
+                        results, labels, ranking=pool_record_ids[ranked_pool]
+                    )
+                else:
+                    ranked_pool = None
+                    n_query = cycle.get_n_query(results, labels)
 
-                # label n_query records from the pool
-                n_query = cycle.get_n_query(self._results, self.labels)
                 if not isinstance(n_query, int) or n_query < 1:
                     raise ValueError(
                         f"Number of records to query should be an integer "
                         f"greater than 0, got {n_query}."
                     )
 
+                # score the full feature matrix, rank the pool and convert the
+                # ranked pool to record ids
+                if ranked_pool is None:
+                    ranked_pool = cycle.rank(
+                        self._X_features, pool=pool_record_ids, k=n_query
+                    )
+                ranked_pool_record_ids = pool_record_ids[ranked_pool]
+
+                # label n_query records from the pool
                 labeled = self.label(ranked_pool_record_ids[:n_query], cycle=cycle)
 
                 pbar_rel.update(labeled["label"].sum())
@@ -327,8 +538,8 @@ class Simulate:
             pbar_total.close()
 
             padded_results = list(
-                self._results.dropna(axis=0, subset="training_set")["label"]
-            ) + [0] * (len(self.labels) - len(self._results["label"]))
+                results.labels[results["training_set"].notna().to_numpy()]
+            ) + [0] * (len(labels) - len(results))
 
             if self.print_progress:
                 try:
@@ -348,61 +559,61 @@ class Simulate:
         record_ids: list
             The record ids to label.
 
+        Returns
+        -------
+        pandas.DataFrame
+            The results of the newly labeled records, including the records
+            labeled through their group.
         """
 
+        results = self._results_buffer
+
         if cycle is None:
-            classifier = None
-            querier = None
-            balancer = None
-            feature_extractor = None
+            model_names = (None, None, None, None)
             training_set = None
         else:
-            classifier = _get_name_from_estimator(cycle.classifier)
-            querier = _get_name_from_estimator(cycle.querier)
-            balancer = _get_name_from_estimator(cycle.balancer)
-            feature_extractor = _get_name_from_estimator(cycle.feature_extractor)
-            training_set = len(self._results)
+            model_names = (
+                _get_name_from_estimator(cycle.classifier),
+                _get_name_from_estimator(cycle.querier),
+                _get_name_from_estimator(cycle.balancer),
+                _get_name_from_estimator(cycle.feature_extractor),
+            )
+            training_set = len(results)
 
-        new_results = pd.DataFrame(
-            {
-                "record_id": record_ids,
-                "label": pd.Series(self.labels).iloc[record_ids],
-                "classifier": classifier,
-                "querier": querier,
-                "balancer": balancer,
-                "feature_extractor": feature_extractor,
-                "training_set": training_set,
-                "time": time.time(),
-                "note": None,
-                "tags": None,
-                "user_id": None,
-            }
-        )
+        record_ids = np.asarray(record_ids, dtype=np.int64)
+        labels = self._label_values[record_ids]
 
         if self.groups is not None:
-            record_info = list(new_results.itertuples(index=False, name=None))
             group_record_info = _propagate_record_info(
-                record_info=record_info,
+                record_info=list(
+                    zip(record_ids.tolist(), labels.tolist(), strict=True)
+                ),
                 groups=self.groups,
                 return_only_new=True,
             )
+            if group_record_info:
+                group_record_ids, group_labels = zip(*group_record_info, strict=True)
+                record_ids = np.concatenate([record_ids, group_record_ids])
+                labels = np.concatenate([labels, group_labels])
 
-            new_results = pd.concat(
-                [
-                    new_results,
-                    pd.DataFrame(group_record_info, columns=new_results.columns),
-                ],
-            )
-
-        if not hasattr(self, "_results") or self._results.empty:
-            self._results = new_results
-        else:
-            self._results = pd.concat(
-                [self._results, new_results],
-                ignore_index=True,
-            )
+        labeling_time = time.time()
+        self._labeled_mask[record_ids] = True
+        results.append(record_ids, labels, model_names, training_set, labeling_time)
 
-        return new_results
+        return pd.DataFrame(
+            {
+                "record_id": record_ids,
+                "label": labels,
+                **dict(
+                    zip(_ResultsBuffer.MODEL_NAME_COLUMNS, model_names, strict=True)
+                ),
+                "training_set": training_set,
+                "time": labeling_time,
+                "note": None,
+                "tags": None,
+                "user_id": None,
+            }
+        )
 
     def to_sql(self, fp):
         """Write the data a sql file.
@@ -18,6 +18,7 @@ import hmac
 import json
 import logging
 import math
+import mimetypes
 import secrets
 import shutil
 import socket
@@ -32,16 +33,15 @@ import datahugger
 import numpy as np
 import pandas as pd
 from flask import Blueprint
+from flask import Response
 from flask import abort
 from flask import current_app
 from flask import jsonify
 from flask import request
 from flask import after_this_request
 from flask import send_file
+from flask import stream_with_context
 from flask_login import current_user
-from sklearn.feature_extraction.text import CountVectorizer
-from sklearn.naive_bayes import MultinomialNB
-from sklearn.utils import compute_sample_weight
 from sqlalchemy import and_
 from sqlalchemy.exc import SQLAlchemyError
 from werkzeug.exceptions import InternalServerError
@@ -52,7 +52,6 @@ from asreview.data import CSVWriter
 from asreview.data import ExcelWriter
 from asreview.data import RISReader
 from asreview.data import TSVWriter
-from asreview.data.search import fuzzy_find
 from asreview.data.utils import convert_ris_list_columns_to_string
 from asreview.data.utils import duplicated
 from asreview.datasets import DatasetManager
@@ -304,6 +303,7 @@ def api_create_project():  # noqa: F401
 
         except Exception as err:
             try:
+                project.close()
                 shutil.rmtree(get_project_path(project_id))
             except Exception:
                 pass
@@ -527,13 +527,10 @@ def api_search_data(project):  # noqa: F401
     if not q:
         return jsonify({"result": []})
 
-    search_data = project.db.input[["title", "authors", "keywords"]]
-
     with project.db as db:
         labeled_record_ids = db.get_results_table()["record_id"].to_list()
 
-    result_ids = fuzzy_find(
-        search_data,
+    result_ids = project.db.input.search(
         q,
         max_return=max_results,
         exclude=labeled_record_ids,
@@ -562,50 +559,49 @@ def api_get_labeled(project):  # noqa: F401
     filters = request.args.getlist("filter", type=str)
     latest_first = request.args.get("latest_first", default=1, type=int)
 
-    with project.db as db:
-        if "is_prior" in filters:
-            state_data = db.get_priors()
-        else:
-            state_data = db.get_results_table()
+    labeled_filters = {
+        "subset": subset,
+        "has_note": "has_note" in filters,
+        "is_prior": "is_prior" in filters,
+    }
 
-    if subset == "relevant":
-        state_data = state_data[state_data["label"] == 1]
-    elif subset == "irrelevant":
-        state_data = state_data[state_data["label"] == 0]
-    else:
-        state_data = state_data[~state_data["label"].isnull()]
-
-    if "has_note" in filters:
-        state_data = state_data[~state_data["note"].isnull()]
+    with project.db as db:
+        # count labeled records and max pages
+        count = db.count_labeled(**labeled_filters)
+        if count == 0:
+            payload = {
+                "count": 0,
+                "next_page": None,
+                "previous_page": None,
+                "result": [],
+            }
+            return jsonify(payload)
 
-    if latest_first == 1:
-        state_data = state_data.iloc[::-1]
+        max_page = math.ceil(count / per_page)
 
-    # count labeled records and max pages
-    if len(state_data) == 0:
-        payload = {
-            "count": 0,
-            "next_page": None,
-            "previous_page": None,
-            "result": [],
-        }
-        return jsonify(payload)
+        if page is not None:
+            if page > max_page:
+                return abort(404)
 
-    max_page = math.ceil(len(state_data) / per_page)
+            limit = per_page
+            offset = (page - 1) * per_page
 
-    if page is not None:
-        if page > max_page:
-            return abort(404)
+            next_page = page + 1 if page < max_page else None
+            previous_page = page - 1 if page > 1 else None
+        else:
+            limit = None
+            offset = 0
 
-        idx_start = (page - 1) * per_page
-        idx_end = page * per_page
-        state_data = state_data.iloc[idx_start:idx_end].copy()
+            next_page = None
+            previous_page = None
 
-        next_page = page + 1 if page < max_page else None
-        previous_page = page - 1 if page > 1 else None
-    else:
-        next_page = None
-        previous_page = None
+        state_data = db.get_labeled(
+            **labeled_filters,
+            latest_first=latest_first == 1,
+            limit=limit,
+            offset=offset,
+        )
+        records = db.input.get_records(state_data["record_id"].to_list())
 
     if current_app.config.get("AUTHENTICATION", True):
         project_entry = Project.query.filter(
@@ -623,12 +619,12 @@ def api_get_labeled(project):  # noqa: F401
             for i, u in users.items()
         }
 
-    records = project.db.input.get_records(state_data["record_id"].to_list())
+    tags_form = read_tags_data(project)
     result = []
-    for (_, state), record in zip(state_data.iterrows(), records):
+    for state, record in zip(state_data.to_dict("records"), records, strict=True):
         record_d = asdict(record)
-        record_d["state"] = state.to_dict()
-        record_d["tags_form"] = read_tags_data(project)
+        record_d["state"] = state
+        record_d["tags_form"] = tags_form
 
         if current_app.config.get("AUTHENTICATION", True):
             record_d["state"]["user"] = users.get(record_d["state"]["user_id"], None)
@@ -659,22 +655,24 @@ def api_get_labeled_stats(project):  # noqa: F401
 
     try:
         with project.db as db:
-            data = db.get_results_table(["label", "querier"])
-        data_prior = data[data["querier"].isnull()]
+            counts_all = db.get_label_counts()
+            counts_no_priors = db.get_label_counts(priors=False)
+        counts_prior = {
+            label: n - counts_no_priors[label] for label, n in counts_all.items()
+        }
 
-        # If the 'include_priors' flag is set to False, filter out records that have a
-        # query strategy marked as prior.
-        if not include_priors:
-            data = data[data["querier"] != "prior"]
+        # If the 'include_priors' flag is set to False, leave out the records of the
+        # prior knowledge.
+        counts = counts_all if include_priors else counts_no_priors
 
         return jsonify(
             {
-                "n": len(data),
-                "n_inclusions": int(sum(data["label"] == 1)),
-                "n_exclusions": int(sum(data["label"] == 0)),
-                "n_prior": len(data_prior),
-                "n_prior_inclusions": int(sum(data_prior["label"] == 1)),
-                "n_prior_exclusions": int(sum(data_prior["label"] == 0)),
+                "n": sum(counts.values()),
+                "n_inclusions": counts[1],
+                "n_exclusions": counts[0],
+                "n_prior": sum(counts_prior.values()),
+                "n_prior_inclusions": counts_prior[1],
+                "n_prior_exclusions": counts_prior[0],
             }
         )
     except FileNotFoundError:
@@ -746,33 +744,9 @@ def api_get_wordcounts(project):  # noqa: F401
     """Get the word counts used in the project"""
 
     with project.db as db:
-        df_data = db.input[["record_id", "abstract"]]
-        results = db.get_results_table(columns=["record_id", "label"])
+        relevant, irrelevant = db.word_counts.top_terms(15)
 
-    df_data_labels = df_data.merge(results, on="record_id", how="inner")
-
-    try:
-        count_vectorizer = CountVectorizer(ngram_range=(1, 2), stop_words="english")
-        fm = count_vectorizer.fit_transform(df_data_labels["abstract"])
-
-        nb = MultinomialNB()
-        nb.fit(
-            fm,
-            df_data_labels["label"],
-            sample_weight=compute_sample_weight("balanced", df_data_labels["label"]),
-        )
-
-        weights = nb.feature_log_prob_[1, :] - nb.feature_log_prob_[0, :]
-        feature_names = count_vectorizer.get_feature_names_out()
-
-        return jsonify(
-            {
-                "relevant": feature_names[np.argsort(weights)][:15:-1].tolist(),
-                "irrelevant": feature_names[np.argsort(weights)][:15].tolist(),
-            }
-        )
-    except (ValueError, IndexError):
-        return jsonify({"relevant": None, "irrelevant": None})
+    return jsonify({"relevant": relevant, "irrelevant": irrelevant})
 
 
 @bp.route("/projects/<project_id>/train", methods=["POST"])
@@ -885,7 +859,8 @@ def api_import_project():
             raise ValueError("Invalid ASReview project file") from err
 
     project_file_version = detect_version(project_config)
-    if project_file_version < asr.Project.VERSION:
+    # the model configuration changed in project file version 3
+    if project_file_version < 3:
         warnings.append(
             "This project was created in an older version of ASReview LAB (version"
             f" {project_file_version}). The active learning model has been reset to the"
@@ -1029,103 +1004,122 @@ def update_tag_group(project, group_id):
         return jsonify(message="Failed to update tag group."), 500
 
 
-def _flatten_tags(results, tags_config):
-    if tags_config is None:
-        del results["tags"]
-        return results
+def _tag_columns(db):
+    """Names of the tag columns of an export, in order of first use."""
+    columns = {}
+    # The distinct tag values are few, so only those are read and parsed.
+    for (tags,) in db._conn.execute(
+        "SELECT tags FROM results WHERE label IS NOT NULL AND tags IS NOT NULL "
+        "GROUP BY tags ORDER BY MIN(rowid)"
+    ):
+        for tag in _flatten_tag_values(json.loads(tags)):
+            columns[tag] = None
+    return list(columns)
 
-    df_tags = []
-    for _, row in results["tags"].items():
-        # fix migration of projects without list-like values in tags column
-        if not isinstance(row, list):
-            df_tags.append({})
-            continue
 
-        tags = {}
-        for group in row:
-            for tag in group["values"]:
-                tags[f"tag_{group['export']}_{tag['export']}"] = int(
-                    tag.get("checked", False)
-                )
+def _flatten_tag_values(row):
+    # fix migration of projects without list-like values in tags column
+    if not isinstance(row, list):
+        return {}
+
+    tags = {}
+    for group in row:
+        for tag in group["values"]:
+            tags[f"tag_{group['export']}_{tag['export']}"] = int(
+                tag.get("checked", False)
+            )
+    return tags
 
-        df_tags.append(tags)
+
+def _flatten_tags(results, tag_columns):
+    if tag_columns is None:
+        del results["tags"]
+        return results
 
     return pd.concat(
         [
             results.drop("tags", axis=1),
-            pd.DataFrame(df_tags, index=results.index, dtype="Int64"),
+            pd.DataFrame(
+                [_flatten_tag_values(row) for row in results["tags"]],
+                columns=tag_columns,
+                index=results.index,
+                dtype="Int64",
+            ),
         ],
         axis=1,
     )
 
 
+def _export_chunk(
+    df_user_input_data,
+    results,
+    tag_columns,
+    users=None,
+    export_name=True,
+    export_email=True,
+    export_groups=True,
+    convert_ris_lists=False,
+):
+    """Join a chunk of exported records with their results."""
+    results = _flatten_tags(results.set_index("record_id"), tag_columns)
+
+    results["time"] = pd.to_datetime(results["time"], unit="s").dt.strftime(
+        "%Y-%m-%d %H:%M:%S"
+    )
+
+    # add user information
+    if users is not None:
+        if export_name:
+            results["user_name"] = results["user_id"].map(
+                lambda x: users.get(x, {}).get("name", None)
+            )
+        if export_email:
+            results["user_email"] = results["user_id"].map(
+                lambda x: users.get(x, {}).get("email", None)
+            )
+
+    del results["user_id"]
+    group_ids = results.pop("group_id")
+
+    df_export = df_user_input_data.loc[results.index.to_list()].copy()
+    # If the input is RIS and the output is CSV or Excel, we need to convert list
+    # columns to strings to avoid too long lists being truncated and leading to corrupt
+    # files.
+    if convert_ris_lists:
+        df_export = convert_ris_list_columns_to_string(df_export)
+
+    if export_groups:
+        df_export["asreview_group_id"] = group_ids.to_numpy()
+
+    return df_export.join(results.add_prefix("asreview_"))
+
+
 @bp.route("/projects/<project_id>/export_dataset", methods=["GET"])
 @login_required
 @project_authorization
 def api_export_dataset(project):
-    """Export dataset with relevant/irrelevant labels"""
+    """Export dataset with relevant/irrelevant labels
+
+    The records are read from the database and written to the response in chunks,
+    in the order of the export. Writers without support for chunks, like the Excel
+    writer, write the whole dataset to a temporary file first.
+    """
     file_format = request.args.get("format", default="csv", type=str)
     export_name = request.args.get("export_name", default=1, type=int)
     export_email = request.args.get("export_email", default=1, type=int)
     export_groups = request.args.get("export_groups", default=1, type=int)
     collections = request.args.getlist("collections", type=str)
 
-    with project.db as db:
-        df_results = db.get_results_table(grouped=True).set_index("record_id")
-        df_unlabeled = db.get_unlabeled()
-        df_groups = pd.read_sql_query(
-            f"SELECT record_id, group_id FROM {db.record_table_name}",
-            db._conn,
-        ).set_index("record_id")
-
-    export_order = []
-
-    if "relevant" in collections:
-        export_order.extend(df_results[df_results["label"] == 1].index.to_list())
-
-    if "not_seen" in collections:
-        export_order.extend(df_unlabeled.to_list())
-
-    if "irrelevant" in collections:
-        export_order.extend(df_results[df_results["label"] == 0].index.to_list())
-
-    # group_to_members maps each group representative (group_id == record_id)
-    # to all record_ids in that group.
-    group_to_members = (
-        df_groups.reset_index().groupby("group_id")["record_id"].apply(list).to_dict()
-    )
-    if export_groups:
-        # Expand each representative to include all group members.
-        export_order = [
-            rid for rep in export_order for rid in group_to_members.get(rep, [rep])
-        ]
-    else:
-        # Keep only group representatives, dropping any group members that may
-        # have ended up in export_order (e.g. from df_unlabeled).
-        export_order = [rid for rid in export_order if rid in group_to_members]
-
-    df_results = _flatten_tags(
-        df_results,
-        read_tags_data(project),
+    download_name = (
+        f"asreview_{'+'.join(collections)}_"
+        f"{project.config['name'].replace(' ', '_')}.{file_format}"
     )
 
-    df_results["time"] = pd.to_datetime(df_results["time"], unit="s").dt.strftime(
-        "%Y-%m-%d %H:%M:%S"
-    )
-
-    # remove model results, can be implemented later with advanced export
-    df_results.drop(
-        columns=[
-            "classifier",
-            "querier",
-            "balancer",
-            "feature_extractor",
-            "training_set",
-        ],
-        inplace=True,
-    )
+    with project.db as db:
+        tag_columns = _tag_columns(db) if read_tags_data(project) is not None else None
 
     # add user information
+    users = None
     if current_app.config.get("AUTHENTICATION", True):
         project_entry = Project.query.filter(
             Project.project_id == project.project_id
@@ -1134,47 +1128,49 @@ def api_export_dataset(project):
             **{u.id: {**u.summarize()} for u in project_entry.collaborators},
             project_entry.owner.id: {**project_entry.owner.summarize()},
         }
-        if export_name:
-            df_results["user_name"] = df_results["user_id"].map(
-                lambda x: users.get(x, {}).get("name", None)
-            )
-        if export_email:
-            df_results["user_email"] = df_results["user_id"].map(
-                lambda x: users.get(x, {}).get("email", None)
-            )
-
-    del df_results["user_id"]
 
     df_user_input_data = project.read_input_data()
-
     df_user_input_data = df_user_input_data.loc[
         :, ~df_user_input_data.columns.str.startswith("asreview_")
     ]
 
-    df_user_input_data = df_user_input_data.join(df_groups)
-    # If the input is RIS and the output is CSV or Excel, we need to convert list
-    # columns to strings to avoid too long lists being truncated and leading to corrupt
-    # files.
     input_reader = project.get_input_data_reader()
     writer = load_extension("writers", f".{file_format}")
-    if issubclass(input_reader, RISReader) and issubclass(
+    convert_ris_lists = issubclass(input_reader, RISReader) and issubclass(
         writer, (CSVWriter, TSVWriter, ExcelWriter)
-    ):
-        df_user_input_data = convert_ris_list_columns_to_string(df_user_input_data)
+    )
 
-    df_export = df_user_input_data.join(
-        df_results.add_prefix("asreview_"), on="group_id", how="left"
-    ).loc[export_order]
+    def export_chunks():
+        with project.db as db:
+            for results in db.iter_export_results(
+                collections, grouped=bool(export_groups)
+            ):
+                yield _export_chunk(
+                    df_user_input_data,
+                    results,
+                    tag_columns,
+                    users=users,
+                    export_name=export_name,
+                    export_email=export_email,
+                    export_groups=export_groups,
+                    convert_ris_lists=convert_ris_lists,
+                )
 
-    if export_groups:
-        df_export = df_export.rename(columns={"group_id": "asreview_group_id"})
-    else:
-        df_export = df_export.drop(columns=["group_id"])
+    if hasattr(writer, "write_data_chunks"):
+        response = Response(
+            stream_with_context(writer.write_data_chunks(export_chunks())),
+            mimetype=mimetypes.guess_type(download_name)[0],
+        )
+        response.headers.set(
+            "Content-Disposition", "attachment", filename=download_name
+        )
+        response.cache_control.no_cache = True
+        return response
 
     tmp_path = tempfile.mkdtemp()
     tmp_path_dataset = Path(tmp_path, f"export_dataset.{file_format}")
 
-    writer.write_data(df_export, tmp_path_dataset)
+    writer.write_data(pd.concat(export_chunks()), tmp_path_dataset)
 
     @after_this_request
     def cleanup(response):
@@ -1185,10 +1181,7 @@ def api_export_dataset(project):
         tmp_path_dataset,
         as_attachment=True,
         max_age=0,
-        download_name=(
-            f"asreview_{'+'.join(collections)}_"
-            f"{project.config['name'].replace(' ', '_')}.{file_format}"
-        ),
+        download_name=download_name,
     )
 
 
@@ -1234,27 +1227,31 @@ def api_get_progress_info(project):  # noqa: F401
 
     try:
         with project.db as db:
-            labels = db.get_results_table(priors=include_priors)["label"]
-            labels_without_priors = db.get_results_table(priors=False)["label"]
-            n_records = len(project.db.input)
-        n_priors = len(labels) - len(labels_without_priors)
+            counts = db.get_label_counts(priors=include_priors)
+            counts_no_priors = db.get_label_counts(priors=False)
+            n_records = len(db.input)
+            n_included_records = (
+                db.input.count_included()
+                if project.config.get("mode") == asr.Project.MODE_SIMULATE
+                else None
+            )
 
     except (FileNotFoundError, ValueError, ProjectError):
-        labels = np.array([])
-        labels_without_priors = np.array([])
+        counts = {0: 0, 1: 0}
+        counts_no_priors = {0: 0, 1: 0}
         n_records = 0
+        n_included_records = None
 
-    if (
-        project.config.get("mode") == asr.Project.MODE_SIMULATE
-        and project.db.input["included"].sum() == labels.sum()
-    ):
+    n_labels = sum(counts.values())
+    n_priors = n_labels - sum(counts_no_priors.values())
+
+    if n_included_records is not None and n_included_records == counts[1]:
         return jsonify(
             {
-                "n_included": int(sum(labels == 1)),
-                "n_excluded": n_records - int(sum(labels == 1)),
-                "n_included_no_priors": int(sum(labels_without_priors == 1)),
-                "n_excluded_no_priors": int(sum(labels_without_priors == 0))
-                + (n_records - len(labels)),
+                "n_included": counts[1],
+                "n_excluded": n_records - counts[1],
+                "n_included_no_priors": counts_no_priors[1],
+                "n_excluded_no_priors": counts_no_priors[0] + (n_records - n_labels),
                 "n_records": n_records,
                 "n_records_no_priors": n_records - n_priors,
                 "n_pool": 0,
@@ -1263,13 +1260,13 @@ def api_get_progress_info(project):  # noqa: F401
 
     return jsonify(
         {
-            "n_included": int(sum(labels == 1)),
-            "n_excluded": int(sum(labels == 0)),
-            "n_included_no_priors": int(sum(labels_without_priors == 1)),
-            "n_excluded_no_priors": int(sum(labels_without_priors == 0)),
+            "n_included": counts[1],
+            "n_excluded": counts[0],
+            "n_included_no_priors": counts_no_priors[1],
+            "n_excluded_no_priors": counts_no_priors[0],
             "n_records": n_records,
             "n_records_no_priors": n_records - n_priors,
-            "n_pool": n_records - len(labels),
+            "n_pool": n_records - n_labels,
         }
     )
 
@@ -1286,8 +1283,8 @@ def api_get_metrics(project):
     n_records = len(project.db.input)
 
     with project.db as db:
-        labels_no_priors = db.get_results_table(priors=False)["label"]
-        n_priors = len(db.get_priors())
+        labels_no_priors = db.get_results_table("label", priors=False)["label"]
+        n_priors = sum(db.get_label_counts().values()) - len(labels_no_priors)
 
     labels_padded = list(labels_no_priors) + [0] * (
         n_records - n_priors - len(labels_no_priors)
@@ -1354,26 +1351,53 @@ def api_mutate_stopper(project):  # noqa: F401
 @login_required
 @project_authorization
 def api_get_progress_data(project):  # Consolidated endpoint
-    """Get raw progress data of a project"""
+    """Get raw progress data of a project
+
+    Clients that keep the labels of an earlier request can pass its cursor and
+    version to get only the labels added since. The response then contains the new
+    labels, the cursor and version for the next request and the number of
+    remaining records that count as irrelevant. If the version changed, the earlier
+    labels are stale and all labels are returned.
+    """
 
     include_priors = request.args.get("priors", False, type=bool)
+    cursor = request.args.get("cursor", None, type=int)
+    version = request.args.get("version", None, type=int)
 
-    with project.db as db:
-        labels = db.get_results_table("label", priors=include_priors)
-        labels_with_priors = db.get_results_table("label", priors=True)
+    if cursor is not None and cursor < 0:
+        return jsonify(message="Invalid cursor"), 400
 
-    if (
-        project.config.get("mode") == asr.Project.MODE_SIMULATE
-        and project.db.input["included"].sum() == labels_with_priors["label"].sum()
-    ):
-        labels = pd.DataFrame(
-            {
-                "label": labels["label"].to_list()
-                + np.zeros(len(project.db.input) - len(labels)).tolist(),
-            }
+    with project.db as db:
+        # Read the version before the labels, so a change in between shows up as a
+        # new version in the next request.
+        current_version = db.label_sequence_version
+        labels, next_cursor = db.get_label_sequence(
+            priors=include_priors,
+            after=cursor if cursor is not None and version == current_version else 0,
         )
+        n_labels = sum(db.get_label_counts(priors=include_priors).values())
+
+        if project.config.get("mode") == asr.Project.MODE_SIMULATE:
+            n_records = len(db.input)
+            is_complete = db.input.count_included() == db.get_label_counts()[1]
+        else:
+            is_complete = False
 
-    return jsonify(labels.to_dict(orient="records"))
+    # When all relevant records are found, the remaining records of a simulation
+    # count as irrelevant.
+    n_remaining = n_records - n_labels if is_complete else 0
+
+    if cursor is None:
+        return jsonify([{"label": label} for label in labels + [0] * n_remaining])
+
+    return jsonify(
+        {
+            "labels": labels,
+            "cursor": next_cursor,
+            "version": current_version,
+            "n_remaining": n_remaining,
+        }
+    )
 
 
 @bp.route("/projects/<project_id>/record/<record_id>", methods=["POST", "PUT"])
@@ -1522,6 +1546,7 @@ def api_delete_project(project):  # noqa: F401
                         ), 403
 
             # and remove the folder
+            project.close()
             shutil.rmtree(project.project_path)
 
         except Exception as err:
@@ -219,6 +219,8 @@ def lab_entry_point(argv):
             start_task_server,
             shutdown_task_server,
             getattr(args, "verbose", 0),
+            app.config.get("TASK_MANAGER_PERSISTENT", None),
+            app.config.get("TASK_MANAGER_CACHE_SIZE", None),
         ),
     )
     process.start()
@@ -2,6 +2,7 @@ import argparse
 import os
 import textwrap
 
+from asreview.webapp._task_manager.task_manager import DEFAULT_TASK_MANAGER_CACHE_SIZE
 from asreview.webapp._task_manager.task_manager import DEFAULT_TASK_MANAGER_HOST
 from asreview.webapp._task_manager.task_manager import DEFAULT_TASK_MANAGER_PORT
 from asreview.webapp._task_manager.task_manager import DEFAULT_TASK_MANAGER_WORKERS
@@ -10,7 +11,8 @@ from asreview.webapp._task_manager.task_manager import run_task_manager
 description = """\
 This entry point launches an instance of ASReview's task manager. You can
 specify the host, port, and number of workers using environment variables
-(ASREVIEW_LAB_TASK_MANAGER_[WORKERS|HOST|PORT]) or CLI parameters, with
+(ASREVIEW_LAB_TASK_MANAGER_[WORKERS|HOST|PORT|PERSISTENT|CACHE_SIZE]) or CLI
+parameters, with
 environment variables taking precedence.
 """
 
@@ -42,6 +44,19 @@ def main(argv):
         type=int,
         help=f"Port of task manager, defaults to {DEFAULT_TASK_MANAGER_PORT}.",
     )
+    parser.add_argument(
+        "--persistent",
+        action="store_true",
+        help="Run tasks in long-lived workers that keep the feature matrix and "
+        "model of recently trained projects in memory.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        default=DEFAULT_TASK_MANAGER_CACHE_SIZE,
+        type=int,
+        help="Number of projects a persistent worker keeps in memory, defaults "
+        f"to {DEFAULT_TASK_MANAGER_CACHE_SIZE}.",
+    )
     args = parser.parse_args(argv)
 
     run_task_manager(
@@ -49,4 +64,9 @@ def main(argv):
         host=os.getenv("ASREVIEW_LAB_TASK_MANAGER_HOST", args.host),
         port=os.getenv("ASREVIEW_LAB_TASK_MANAGER_PORT", args.port),
         verbose=int(os.getenv("ASREVIEW_LAB_TASK_MANAGER_VERBOSE", args.verbose)),
+        persistent_workers=os.getenv(
+            "ASREVIEW_LAB_TASK_MANAGER_PERSISTENT", str(args.persistent)
+        ).lower()
+        in ("1", "true"),
+        cache_size=os.getenv("ASREVIEW_LAB_TASK_MANAGER_CACHE_SIZE", args.cache_size),
     )
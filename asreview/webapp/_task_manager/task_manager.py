@@ -15,11 +15,14 @@ from sqlalchemy.orm import sessionmaker
 from asreview.webapp import asreview_path
 from asreview.webapp._task_manager.models import Base
 from asreview.webapp._task_manager.models import ProjectQueueModel
+from asreview.webapp._tasks import DEFAULT_MODEL_CACHE_SIZE
+from asreview.webapp._tasks import ModelCache
 from asreview.webapp._tasks import run_task
 
 DEFAULT_TASK_MANAGER_HOST = "localhost"
 DEFAULT_TASK_MANAGER_PORT = 5101
 DEFAULT_TASK_MANAGER_WORKERS = 2
+DEFAULT_TASK_MANAGER_CACHE_SIZE = DEFAULT_MODEL_CACHE_SIZE
 
 # Set up a module-level logger for the task manager
 logger = logging.getLogger("asreview.task_manager")
@@ -87,16 +90,66 @@ class RunModelProcess(mp.Process):
                 logger.error(f"Failed to send payload: {e}")
 
 
+class PersistentWorkerProcess(RunModelProcess):
+    """Long-lived process that runs the tasks of multiple projects.
+
+    The worker keeps the feature matrix and fitted model of the projects it
+    trained most recently in a bounded LRU cache. A retrain after a new label
+    therefore skips the process startup, the loading of the feature matrix
+    and, for incremental learning cycles, the fit from scratch.
+    """
+
+    def __init__(
+        self,
+        func,
+        cache_size=DEFAULT_TASK_MANAGER_CACHE_SIZE,
+        host=DEFAULT_TASK_MANAGER_HOST,
+        port=DEFAULT_TASK_MANAGER_PORT,
+    ):
+        super().__init__(func, host=host, port=port)
+        self.cache_size = cache_size
+        self.task_queue = mp.Queue()
+
+    def submit(self, project_id, simulation):
+        self.task_queue.put((project_id, simulation))
+
+    def stop(self):
+        self.task_queue.put(None)
+
+    def run(self):
+        _setup_logging(verbose=1)
+        model_cache = ModelCache(max_size=self.cache_size)
+
+        for task in iter(self.task_queue.get, None):
+            project_id, simulation = task
+            payload = {"action": "remove", "project_id": project_id}
+            try:
+                self.func(project_id, simulation, model_cache=model_cache)
+            except Exception:
+                payload["action"] = "failure"
+            finally:
+                if self.host and self.port:
+                    self._send_payload(payload)
+
+
 class TaskManager:
     def __init__(
         self,
         max_workers=DEFAULT_TASK_MANAGER_WORKERS,
         host=DEFAULT_TASK_MANAGER_HOST,
         port=DEFAULT_TASK_MANAGER_PORT,
+        persistent_workers=False,
+        cache_size=DEFAULT_TASK_MANAGER_CACHE_SIZE,
     ):
         self.running_processes = {}  # project_id -> Process object
         self.max_workers = int(max_workers)
 
+        # long-lived workers that keep the model state of recent projects
+        self.persistent_workers = bool(persistent_workers)
+        self.cache_size = int(cache_size)
+        self.workers = []
+        self.project_workers = {}  # project_id -> worker of the last task
+
         # set up parameters for socket endpoint
         self.host = host
         self.port = int(port)
@@ -208,6 +261,8 @@ class TaskManager:
                     )
 
             self.running_processes.clear()
+            # terminated persistent workers are replaced on the next task
+            self.workers = [w for w in self.workers if w.is_alive()]
             logger.info("All pending tasks terminated and cleared")
         else:
             logger.info("No pending tasks to reset")
@@ -235,8 +290,52 @@ class TaskManager:
         if project_id not in self.running_processes:
             self.running_processes[project_id] = process
 
+    def _get_worker(self, project_id):
+        """Get an idle persistent worker, preferably the last one of the project."""
+        self.workers = [w for w in self.workers if w.is_alive()]
+
+        busy = list(self.running_processes.values())
+        idle = [w for w in self.workers if w not in busy]
+
+        worker = self.project_workers.get(project_id)
+        if worker in idle:
+            return worker
+        elif idle:
+            return idle[0]
+
+        worker = PersistentWorkerProcess(
+            func=run_task,
+            cache_size=self.cache_size,
+            host=self.host,
+            port=self.port,
+        )
+        worker.start()
+        self.workers.append(worker)
+        logger.info(f"Persistent worker started (pid {worker.pid})")
+        return worker
+
+    def stop_workers(self):
+        """Stop the persistent workers."""
+        for worker in self.workers:
+            if worker.is_alive():
+                worker.stop()
+        for worker in self.workers:
+            worker.join(timeout=5.0)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+        self.workers = []
+        self.project_workers = {}
+
     def __execute_job(self, project_id, simulation):
         try:
+            if self.persistent_workers:
+                p = self._get_worker(project_id)
+                p.submit(project_id, simulation)
+                self.project_workers[project_id] = p
+                logger.info(f"Task for project {project_id} sent to worker {p.pid}")
+                return p
+
             # run the simulation / train task
             p = RunModelProcess(
                 func=run_task,
@@ -497,6 +596,8 @@ class TaskManager:
             logger.info("Shutting down task manager...")
             mp_shutdown_event.set()
 
+        self.stop_workers()
+
         # Close the server socket
         if self.server_socket:
             try:
@@ -536,6 +637,8 @@ def run_task_manager(
     mp_start_event=None,
     mp_shutdown_event=None,
     verbose=0,
+    persistent_workers=None,
+    cache_size=None,
 ):
     kwargs = {}
     if max_workers is not None:
@@ -544,6 +647,10 @@ def run_task_manager(
         kwargs["host"] = host
     if port is not None:
         kwargs["port"] = port
+    if persistent_workers is not None:
+        kwargs["persistent_workers"] = persistent_workers
+    if cache_size is not None:
+        kwargs["cache_size"] = cache_size
 
     _setup_logging(verbose=verbose)
 
@@ -12,30 +12,123 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+from collections import OrderedDict
+from dataclasses import asdict
+
+import numpy as np
+
 import asreview as asr
+from asreview.models.feature_cache import feature_cache_key
 from asreview.models.queriers import TopDown
 from asreview.models.stoppers import IsFittable
 from asreview.simulation.simulate import Simulate
 from asreview.webapp.utils import get_project_path
 
+DEFAULT_MODEL_CACHE_SIZE = 8
+
+
+class ModelCache:
+    """Bounded LRU cache of the model state of projects.
+
+    A long-lived worker keeps the feature matrix and the fitted learning cycle
+    of the projects it trained most recently. The next training task of the
+    project reuses them instead of loading the matrix and fitting a new
+    model from scratch.
+
+    Arguments
+    ---------
+    max_size: int
+        Maximum number of projects to keep the state of.
+    """
+
+    def __init__(self, max_size=DEFAULT_MODEL_CACHE_SIZE):
+        self.max_size = max_size
+        self._states = OrderedDict()
+
+    def __len__(self):
+        return len(self._states)
+
+    def __contains__(self, project_id):
+        return project_id in self._states
+
+    def get(self, project_id):
+        if project_id not in self._states:
+            return None
+
+        self._states.move_to_end(project_id)
+        return self._states[project_id]
+
+    def put(self, project_id, state):
+        self._states[project_id] = state
+        self._states.move_to_end(project_id)
+
+        while len(self._states) > self.max_size:
+            self._states.popitem(last=False)
+
+    def pop(self, project_id):
+        return self._states.pop(project_id, None)
+
 
 def _read_cycle_data(project):
     return asr.ActiveLearningCycleData(**project.get_model_config())
 
 
-def run_task(project_id, simulation=False):
+def _is_batch_complete(cycle, labeled, training_set, n_records):
+    """Check if the records labeled since the last model complete a batch.
+
+    The n_query of the learning cycle determines how many records are labeled
+    between two models. The records labeled since the last model are passed
+    as ranking to the n_query schedule, together with their labels.
+
+    Parameters
+    ----------
+    cycle: ActiveLearningCycle
+        The active learning cycle with the n_query (schedule).
+    labeled: pd.DataFrame
+        The labeled records in labeling order.
+    training_set: int | None
+        Number of labeled records used for the last model. None if no model
+        was trained yet.
+    n_records: int
+        Number of records in the dataset.
+
+    Returns
+    -------
+    bool
+        True if the model should be retrained.
+    """
+    if training_set is None:
+        return True
+
+    batch = labeled.iloc[training_set:]
+    if batch.empty:
+        # nothing was labeled since the last model, for example after a change
+        # of the model
+        return False
+
+    labels = np.full(n_records, np.nan)
+    labels[labeled["record_id"].values] = labeled["label"].values
+
+    n_query = cycle.get_n_query(
+        labeled.iloc[:training_set], labels, ranking=batch["record_id"].values
+    )
+    return len(batch) >= n_query
+
+
+def run_task(project_id, simulation=False, model_cache=None):
     project_path = get_project_path(project_id)
 
     with asr.Project(project_path, project_id=project_id) as project:
         if simulation:
             run_simulation(project)
         else:
-            run_model(project)
+            run_model(project, model_cache=model_cache)
 
     return True
 
 
-def run_model(project):
+def run_model(project, model_cache=None):
     with project.db as db:
         if not db.exist_new_labeled_records:
             return
@@ -45,28 +138,61 @@ def run_model(project):
         if labeled["label"].value_counts().shape[0] < 2:
             return
 
+        training_set = db.get_last_training_set()
+        n_records = len(db.input)
+
     try:
         cycle_data = _read_cycle_data(project)
+        cycle_key = json.dumps(asdict(cycle_data), sort_keys=True, default=str)
+        record_ids = labeled["record_id"].values
+
+        # reuse the fitted cycle of the previous task if the configuration is
+        # the same and records were only added since
+        state = model_cache.get(project.project_id) if model_cache is not None else None
+        if (
+            state is not None
+            and state["cycle_key"] == cycle_key
+            and np.array_equal(
+                record_ids[: len(state["record_ids"])], state["record_ids"]
+            )
+        ):
+            cycle = state["cycle"]
+        else:
+            cycle = asr.ActiveLearningCycle.from_meta(
+                cycle_data, skip_feature_extraction=True
+            )
+
+        # Only train a new model if the batch of records is complete:
+        if not _is_batch_complete(cycle, labeled, training_set, n_records):
+            return
 
         if cycle_data.feature_extractor:
+            # the feature matrix is cached by feature extractor, parameters and
+            # data, such that changed parameters result in a new matrix
+            fm_key = feature_cache_key(
+                cycle_data.feature_extractor,
+                cycle_data.feature_extractor_param,
+                project.get_dataset_hash(),
+            )
+        else:
+            fm_key = project.get_dataset_hash()
+
+        if state is not None and state["fm_key"] == fm_key:
+            fm = state["fm"]
+        elif cycle_data.feature_extractor:
             try:
-                fm = project.get_feature_matrix(cycle_data.feature_extractor)
-                cycle = asr.ActiveLearningCycle.from_meta(
-                    cycle_data, skip_feature_extraction=True
+                fm = project.get_feature_matrix(
+                    cycle_data.feature_extractor, key=fm_key
                 )
             except ValueError:
                 cycle = asr.ActiveLearningCycle.from_meta(cycle_data)
                 fm = cycle.transform(project.db.input.get_df())
-                project.add_feature_matrix(fm, cycle.feature_extractor.name)
+                project.add_feature_matrix(fm, cycle.feature_extractor.name, key=fm_key)
         else:
-            cycle = asr.ActiveLearningCycle.from_meta(cycle_data)
             fm = project.db.input.get_df().values
 
         if cycle.classifier is not None:
-            cycle.fit(
-                fm[labeled["record_id"].values],
-                labeled["label"].values,
-            )
+            cycle.fit(fm[record_ids], labeled["label"].values, record_ids=record_ids)
 
         ranked_record_ids = cycle.rank(fm)
 
@@ -84,7 +210,21 @@ def run_model(project):
 
         project.remove_review_error()
 
+        if model_cache is not None:
+            model_cache.put(
+                project.project_id,
+                {
+                    "cycle_key": cycle_key,
+                    "cycle": cycle,
+                    "record_ids": record_ids,
+                    "fm_key": fm_key,
+                    "fm": fm,
+                },
+            )
+
     except Exception as err:
+        if model_cache is not None:
+            model_cache.pop(project.project_id)
         project.set_review_error(err)
         raise err
 
@@ -491,6 +491,29 @@ def test_get_progress_data(client, project):
     assert isinstance(r.json, list)
 
 
+# Test get progress data since an earlier request
+def test_get_progress_data_cursor(client, project):
+    au.label_random_project_data_record(client, project, 1)
+    r = au.get_project_progress_data(client, project, cursor=0)
+    assert r.status_code == 200
+    assert set(r.json) == {"labels", "cursor", "version", "n_remaining"}
+
+    data = r.json
+    au.label_random_project_data_record(client, project, 0)
+    r = au.get_project_progress_data(
+        client, project, cursor=data["cursor"], version=data["version"]
+    )
+    assert r.status_code == 200
+    assert r.json["version"] == data["version"]
+
+    # with a stale version, all labels are returned
+    r = au.get_project_progress_data(
+        client, project, cursor=r.json["cursor"], version=data["version"] - 1
+    )
+    assert r.status_code == 200
+    assert r.json["version"] == data["version"]
+
+
 # Test retrieve documents in order to review
 def test_retrieve_document_for_review(client, project):
     au.upload_label_set_and_start_model(client, project)
@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import pandas as pd
+
+import asreview as asr
+from asreview.webapp._task_manager.task_manager import PersistentWorkerProcess
+from asreview.webapp._tasks import ModelCache
+from asreview.webapp._tasks import run_model
+from asreview.webapp._tasks import run_task
+
+
+def _create_project(project_path, data_path):
+    pd.DataFrame(
+        {
+            "title": [
+                f"title {i} {'relevant' if i % 10 == 0 else ''}" for i in range(50)
+            ],
+            "abstract": [f"abstract {i % 7}" for i in range(50)],
+            "included": [int(i % 10 == 0) for i in range(50)],
+        }
+    ).to_csv(data_path, index=False)
+
+    project = asr.Project.create(project_path, project_id=Path(project_path).name)
+    project.add_dataset(data_path)
+    project.add_review(
+        cycle=asr.ActiveLearningCycleData(
+            querier="max",
+            classifier="nb",
+            balancer="balanced",
+            feature_extractor="tfidf",
+            incremental=True,
+        )
+    )
+    return project
+
+
+def test_model_cache():
+    model_cache = ModelCache(max_size=2)
+    model_cache.put("a", 1)
+    model_cache.put("b", 2)
+
+    # a is now the most recently used project
+    assert model_cache.get("a") == 1
+    model_cache.put("c", 3)
+
+    assert "a" in model_cache
+    assert "b" not in model_cache
+    assert len(model_cache) == 2
+
+
+def test_run_model_model_cache(tmp_path):
+    project = _create_project(tmp_path / "project", tmp_path / "data.csv")
+    model_cache = ModelCache()
+
+    with project.db as db:
+        for record_id in [0, 1, 10, 2]:
+            db.label_record(record_id, int(record_id % 10 == 0))
+    run_model(project, model_cache=model_cache)
+
+    state = model_cache.get(project.project_id)
+    assert state["cycle"].classifier is not None
+
+    with project.db as db:
+        db.label_record(3, 0)
+    run_model(project, model_cache=model_cache)
+
+    # the feature matrix and fitted cycle are reused
+    assert model_cache.get(project.project_id)["fm"] is state["fm"]
+    assert model_cache.get(project.project_id)["cycle"] is state["cycle"]
+
+    with project.db as db:
+        assert db.get_last_training_set() == 5
+        ranking_time = db.get_last_ranking_table()["time"].max()
+
+    # without new labels, the model is not trained again
+    run_model(project, model_cache=model_cache)
+    with project.db as db:
+        assert db.get_last_ranking_table()["time"].max() == ranking_time
+    project.close()
+
+
+def test_persistent_worker(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASREVIEW_PATH", str(tmp_path))
+    project = _create_project(tmp_path / "project", tmp_path / "data.csv")
+
+    with project.db as db:
+        for record_id in [0, 1, 10, 2]:
+            db.label_record(record_id, int(record_id % 10 == 0))
+
+    worker = PersistentWorkerProcess(func=run_task, host=None, port=None)
+    worker.start()
+    worker.submit(project.project_id, False)
+    worker.stop()
+    worker.join(timeout=60)
+
+    with project.db as db:
+        assert db.get_last_ranking_table()["training_set"].max() == 4
+    project.close()
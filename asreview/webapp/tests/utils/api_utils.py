@@ -303,8 +303,18 @@ def get_project_progress(
 def get_project_progress_data(
     client: FlaskClient,
     project: Union[Project, asr.Project],
+    cursor: int = None,
+    version: int = None,
 ):
-    return client.get(f"/api/projects/{get_project_id(project)}/progress_data")
+    query_string = {}
+    if cursor is not None:
+        query_string["cursor"] = cursor
+    if version is not None:
+        query_string["version"] = version
+    return client.get(
+        f"/api/projects/{get_project_id(project)}/progress_data",
+        query_string=query_string,
+    )
 
 
 def get_project_current_document(
@@ -1,12 +1,17 @@
 import urllib
+from difflib import SequenceMatcher
 from pathlib import Path
 
 import pandas as pd
 from pytest import mark
 
 import asreview as asr
+from asreview.data.search import _FuzzyIndex
+from asreview.data.search import _get_fuzzy_index
+from asreview.data.search import clear_fuzzy_index_cache
 from asreview.data.search import fuzzy_find
 from asreview.data.utils import duplicated
+from asreview.data.utils import normalize_doi
 from asreview.datasets import DatasetManager
 
 
@@ -34,6 +39,30 @@ def test_fuzzy_finder(keywords, record_id):
         assert fuzzy_find(db.input, keywords)[0] == record_id
 
 
+@mark.parametrize("threshold", [0.5, 0.7, 0.9])
+def test_fuzzy_index_candidates(threshold):
+    index = _FuzzyIndex(
+        ["diagnostic accuracy", "diagnosis", "agnostic", "dignity", "cyst", "cysts"]
+    )
+
+    for key in ["diagnositc", "cyts", "dgnity", "x"]:
+        matches = [
+            token
+            for token in index.tokens
+            if SequenceMatcher(None, token, key).quick_ratio() >= threshold
+        ]
+        assert set(matches).issubset(index.candidates(key, threshold))
+
+
+def test_fuzzy_index_cache():
+    clear_fuzzy_index_cache()
+    strings = ["bronchogenic cyst", "foregut cyst"]
+
+    index = _get_fuzzy_index(strings)
+    assert _get_fuzzy_index(list(strings)) is index
+    assert _get_fuzzy_index(strings + ["duplication cyst"]) is not index
+
+
 @mark.internet_required
 @mark.parametrize(
     "data_name",
@@ -130,3 +159,25 @@ def test_duplicated_all_empty():
 
     result = duplicated(data)
     assert result.equals(pd.Series([False, False, False, False, False, False]))
+
+
+def test_duplicated_normalized_text():
+    data = pd.DataFrame(
+        {
+            "title": ["Café study", "cafe study", "Cafe study"],
+            "abstract": [
+                "An abstract.",
+                "An abstract. Copyright 2020 Elsevier",
+                "Another abstract.",
+            ],
+        }
+    )
+
+    assert duplicated(data).tolist() == [False, True, False]
+
+
+def test_normalize_doi():
+    result = normalize_doi(
+        [" https://doi.org/10.1000/XYZ ", "http://www.doi.org/10.1000/xyz", "", None]
+    )
+    assert result.tolist() == ["10.1000/xyz", "10.1000/xyz", None, None]
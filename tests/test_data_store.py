@@ -10,9 +10,14 @@ from asreview.data.loader import load_dataset
 from asreview.data.loader import load_records
 from asreview.data.record import Base
 from asreview.data.record import Record
+from asreview.data.search import fuzzy_find
+from asreview.data.utils import DEFAULT_EXTRACTORS
 from asreview.data.utils import _clean_text
 from asreview.data.utils import identify_groups
+from asreview.data.utils import identify_key_groups
 from asreview.data.utils import identify_record_groups
+from asreview.data.utils import record_keys
+from asreview.database import search_index
 from asreview.database.store import DataStore
 from asreview.project.api import Project
 
@@ -166,6 +171,67 @@ def test_label_validation(store):
         store.add_records([Record(dataset_id="foo", dataset_row=4, included="1")])
 
 
+def test_add_dataframe(store):
+    data = pd.DataFrame(
+        {
+            "dataset_row": [0, 1, 2],
+            "dataset_id": "foo",
+            "title": ["Title", "", None],
+            "authors": [["Foo", "Bar"], None, []],
+            "year": [2020.0, None, 2021.0],
+            "included": [1, None, 0],
+        }
+    )
+    store.add_dataframe(data)
+    assert data["record_id"].to_list() == [0, 1, 2]
+
+    records = store.get_records([0, 1, 2])
+    assert [r.title for r in records] == ["Title", "", ""]
+    assert [r.abstract for r in records] == ["", "", ""]
+    assert [r.authors for r in records] == [["Foo", "Bar"], [], []]
+    assert [r.year for r in records] == [2020, None, 2021]
+    assert [r.included for r in records] == [1, None, 0]
+
+    store.add_dataframe({"dataset_row": [3], "dataset_id": ["foo"]})
+    assert len(store) == 4
+
+
+@pytest.mark.parametrize(
+    "column,value",
+    [
+        ("authors", "Foo;Bar"),
+        ("authors", ["Foo", None]),
+        ("keywords", "Foo;Bar"),
+        ("title", 1),
+        ("included", "1"),
+        ("year", "2020.5"),
+    ],
+)
+def test_add_dataframe_validation(store, column, value):
+    data = {"dataset_row": [0, 1], "dataset_id": ["foo", "foo"], column: [None, value]}
+    with pytest.raises(ValueError):
+        store.add_dataframe(data)
+    assert store.is_empty()
+
+
+def test_validate_dataframe_equals_records():
+    data = pd.DataFrame(
+        {
+            "dataset_row": [0, 1, 2],
+            "dataset_id": "foo",
+            "title": ["Title", "", None],
+            "doi": [None, "10.1/foo", ""],
+            "keywords": [["Foo"], None, []],
+            "year": [2020, None, 2021],
+            "included": [1.0, None, 0.0],
+        }
+    )
+    assert Record.validate_dataframe(data).to_dict("records") == [
+        {column: getattr(record, column) for column in Record.get_data_columns()}
+        for record in (Record(**row) for row in data.to_dict("records"))
+    ]
+
+
 def test_delete_record(store):
     record = Record(dataset_id="foo", dataset_row=1)
     store.add_records([record])
@@ -174,6 +240,133 @@ def test_delete_record(store):
     assert len(store) == 0
 
 
+@pytest.mark.parametrize(
+    "keywords,record_id",
+    [
+        ("bronchogenic duplication cyst", 0),
+        ("diagnositc accuracy microscopy female priority", 1),
+        ("immunophenotiping", 4),
+        ("Foregut report embryoogenesis", 4),
+        ("Liu Adler", 0),
+        ("Khoury cysts", 4),
+        ("Isolated Edwards", 5),
+        ("Kwintanilla-djeck Neck", 3),
+        ("Cancer case computer contrast pancreatomy Yamada", 2),
+    ],
+)
+def test_search(keywords, record_id):
+    with load_dataset(Path("tests", "demo_data", "embase.csv")) as db:
+        result = db.input.search(keywords)
+        assert result[0] == record_id
+        assert record_id not in db.input.search(keywords, exclude=[record_id])
+
+
+def test_search_index_incremental(store):
+    store.add_records(
+        [Record(dataset_id="foo", dataset_row=0, title="Cystic fibrosis")]
+    )
+    assert store.search("cystic") == [0]
+    assert store.search("bronchogenic") == []
+
+    store.add_records(
+        [
+            Record(
+                dataset_id="foo",
+                dataset_row=1,
+                title="Bronchogenic cyst",
+                authors=["Müller, A"],
+            )
+        ]
+    )
+    assert store.search("bronchogenc") == [1]
+    assert store.search("müller") == [1]
+
+    store.delete_record(0)
+    assert store.search("cystic") == []
+
+
+def test_search_index_transposition(store):
+    store.add_records(
+        [Record(dataset_id="foo", dataset_row=0, title="The bronchogenic cyst")]
+    )
+    # the keywords share no trigram with the terms in the title
+    assert store.search("teh") == [0]
+    assert store.search("cyts") == [0]
+
+
+@pytest.mark.parametrize(
+    "keywords",
+    [
+        "bronchogenic duplication cyst",
+        "diagnositc accuracy microscopy female priority",
+        "Foregut report embryoogenesis",
+        "teh cyts",
+        "Kwintanilla-djeck Neck",
+        "Cancer case computer contrast pancreatomy Yamada",
+    ],
+)
+def test_search_fuzzy_find(keywords):
+    with load_dataset(Path("tests", "demo_data", "embase.csv")) as db:
+        n = len(db.input)
+        result = db.input.search(keywords, threshold=1, max_return=n)
+        expected = fuzzy_find(db.input, keywords, threshold=1, max_return=n)
+        assert set(result) == set(expected)
+
+
+def test_search_index_terms(store):
+    store.add_records(
+        [
+            Record(dataset_id="foo", dataset_row=0, title="Cystic fibrosis"),
+            Record(dataset_id="foo", dataset_row=1, title="Bronchogenic cyst"),
+        ]
+    )
+
+    def terms():
+        with store.engine.connect() as conn:
+            return set(
+                conn.exec_driver_sql("SELECT term FROM record_search_term").scalars()
+            )
+
+    assert terms() == {"cystic", "fibrosis", "bronchogenic", "cyst"}
+
+    store.delete_record(0)
+    assert terms() == {"bronchogenic", "cyst"}
+
+    with store.engine.begin() as conn:
+        conn.exec_driver_sql(
+            "UPDATE record SET title = 'Pulmonary cyst' WHERE record_id = 1"
+        )
+    assert terms() == {"pulmonary", "cyst"}
+    assert store.search("pulmonary") == [1]
+
+
+def test_search_without_fts5(tmpdir, monkeypatch):
+    monkeypatch.setattr(search_index, "fts5_trigram_available", lambda: False)
+
+    store = DataStore(tmpdir / Project.PATH_DB)
+    store.create_tables()
+    store.add_records(
+        [Record(dataset_id="foo", dataset_row=0, title="Cystic fibrosis")]
+    )
+    with store.engine.connect() as conn:
+        assert not store.search_index.exists(conn)
+
+    assert store.search("fibrosis") == [0]
+
+
+def test_search_without_index(store):
+    store.add_records(
+        [Record(dataset_id="foo", dataset_row=0, title="Cystic fibrosis")]
+    )
+    with store.engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE record_search_term")
+        conn.exec_driver_sql("DROP TABLE record_search_vocab")
+        conn.exec_driver_sql("DROP TABLE record_search")
+
+    # the index is created on the first search
+    assert store.search("fibrosis") == [0]
+
+
 def test_load_dataset_no_abstracts(tmpdir):
     test_fp = tmpdir / "no_abstracts.csv"
     df = pd.DataFrame(
@@ -384,6 +577,31 @@ def test_load_dataset_grouped(tmpdir):
     )
 
 
+def test_load_dataset_grouped_chunks(tmpdir):
+    with open(Path("tests", "demo_data", "pubmed_zotero.ris")) as f:
+        file_text = f.read()
+    duplicate_fp = Path(tmpdir, "duplicate_test.ris")
+    with open(duplicate_fp, "w") as f:
+        f.write(file_text + "\n\n" + file_text)
+
+    # duplicates are found across chunks
+    db = load_dataset(duplicate_fp, chunk_size=5)
+    assert sorted(db.input["record_id"]) == list(range(12))
+    assert set(db.input.get_groups()) == set((i, i) for i in range(6)).union(
+        set((i, i + 6) for i in range(6))
+    )
+
+
+def test_add_record_chunks_rollback(store):
+    def chunks():
+        yield [Record(dataset_id="foo", dataset_row=i) for i in range(3)]
+        raise ValueError("invalid dataset")
+
+    with pytest.raises(ValueError):
+        store.add_record_chunks(chunks())
+    assert store.is_empty()
+
+
 @pytest.mark.parametrize(
     "text,expected",
     [
@@ -434,3 +652,46 @@ def test_identify_record_groups_default_extractors():
     # "café study" and "cafe study" should be in another group (group_id=3).
     # "unique title" should be its own group.
     assert set(result) == {(0, 0), (0, 1), (0, 2), (3, 3), (3, 4), (5, 5)}
+
+
+def test_record_keys_equal_default_extractors():
+    titles = ["Machine Learning", "machine learning", "café", "cafe", None, "", "a"]
+    abstracts = [
+        "An abstract. © 2020 Elsevier",
+        "An abstract",
+        None,
+        "",
+        None,
+        "",
+        "bc",
+    ]
+    records = [
+        Record("ds1", i, title=title, abstract=abstract)
+        for i, (title, abstract) in enumerate(zip(titles, abstracts, strict=True))
+    ]
+    features = [
+        tuple(extractor(record) for extractor in DEFAULT_EXTRACTORS)
+        for record in records
+    ]
+
+    keys = record_keys(titles, abstracts)
+    for i in range(len(records)):
+        for j in range(len(records)):
+            assert (keys[i] == keys[j]) == (features[i] == features[j])
+
+    # the multi-process path gives the same keys
+    assert (record_keys(titles, abstracts, n_jobs=2) == keys).all()
+
+
+def test_identify_key_groups_first_seen():
+    first_seen = {}
+    assert identify_key_groups([1, 2, 1], [0, 1, 2], first_seen) == [
+        (0, 0),
+        (1, 1),
+        (0, 2),
+    ]
+    assert identify_key_groups([2, 3, 3], [3, 4, 5], first_seen) == [
+        (1, 3),
+        (4, 4),
+        (4, 5),
+    ]
@@ -3,6 +3,9 @@ from pathlib import Path
 
 import pandas as pd
 import pytest
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.utils import compute_sample_weight
 
 import asreview as asr
 from asreview.data.loader import load_records
@@ -118,6 +121,85 @@ def test_results_closes_connection_on_exit(tmpdir):
         conn.execute("SELECT 1")
 
 
+@pytest.mark.parametrize("pooled", [False, True])
+def test_connection_stats(tmpdir, pooled):
+    fp = Path(tmpdir, "test.db")
+    db = asr.Database(fp, pooled=pooled)
+    db.create_tables()
+    db.input.add_records([Record(dataset_row=i, dataset_id="foo") for i in range(3)])
+
+    stats = db.input.connection_stats
+    for record_id in range(3):
+        db.input.get_records(record_id)
+    db.input["dataset_row"]
+
+    new_stats = db.input.connection_stats
+    assert new_stats["checkouts"] == stats["checkouts"] + 4
+    assert new_stats["checked_out"] == 0
+    if pooled:
+        # the connection of the earlier requests is reused
+        assert new_stats["opened"] == stats["opened"] == 1
+        assert new_stats["in_pool"] == 1
+    else:
+        assert new_stats["opened"] == stats["opened"] + 4
+        assert new_stats["in_pool"] == 0
+
+    db.close()
+    assert db.input.connection_stats["closed"] == db.input.connection_stats["opened"]
+    assert db.input.connection_stats["in_pool"] == 0
+
+    # connections opened after closing are released by the next close
+    db.input["dataset_row"]
+    db.close()
+    assert db.input.connection_stats["closed"] == db.input.connection_stats["opened"]
+
+
+def test_pooled_context_manager(tmpdir):
+    project = asr.Project(tmpdir)
+    with project.db as db:
+        db.create_tables()
+        db.input.add_records([Record(dataset_row=0, dataset_id="foo")])
+
+    for _ in range(3):
+        with project.db as db:
+            db.input["dataset_row"]
+
+    stats = project.db.input.connection_stats
+    assert stats["opened"] == 1
+    assert stats["closed"] == 0
+
+    project.close()
+    stats = project.db.input.connection_stats
+    assert stats["closed"] == stats["opened"]
+
+
+def test_pragmas(tmpdir):
+    fp = Path(tmpdir, "test.db")
+    with asr.Database(fp) as db:
+        db.create_tables()
+        assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        with db.input.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+            assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -16000
+
+    with asr.Database(fp, read_only=True, pragmas={"cache_size": -1000}) as db:
+        assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert db._conn.execute("PRAGMA cache_size").fetchone()[0] == -1000
+
+
+def test_pragmas_existing_database(tmpdir):
+    fp = Path(tmpdir, "test.db")
+    with asr.Database(fp, pragmas={}) as db:
+        db.create_tables()
+        assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+    # existing databases switch to WAL mode when opened for writing
+    with asr.Database(fp, read_only=True) as db:
+        assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    with asr.Database(fp) as db:
+        assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
 def test_results_closes_on_exception(tmpdir):
     """Test that Database closes connection even when exception occurs."""
     fp = Path(tmpdir, "test.db")
@@ -576,3 +658,286 @@ def test_exist_new_labeled_records(db):
     assert not db.exist_new_labeled_records
     db.label_record(4, 0)
     assert db.exist_new_labeled_records
+
+
+def _query_plans(db, func):
+    statements = []
+    db._conn.set_trace_callback(statements.append)
+    try:
+        func()
+    finally:
+        db._conn.set_trace_callback(None)
+
+    return [
+        row[3]
+        for statement in statements
+        if statement.lstrip().upper().startswith(("SELECT", "WITH", "INSERT"))
+        for row in db._conn.execute(f"EXPLAIN QUERY PLAN {statement}")
+    ]
+
+
+@pytest.mark.parametrize(
+    "method,args,indexes",
+    [
+        (
+            "label_record",
+            (11, 1),
+            ["idx_record_group_id", "sqlite_autoindex_results_1"],
+        ),
+        (
+            "query_top_ranked",
+            (),
+            ["idx_record_group_id", "idx_results_label", "sqlite_autoindex_results_1"],
+        ),
+        ("get_pool", (), ["idx_record_group_id", "sqlite_autoindex_results_1"]),
+        ("get_unlabeled", (), ["sqlite_autoindex_results_1"]),
+        ("get_pending", (1,), ["idx_record_group_id", "idx_results_label"]),
+        ("get_priors", (), ["idx_record_group_id"]),
+        ("get_results_table", (), ["idx_record_group_id"]),
+    ],
+)
+def test_query_plans(db_with_data, method, args, indexes):
+    plans = _query_plans(db_with_data, lambda: getattr(db_with_data, method)(*args))
+
+    # the lookups of the records and results of a group use the indexes
+    for index in indexes:
+        assert any(index in plan for plan in plans), plans
+
+
+def test_create_indexes(tmpdir):
+    fp = Path(tmpdir, "test.db")
+    with asr.Database(fp) as db:
+        db.create_tables()
+
+    with sqlite3.connect(fp) as conn:
+        names = conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        assert {name for (name,) in names} >= {
+            "idx_results_label",
+            "idx_record_group_id",
+            "idx_record_duplicate_of",
+        }
+    conn.close()
+
+
+@pytest.mark.parametrize("subset", ["all", "relevant", "irrelevant"])
+@pytest.mark.parametrize("has_note", [False, True])
+@pytest.mark.parametrize("is_prior", [False, True])
+@pytest.mark.parametrize("latest_first", [False, True])
+def test_get_labeled(db_with_data, subset, has_note, is_prior, latest_first):
+    db_with_data.update_note(4, "note")
+    db_with_data.update_note(2, "note")
+
+    expected = (
+        db_with_data.get_priors() if is_prior else db_with_data.get_results_table()
+    )
+    if subset == "relevant":
+        expected = expected[expected["label"] == 1]
+    elif subset == "irrelevant":
+        expected = expected[expected["label"] == 0]
+    else:
+        expected = expected[~expected["label"].isnull()]
+    if has_note:
+        expected = expected[~expected["note"].isnull()]
+    if latest_first:
+        expected = expected.iloc[::-1]
+    expected = expected.reset_index(drop=True)
+
+    kwargs = {"subset": subset, "has_note": has_note, "is_prior": is_prior}
+    assert db_with_data.count_labeled(**kwargs) == len(expected)
+    pd.testing.assert_frame_equal(
+        db_with_data.get_labeled(**kwargs, latest_first=latest_first), expected
+    )
+    pd.testing.assert_frame_equal(
+        db_with_data.get_labeled(
+            **kwargs, latest_first=latest_first, limit=1, offset=1
+        ),
+        expected.iloc[1:2].reset_index(drop=True),
+    )
+
+
+def _expected_label_counts(db, priors=True):
+    labels = db.get_results_table("label", priors=priors)["label"]
+    return {0: int(sum(labels == 0)), 1: int(sum(labels == 1))}
+
+
+@pytest.mark.parametrize("priors", [True, False])
+def test_get_label_counts(db_with_data, priors):
+    def assert_counts():
+        assert db_with_data.get_label_counts(priors) == _expected_label_counts(
+            db_with_data, priors
+        )
+
+    assert_counts()
+    db_with_data.update_result(4, label=0)
+    assert_counts()
+    db_with_data.update_result(0, label=1)
+    assert_counts()
+    db_with_data.delete_result(5)
+    assert_counts()
+    db_with_data.label_record(11, 1)
+    assert_counts()
+    db_with_data._replace_results_from_df(
+        db_with_data.get_results_table(pending=True, grouped=True).iloc[:3]
+    )
+    assert_counts()
+
+
+@pytest.mark.parametrize("priors", [True, False])
+def test_get_label_counts_group_changes(db_with_data, priors):
+    def assert_counts():
+        assert db_with_data.get_label_counts(priors) == _expected_label_counts(
+            db_with_data, priors
+        )
+
+    # merge the groups of two labeled records
+    db_with_data.input.set_groups([(0, 0), (0, 2)])
+    assert_counts()
+    db_with_data.input.set_groups([(4, 4), (4, 5)])
+    assert_counts()
+
+    # split a record from its group
+    with db_with_data.input.engine.begin() as conn:
+        conn.exec_driver_sql(
+            "UPDATE record SET duplicate_of = NULL WHERE record_id = 2"
+        )
+    assert_counts()
+
+    db_with_data.input.delete_record(2)
+    assert_counts()
+
+
+@pytest.mark.parametrize("priors", [True, False])
+def test_get_label_sequence(db_with_data, priors):
+    expected = db_with_data.get_results_table("label", priors=priors)["label"]
+
+    labels, cursor = db_with_data.get_label_sequence(priors)
+    assert labels == expected.to_list()
+    assert db_with_data.get_label_sequence(priors, after=cursor) == ([], cursor)
+
+    # labels added to the end are returned after the cursor
+    version = db_with_data.label_sequence_version
+    db_with_data.label_record(8, 1)
+    labels, cursor = db_with_data.get_label_sequence(priors, after=cursor)
+    assert labels == [1]
+    assert db_with_data.label_sequence_version == version
+
+    labels, _ = db_with_data.get_label_sequence(priors)
+    assert labels == expected.to_list() + [1]
+
+
+def test_label_sequence_version(db_with_data):
+    # record 8 is pending and record 11 is queried after it
+    db_with_data.add_last_ranking(
+        [11, 5, 4, 3, 6, 7, 9, 10], "nb", "max", "balanced", "tfidf", 3
+    )
+    db_with_data.query_top_ranked()
+    db_with_data.label_record(11, 1)
+
+    # labeling record 8 inserts a label before the cursor
+    version = db_with_data.label_sequence_version
+    labels, cursor = db_with_data.get_label_sequence()
+    db_with_data.label_record(8, 0)
+    assert db_with_data.get_label_sequence(after=cursor) == ([], cursor)
+    assert len(db_with_data.get_label_sequence()[0]) == len(labels) + 1
+    assert db_with_data.label_sequence_version > version
+
+    for change in [
+        lambda: db_with_data.update_result(11, label=0),
+        lambda: db_with_data.delete_result(2),
+        lambda: db_with_data.input.set_groups([(0, 0), (0, 11)]),
+        lambda: db_with_data.input.delete_record(0),
+    ]:
+        version = db_with_data.label_sequence_version
+        change()
+        assert db_with_data.label_sequence_version > version
+
+    # changes of notes and tags don't change the sequence
+    version = db_with_data.label_sequence_version
+    db_with_data.update_note(5, "note")
+    db_with_data.update_result(5, tags=["tag"])
+    assert db_with_data.label_sequence_version == version
+
+
+def _naive_bayes_term_weights(db):
+    df = db.input[["record_id", "abstract"]].merge(
+        db.get_results_table(["record_id", "label"]), on="record_id"
+    )
+    vectorizer = CountVectorizer(ngram_range=(1, 2), stop_words="english")
+    nb = MultinomialNB().fit(
+        vectorizer.fit_transform(df["abstract"]),
+        df["label"],
+        sample_weight=compute_sample_weight("balanced", df["label"]),
+    )
+    weights = nb.feature_log_prob_[1, :] - nb.feature_log_prob_[0, :]
+    return dict(zip(vectorizer.get_feature_names_out(), weights, strict=True))
+
+
+def test_word_counts(tmpdir):
+    words = ["screening", "review", "cancer", "mice", "trial", "cell", "model"]
+    records = [
+        Record(i, f"title {i}", abstract=" ".join(words[i % 7 : i % 7 + i % 4 + 1]))
+        for i in range(30)
+    ]
+
+    def assert_top_terms(db, n=5):
+        weights = _naive_bayes_term_weights(db)
+        relevant, irrelevant = db.word_counts.top_terms(n)
+
+        expected = sorted(weights.values())
+        assert [weights[t] for t in relevant] == pytest.approx(expected[::-1][:n])
+        assert [weights[t] for t in irrelevant] == pytest.approx(expected[:n])
+
+    fp = Path(tmpdir, "test.db")
+    with asr.Database(fp) as db:
+        db.create_tables()
+        db.input.add_records(records)
+        assert db.word_counts.top_terms() == (None, None)
+
+        for i in range(10):
+            db.label_record(i, int(i % 3 == 0))
+        assert_top_terms(db)
+
+        db.label_record(10, 1)
+        db.update_result(3, label=0)
+        db.delete_result(4)
+        assert_top_terms(db)
+
+    with asr.Database(fp, read_only=True) as db:
+        assert_top_terms(db)
+
+
+@pytest.mark.parametrize(
+    "collections,grouped,expected",
+    [
+        (["relevant"], False, [2, 3]),
+        (["relevant"], True, [2, 3, 4]),
+        (["not_seen"], False, [6, 8, 11, 9]),
+        (["irrelevant", "relevant"], True, [2, 3, 4, 0, 1, 5]),
+        (
+            ["relevant", "not_seen", "irrelevant"],
+            True,
+            [2, 3, 4, 6, 7, 8, 11, 9, 10, 0, 1, 5],
+        ),
+        ([], True, []),
+    ],
+)
+def test_iter_export_results(db_with_data, collections, grouped, expected):
+    chunks = list(
+        db_with_data.iter_export_results(collections, grouped=grouped, chunk_size=3)
+    )
+    assert len(chunks) == max(1, -(-len(expected) // 3))
+
+    export = pd.concat(chunks, ignore_index=True)
+    assert export["record_id"].to_list() == expected
+
+    # every record gets the result of the base record of its group
+    groups = {
+        record_id: group_id for group_id, record_id in db_with_data.input.get_groups()
+    }
+    results = db_with_data.get_results_table().set_index("record_id")
+    for record_id, group_id, label in export[["record_id", "group_id", "label"]].values:
+        assert group_id == groups.get(record_id, record_id)
+        if group_id in results.index:
+            assert label == results.loc[group_id, "label"]
+        else:
+            assert pd.isna(label)
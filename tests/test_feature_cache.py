@@ -0,0 +1,171 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+import asreview as asr
+from asreview.models.feature_cache import FeatureCache
+from asreview.models.feature_cache import feature_cache_key
+from asreview.models.feature_cache import hash_data
+from asreview.models.feature_cache import load_feature_matrix
+from asreview.models.feature_cache import save_feature_matrix
+from asreview.models.feature_extractors import Tfidf
+from asreview.models.queriers import TopDown
+from asreview.models.stoppers import IsFittable
+
+
+def test_hash_data(demo_data):
+    assert hash_data(demo_data) == hash_data(demo_data.copy())
+    assert hash_data(demo_data) != hash_data(demo_data.iloc[1:])
+
+    X = np.random.rand(10, 5)
+    assert hash_data(X) == hash_data(X.copy())
+    assert hash_data(sp.csr_matrix(X)) == hash_data(sp.csc_matrix(X))
+
+
+def test_feature_cache_key(demo_data):
+    data_hash = hash_data(demo_data)
+
+    assert feature_cache_key("tfidf", {}, data_hash) == feature_cache_key(
+        "tfidf", {}, data_hash
+    )
+    assert feature_cache_key("tfidf", {}, data_hash) != feature_cache_key(
+        "tfidf", {"ngram_range": (1, 2)}, data_hash
+    )
+    assert feature_cache_key("tfidf", {}, data_hash) != feature_cache_key(
+        "onehot", {}, data_hash
+    )
+
+
+def test_save_load_feature_matrix(tmpdir):
+    X_dense = np.random.rand(10, 5)
+    save_feature_matrix(X_dense, Path(tmpdir, "dense"))
+    X_dense_loaded = load_feature_matrix(Path(tmpdir, "dense"))
+
+    assert isinstance(X_dense_loaded, np.memmap)
+    assert X_dense_loaded.dtype == np.float32
+    np.testing.assert_array_equal(X_dense_loaded, X_dense.astype(np.float32))
+
+    X_sparse = sp.random(10, 5, density=0.3, format="csr")
+    save_feature_matrix(X_sparse, Path(tmpdir, "sparse"))
+    X_sparse_loaded = load_feature_matrix(Path(tmpdir, "sparse"))
+
+    # views on the read-only memory-mapped arrays
+    assert not X_sparse_loaded.data.flags.writeable
+    assert X_sparse_loaded.dtype == np.float32
+    assert (X_sparse_loaded != X_sparse.astype(np.float32)).nnz == 0
+
+    with pytest.raises(ValueError):
+        save_feature_matrix(np.array([["title", 1]], dtype=object), tmpdir)
+
+
+def test_feature_cache_get_put(tmpdir):
+    cache = FeatureCache(Path(tmpdir, "cache"))
+
+    X_dense = np.random.rand(10, 5)
+    X_sparse = sp.random(10, 5, density=0.3, format="csr")
+
+    assert cache.get("a" * 64) is None
+
+    cache.put("a" * 64, X_dense)
+    cache.put("b" * 64, X_sparse)
+
+    assert "a" * 64 in cache
+    np.testing.assert_array_equal(cache.get("a" * 64), X_dense.astype(np.float32))
+    assert (cache.get("b" * 64) != X_sparse.astype(np.float32)).nnz == 0
+
+
+def test_feature_cache_lru(tmpdir):
+    X = np.random.rand(100, 10).astype(np.float32)
+    cache = FeatureCache(Path(tmpdir, "cache"), max_size=int(2.5 * X.nbytes))
+
+    for i, key in enumerate(["a" * 64, "b" * 64]):
+        fp = cache.put(key, X)
+        os.utime(fp, (i, i))
+
+    # reading a makes b the least recently used matrix
+    cache.get("a" * 64)
+    cache.put("c" * 64, X)
+
+    assert "a" * 64 in cache
+    assert "b" * 64 not in cache
+    assert "c" * 64 in cache
+
+
+def test_feature_cache_transform(demo_data, tmpdir):
+    cache = FeatureCache(Path(tmpdir, "cache"))
+
+    X = cache.transform(Tfidf(), demo_data)
+    assert (X != Tfidf().fit_transform(demo_data).astype(np.float32)).nnz == 0
+    assert len(list(Path(tmpdir, "cache").iterdir())) == 1
+
+    cache.transform(Tfidf(), demo_data)
+    assert len(list(Path(tmpdir, "cache").iterdir())) == 1
+
+    cache.transform(Tfidf(ngram_range=(1, 2)), demo_data)
+    assert len(list(Path(tmpdir, "cache").iterdir())) == 2
+
+
+def test_simulate_feature_cache(demo_data, tmpdir):
+    def simulate():
+        cycles = [
+            asr.ActiveLearningCycle(querier=TopDown(), stopper=IsFittable()),
+            asr.ActiveLearningCycle(
+                querier=asr.load_extension("models.queriers", "max")(),
+                classifier=asr.load_extension("models.classifiers", "nb")(),
+                feature_extractor=Tfidf(),
+            ),
+        ]
+        sim = asr.Simulate(
+            demo_data,
+            demo_data["label_included"],
+            cycles,
+            feature_cache=Path(tmpdir, "cache"),
+        )
+        sim.review()
+        return sim._results
+
+    results = simulate()
+    assert len(list(Path(tmpdir, "cache").iterdir())) == 1
+
+    results_cached = simulate()
+    assert (results["record_id"] == results_cached["record_id"]).all()
+
+
+def test_project_feature_matrix_key(demo_data_path, tmpdir):
+    project = asr.Project.create(Path(tmpdir, "project"))
+    project.add_dataset(demo_data_path)
+
+    data_hash = project.get_dataset_hash()
+    assert data_hash == asr.Project(Path(tmpdir, "project")).get_dataset_hash()
+
+    key = feature_cache_key("tfidf", {}, data_hash)
+    X = Tfidf().fit_transform(project.db.input.get_df())
+    project.add_feature_matrix(X, "tfidf", key=key)
+
+    X_loaded = project.get_feature_matrix("tfidf", key=key)
+    assert (X_loaded != X.astype(np.float32)).nnz == 0
+
+    key_bigram = feature_cache_key("tfidf", {"ngram_range": (1, 2)}, data_hash)
+    with pytest.raises(ValueError):
+        project.get_feature_matrix("tfidf", key=key_bigram)
+    project.close()
+
+
+def test_project_feature_matrix_mmap(demo_data_path, tmpdir):
+    project = asr.Project.create(Path(tmpdir, "project"))
+    project.add_dataset(demo_data_path)
+
+    X = Tfidf().fit_transform(project.db.input.get_df())
+    project.add_feature_matrix(X, "tfidf")
+    X_loaded = project.get_feature_matrix("tfidf")
+
+    assert not X_loaded.data.flags.writeable
+    assert (X_loaded != X.astype(np.float32)).nnz == 0
+
+    X_dense = np.random.rand(X.shape[0], 8).astype(np.float32)
+    project.add_feature_matrix(X_dense, "embedding")
+    assert isinstance(project.get_feature_matrix("embedding"), np.memmap)
+    project.close()
@@ -1,6 +1,7 @@
 from itertools import product
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 import asreview as asr
@@ -8,7 +9,6 @@ from asreview.extensions import extensions
 from asreview.models.balancers import Balanced
 from asreview.models.queriers import Max
 
-
 classifier_parameters = {
     "nb": {"alpha": 3.822},
     "rf": {"n_estimators": 50},
@@ -182,3 +182,136 @@ def test_alc_to_and_from_file(tmpdir, classifier, feature_extractor):
         == alc1_from_file.querier.get_params()
         == alc2_from_meta.querier.get_params()
     ), "Querier parameters do not match"
+
+
+@pytest.mark.parametrize("classifier", ["nb", "svm", "logistic"])
+def test_alc_rank_pool(demo_data, classifier):
+    alc = asr.ActiveLearningCycle(
+        classifier=asr.load_extension("models.classifiers", classifier)(),
+        feature_extractor=asr.load_extension("models.feature_extractors", "tfidf")(),
+        querier=Max(),
+    )
+    X = alc.transform(demo_data)
+    alc.fit(X[[0, 1, 9]], demo_data["label_included"].iloc[[0, 1, 9]].values)
+
+    pool = np.setdiff1d(np.arange(X.shape[0]), [0, 1, 9])
+    assert (alc.rank(X, pool=pool) == alc.rank(X[pool])).all()
+    assert (alc.rank(X, pool=pool, k=5) == alc.rank(X, pool=pool)[:5]).all()
+
+
+@pytest.mark.parametrize("classifier", ["nb", "logistic", "svm"])
+def test_alc_fit_incremental(demo_data, classifier):
+    alc = asr.ActiveLearningCycle(
+        classifier=asr.load_extension("models.classifiers", classifier)(),
+        balancer=Balanced(),
+        feature_extractor=asr.load_extension("models.feature_extractors", "tfidf")(),
+        querier=Max(),
+        incremental=True,
+    )
+    params = alc.classifier.get_params()
+    X = alc.transform(demo_data)
+    y = demo_data["label_included"].values
+
+    alc.fit(X[:20], y[:20], record_ids=np.arange(20))
+    alc.fit(X[:30], y[:30], record_ids=np.arange(30))
+
+    assert alc.classifier.get_params() == params
+    assert len(alc.rank(X)) == X.shape[0]
+    assert asr.ActiveLearningCycle.from_meta(alc.to_meta()).incremental
+
+
+def test_alc_fit_incremental_partial_fit(demo_data):
+    alc = asr.ActiveLearningCycle(
+        classifier=asr.load_extension("models.classifiers", "nb")(),
+        balancer=Balanced(),
+        feature_extractor=asr.load_extension("models.feature_extractors", "tfidf")(),
+        querier=Max(),
+        incremental=True,
+    )
+    X = alc.transform(demo_data)
+    y = demo_data["label_included"].values
+
+    alc.fit(X[:20], y[:20], record_ids=np.arange(20))
+    alc.fit(X[:25], y[:25], record_ids=np.arange(25))
+
+    # the first instances keep the weights of the first fit, the new instances
+    # get the weights computed on all 25 instances
+    w = np.concatenate(
+        [
+            Balanced().compute_sample_weight(y[:20]),
+            Balanced().compute_sample_weight(y[:25])[20:],
+        ]
+    )
+    np.testing.assert_allclose(
+        alc.classifier.class_count_,
+        [w[y[:25] == 0].sum(), w[y[:25] == 1].sum()],
+    )
+
+
+def test_alc_fit_incremental_warm_start(demo_data, monkeypatch):
+    alc = asr.ActiveLearningCycle(
+        classifier=asr.load_extension("models.classifiers", "logistic")(),
+        feature_extractor=asr.load_extension("models.feature_extractors", "tfidf")(),
+        querier=Max(),
+        incremental=True,
+    )
+    X = alc.transform(demo_data)
+    y = demo_data["label_included"].values
+
+    alc.fit(X[:20], y[:20], record_ids=np.arange(20))
+    coef = alc.classifier.coef_.copy()
+
+    fit = alc.classifier.fit
+    warm_start = []
+
+    def _fit(X, y, sample_weight=None):
+        warm_start.append(alc.classifier.warm_start)
+        np.testing.assert_array_equal(alc.classifier.coef_, coef)
+        return fit(X, y, sample_weight=sample_weight)
+
+    monkeypatch.setattr(alc.classifier, "fit", _fit)
+    alc.fit(X[:30], y[:30], record_ids=np.arange(30))
+
+    assert warm_start == [True]
+    assert not alc.classifier.warm_start
+
+
+def test_alc_fit_incremental_changed_labels(demo_data):
+    alc = asr.ActiveLearningCycle(
+        classifier=asr.load_extension("models.classifiers", "nb")(),
+        balancer=Balanced(),
+        feature_extractor=asr.load_extension("models.feature_extractors", "tfidf")(),
+        querier=Max(),
+        incremental=True,
+    )
+    X = alc.transform(demo_data)
+    y = demo_data["label_included"].values[:30].copy()
+
+    alc.fit(X[:20], y[:20], record_ids=np.arange(20))
+    # a label of a record fitted before changes, so the classifier is refitted
+    y[0] = 1 - y[0]
+    alc.fit(X[:30], y, record_ids=np.arange(30))
+
+    nb = asr.load_extension("models.classifiers", "nb")().fit(
+        X[:30], y, sample_weight=Balanced().compute_sample_weight(y)
+    )
+    np.testing.assert_allclose(alc.classifier.class_count_, nb.class_count_)
+    np.testing.assert_allclose(alc.classifier.feature_log_prob_, nb.feature_log_prob_)
+
+
+def test_alc_fit_incremental_other_records(demo_data):
+    alc = asr.ActiveLearningCycle(
+        classifier=asr.load_extension("models.classifiers", "nb")(),
+        feature_extractor=asr.load_extension("models.feature_extractors", "tfidf")(),
+        querier=Max(),
+        incremental=True,
+    )
+    X = alc.transform(demo_data)
+    y = np.arange(30) % 2
+
+    # the labels of the first records are the same, but the records are not
+    alc.fit(X[:20], y[:20], record_ids=np.arange(20))
+    alc.fit(X[20:50], y, record_ids=np.arange(20, 50))
+
+    nb = asr.load_extension("models.classifiers", "nb")().fit(X[20:50], y)
+    np.testing.assert_allclose(alc.classifier.feature_log_prob_, nb.feature_log_prob_)
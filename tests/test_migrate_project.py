@@ -1,4 +1,5 @@
 import shutil
+import sqlite3
 from pathlib import Path
 
 import jsonschema
@@ -6,7 +7,9 @@ import pandas
 import pytest
 
 import asreview as asr
+from asreview.data.record import Record
 from asreview.project.migration import detect_version
+from asreview.project.migration.v3v4 import _migrate_database
 from asreview.project.schema import SCHEMA
 
 
@@ -20,7 +23,7 @@ def asreview_v2_project(tmpdir):
 
 
 def assert_valid_project(project):
-    assert detect_version(project.config) == 3
+    assert detect_version(project.config) == 4
     jsonschema.validate(instance=project.config, schema=SCHEMA)
 
     with project.db as db:
@@ -55,3 +58,85 @@ def test_project_migration_2_to_3(tmpdir, asreview_v2_project):
         open(asreview_v2_project, "rb"), tmpdir, safe_import=True
     )
     assert_valid_project(project)
+
+
+def test_project_migration_3_to_4(tmpdir):
+    project_fp = Path("tests", "asreview_files", "asreview-demo-project.asreview")
+    project = asr.Project.load(open(project_fp, "rb"), tmpdir, safe_import=True)
+    assert_valid_project(project)
+
+    with project.db as db:
+        assert db.user_version == 4
+        assert sum(db.get_label_counts().values()) == len(db.get_results_table())
+
+
+def _create_v3_database(fp):
+    with asr.Database(fp) as db:
+        db.create_tables()
+        db.input.add_records([Record(i, "foo") for i in range(4)])
+        db.input.set_groups([(0, 0), (0, 1), (2, 2), (3, 3)])
+        db.label_record(0, 1)
+        db.label_record(2, 0)
+        db.add_last_ranking([3, 1, 0, 2], "nb", "max", "balanced", "tfidf", 2)
+        db.query_top_ranked()
+        db.label_record(3, 1)
+
+    # the database of version 3 stores the model in every row of the last ranking
+    # and has no label counts and indexes on the label and duplicate_of columns
+    with sqlite3.connect(fp) as conn:
+        conn.execute("DROP TABLE results_label_counts")
+        conn.execute("DROP TABLE label_sequence_version")
+        for table in ["results", "record"]:
+            for trigger in ["insert", "delete", "update"]:
+                conn.execute(f"DROP TRIGGER trg_{table}_label_counts_{trigger}")
+                conn.execute(
+                    f"DROP TRIGGER IF EXISTS trg_{table}_label_sequence_{trigger}"
+                )
+        conn.execute("DROP INDEX idx_results_label")
+        conn.execute("DROP INDEX idx_record_duplicate_of")
+        conn.execute("DROP TABLE last_ranking")
+        conn.execute("DROP TABLE last_ranking_model")
+        pandas.DataFrame(
+            {
+                "record_id": [3, 1, 0, 2],
+                "ranking": [0, 1, 2, 3],
+                "classifier": "nb",
+                "querier": "max",
+                "balancer": "balanced",
+                "feature_extractor": "tfidf",
+                "training_set": 2,
+                "time": 1.0,
+            }
+        ).to_sql("last_ranking", conn, index=False)
+        conn.execute("PRAGMA user_version = 3")
+    conn.close()
+
+
+def test_migrate_database_3_to_4(tmpdir):
+    fp = Path(tmpdir, "results.db")
+    _create_v3_database(fp)
+
+    _migrate_database(fp)
+
+    with asr.Database(fp) as db:
+        db._is_valid()
+        ranking = db.get_last_ranking_table()
+        assert ranking["record_id"].to_list() == [3, 1, 0, 2]
+        assert ranking["classifier"].to_list() == ["nb"] * 4
+        assert db.get_last_training_set() == 2
+        columns = db._conn.execute("PRAGMA table_info(last_ranking)").fetchall()
+        assert [col[1] for col in columns] == ["record_id", "ranking"]
+
+        names = db._conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        assert {name for (name,) in names} >= {
+            "idx_results_label",
+            "idx_record_duplicate_of",
+        }
+
+        assert db.get_label_counts() == {0: 1, 1: 2}
+        assert db.label_sequence_version == 0
+        db.update_result(2, label=1)
+        assert db.get_label_counts() == {0: 0, 1: 3}
+        db.delete_result(3)
+        assert db.get_label_counts() == {0: 0, 1: 2}
+        assert db.label_sequence_version == 2
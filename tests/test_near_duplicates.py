@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from asreview.data.loader import load_dataset
+from asreview.data.near_duplicates import identify_near_duplicate_pairs
+from asreview.data.near_duplicates import merge_groups
+from asreview.data.near_duplicates import minhash_signatures
+
+ABSTRACT = (
+    "Active learning for screening prioritization in systematic reviews is a "
+    "method to find all relevant records while reading only a fraction of the "
+    "records. A model is trained on the labeled records and ranks the unlabeled "
+    "records, so the most likely relevant records are shown first to the reviewer."
+)
+
+
+def test_minhash_signatures():
+    signatures = minhash_signatures(
+        ["A title", "a TITLE.", "Another title", None],
+        [ABSTRACT, ABSTRACT, "Something else entirely.", None],
+        num_perm=32,
+    )
+
+    assert signatures.shape == (4, 32)
+    assert signatures.dtype == np.uint32
+    assert (signatures[0] == signatures[1]).all()
+    assert (signatures[0] != signatures[2]).any()
+    # records without text get the empty signature
+    assert (signatures[3] == np.iinfo(np.uint32).max).all()
+
+
+def test_identify_near_duplicate_pairs():
+    titles = ["A title", "A title", "Another title", None, None]
+    abstracts = [
+        ABSTRACT,
+        ABSTRACT.replace("reviewer.", "reviewer. © 2024 The Authors."),
+        "Something else entirely.",
+        None,
+        None,
+    ]
+    signatures = minhash_signatures(titles, abstracts)
+
+    pairs = identify_near_duplicate_pairs(signatures, [10, 11, 12, 13, 14])
+    assert pairs == [(10, 11)]
+
+
+def test_identify_near_duplicate_pairs_threshold():
+    edited = ABSTRACT.replace("the most likely", "the probably").replace(
+        "fraction", "part"
+    )
+    signatures = minhash_signatures(["A title", "A title"], [ABSTRACT, edited])
+    similarity = (signatures[0] == signatures[1]).mean()
+
+    # with one row per band, every pair with an equal value is a candidate
+    def pairs(threshold):
+        return identify_near_duplicate_pairs(
+            signatures, [0, 1], threshold=threshold, n_bands=128
+        )
+
+    assert 0.3 < similarity < 1
+    assert pairs(similarity) == [(0, 1)]
+    assert pairs(similarity + 0.01) == []
+
+
+def test_merge_groups():
+    assert merge_groups([]) == []
+    assert merge_groups([(0, 0), (0, 3), (3, 5), (7, 2), (4, 4)]) == [
+        (0, 0),
+        (0, 3),
+        (0, 5),
+        (2, 2),
+        (2, 7),
+    ]
+
+
+def test_load_dataset_near_duplicates(tmpdir):
+    data = pd.DataFrame(
+        {
+            "title": ["A title", "A title", "Another title", "A title"],
+            "abstract": [
+                ABSTRACT,
+                ABSTRACT.replace("reviewer.", "reviewer. Published by Elsevier Ltd."),
+                "Something else entirely.",
+                ABSTRACT.replace("screening", "title and abstract screening"),
+            ],
+        }
+    )
+    fp = Path(tmpdir, "near_duplicates.csv")
+    data.to_csv(fp, index=False)
+
+    # exact duplicates only
+    with load_dataset(fp) as db:
+        assert db.input.get_groups() == [(0, 0), (0, 1), (2, 2), (3, 3)]
+
+    with load_dataset(fp, near_duplicate_threshold=0.7, chunk_size=2) as db:
+        assert db.input.get_groups() == [(0, 0), (0, 1), (0, 3), (2, 2)]
@@ -1,6 +1,8 @@
 import os
 import sqlite3
+import zipfile
 
+import pandas as pd
 import pytest
 from pathlib import Path
 
@@ -80,3 +82,38 @@ def test_project_closes_db_on_exception(tmpdir):
 
     # db file should be unlocked (this is what fails on Windows with leaked connections)
     os.remove(project.db_path)
+
+
+def test_add_dataset_simulation_partially_labeled(tmpdir):
+    data_fp = Path(tmpdir, "partially_labeled.csv")
+    df = pd.read_csv(Path("tests", "demo_data", "generic_labels.csv"))
+    df.loc[5, "label_included"] = None
+    df.to_csv(data_fp, index=False)
+
+    project = asr.Project.create(Path(tmpdir, "test.asreview"), project_mode="simulate")
+    with pytest.raises(ValueError, match="fully labeled"):
+        project.add_dataset(data_fp)
+    assert project.db.input.is_empty()
+
+
+def test_project_export(tmpdir):
+    project_path = Path(tmpdir, "test.asreview")
+    project = asr.Project.create(project_path)
+    project.add_dataset(Path("tests", "demo_data", "generic_labels.csv"))
+
+    with project.db as db:
+        db.label_record(0, 1)
+        db.label_record(1, 0)
+        assert Path(f"{project.db_path}-wal").exists()
+
+        export_fp = Path(tmpdir, "export.asreview")
+        project.export(export_fp)
+
+    with zipfile.ZipFile(export_fp) as zip_file:
+        names = zip_file.namelist()
+        assert project.PATH_DB in names
+        assert not any(name.endswith(("-wal", "-shm")) for name in names)
+        zip_file.extract(project.PATH_DB, Path(tmpdir, "export"))
+
+    with asr.Database(Path(tmpdir, "export", project.PATH_DB)) as db:
+        assert db.get_results_table("label")["label"].tolist() == [1, 0]
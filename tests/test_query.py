@@ -1,8 +1,12 @@
 import numpy as np
 import pytest
+from sklearn.utils import check_random_state
 
 from asreview.extensions import extensions
 from asreview.extensions import load_extension
+from asreview.models.queriers import Max
+from asreview.models.queriers import _mix_indices
+from asreview.models.queriers import _mix_indices_top_k
 
 
 def test_classifiers():
@@ -35,3 +39,78 @@ def test_query(query):
     query_idx = querier.query(proba[:, 1])
     assert len(query_idx) == len(np.unique(query_idx))
     assert len(query_idx) == X.shape[0]
+
+
+def _mix_indices_loop(query_idx_1, query_idx_2, mix_probability, random_state):
+    query_idx_mix = []
+    i = 0
+    j = 0
+
+    while i < len(query_idx_1) and j < len(query_idx_2):
+        if check_random_state(random_state).rand() < mix_probability:
+            query_idx_mix.append(query_idx_1[i])
+            i = i + 1
+        else:
+            query_idx_mix.append(query_idx_2[j])
+            j = j + 1
+
+    indexes = np.unique(query_idx_mix, return_index=True)[1]
+    return [query_idx_mix[i] for i in sorted(indexes)]
+
+
+@pytest.mark.parametrize("mix_probability", [0.0, 0.5, 0.95, 1.0])
+@pytest.mark.parametrize("seed", [None, 535, "random_state"])
+def test_mix_indices(mix_probability, seed):
+    n = 200
+    query_idx_1 = np.random.RandomState(1).permutation(n)
+    query_idx_2 = np.random.RandomState(2).permutation(n)
+
+    def random_state():
+        return np.random.RandomState(3) if seed == "random_state" else seed
+
+    np.random.seed(4)
+    rs = random_state()
+    expected = _mix_indices_loop(query_idx_1, query_idx_2, mix_probability, rs)
+    expected_next = check_random_state(rs).rand()
+
+    np.random.seed(4)
+    rs = random_state()
+    mixed = _mix_indices(query_idx_1, query_idx_2, mix_probability, rs)
+    assert mixed.tolist() == expected
+    assert check_random_state(rs).rand() == expected_next
+
+    for k in [1, 10, n]:
+        np.random.seed(4)
+        rs = random_state()
+        top_k = _mix_indices_top_k(
+            query_idx_1[:k], query_idx_2[:k], k, n, mix_probability, rs
+        )
+        assert top_k.tolist() == expected[:k]
+        assert check_random_state(rs).rand() == expected_next
+
+
+@pytest.mark.parametrize("query", extensions("models.queriers"))
+@pytest.mark.parametrize("k", [1, 10, 100, 200])
+def test_query_top_k(query, k):
+    # rounded probabilities to test ties
+    p = np.round(np.random.RandomState(535).rand(100), 2)
+
+    params = load_extension("models.queriers", query.name)().get_params()
+    if "random_state" in params:
+        params["random_state"] = np.random.RandomState(535)
+    ranking = load_extension("models.queriers", query.name)(**params).query(p)
+
+    if "random_state" in params:
+        params["random_state"] = np.random.RandomState(535)
+    top_k = load_extension("models.queriers", query.name)(**params).query(p, k=k)
+
+    assert list(top_k) == list(ranking[:k])
+
+
+@pytest.mark.parametrize("k", [1, 10, 50])
+def test_query_top_k_baseline_order(k):
+    # the tied records are ordered as by the default sort of numpy
+    p = np.round(np.random.RandomState(535).rand(1000), 1)
+
+    assert list(Max().query(p)) == list(np.argsort(-p))
+    assert list(Max().query(p, k=k)) == list(np.argsort(-p)[:k])
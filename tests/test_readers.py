@@ -52,6 +52,19 @@ def test_reader(test_file, n_lines, ignore_col):
         assert len(values) == n_lines
 
 
+@mark.parametrize(
+    "test_file",
+    ["_baseline.ris", "embase.csv", "generic_labels.csv", "generic_tab.tsv"],
+)
+def test_read_record_chunks(test_file):
+    fp = Path("tests", "demo_data", test_file)
+    records = _from_file(fp)
+
+    chunks = list(_from_file(fp, chunk_size=4))
+    assert [len(chunk) for chunk in chunks[:-1]] == [4] * (len(chunks) - 1)
+    assert [record for chunk in chunks for record in chunk] == records
+
+
 @mark.internet_required
 def test_reader_from_url(osf_fg93a_path):
     records = _from_file(osf_fg93a_path)
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import asreview as asr
+from asreview.extensions import extensions
+from asreview.extensions import load_extension
+from asreview.models.queriers import TopDown
+from asreview.models.schedules import Geometric
+from asreview.models.schedules import NewRelevant
+from asreview.models.schedules import PoolFraction
+from asreview.models.stoppers import IsFittable
+
+
+def test_schedules():
+    assert len(extensions("models.schedules")) >= 3
+
+
+@pytest.mark.parametrize("schedule", extensions("models.schedules"))
+def test_schedule_name(schedule):
+    model = load_extension("models.schedules", schedule.name)()
+    assert model.name == schedule.name
+    assert isinstance(model.get_params(), dict)
+
+
+def test_geometric():
+    results = pd.DataFrame({"label": [1] * 100})
+    assert Geometric(factor=1.5).compute(results, np.zeros(1000)) == 50
+    assert Geometric(factor=1.5, max_n_query=10).compute(results, np.zeros(1000)) == 10
+    assert Geometric().compute(results.iloc[:0], np.zeros(1000)) == 1
+
+
+def test_pool_fraction():
+    results = pd.DataFrame({"label": [1] * 100})
+    assert PoolFraction(fraction=0.1).compute(results, np.zeros(1000)) == 90
+
+
+def test_new_relevant():
+    labels = np.array([0, 1, 0, 0, 1, 0, 1])
+    ranking = np.array([6, 0, 2, 3, 4, 5])
+
+    assert NewRelevant(k=1).compute(None, labels, ranking=ranking) == 1
+    assert NewRelevant(k=2).compute(None, labels, ranking=ranking) == 5
+    assert NewRelevant(k=3).compute(None, labels, ranking=ranking) == 7
+
+    with pytest.raises(ValueError):
+        NewRelevant().compute(None, labels)
+
+
+def test_schedule_meta():
+    cycle_data = asr.ActiveLearningCycleData(
+        querier="max",
+        classifier="nb",
+        feature_extractor="tfidf",
+        n_query="geometric",
+        n_query_param={"factor": 1.5},
+    )
+    cycle = asr.ActiveLearningCycle.from_meta(cycle_data)
+    assert isinstance(cycle.n_query, Geometric)
+    assert cycle.n_query.factor == 1.5
+
+    meta = cycle.to_meta()
+    assert meta.n_query == "geometric"
+    assert meta.n_query_param["factor"] == 1.5
+
+
+def test_simulate_schedule(demo_data):
+    cycles = [
+        asr.ActiveLearningCycle(querier=TopDown(), stopper=IsFittable()),
+        asr.ActiveLearningCycle(
+            querier=asr.load_extension("models.queriers", "max")(),
+            classifier=asr.load_extension("models.classifiers", "nb")(),
+            feature_extractor=asr.load_extension(
+                "models.feature_extractors", "tfidf"
+            )(),
+            n_query=Geometric(factor=1.5),
+        ),
+    ]
+
+    sim = asr.Simulate(demo_data, demo_data["label_included"], cycles, stopper=-1)
+    sim.review()
+
+    training_sets = sim._results["training_set"].unique()
+    assert len(training_sets) < len(sim._results)
+    assert sim._results["training_set"].is_monotonic_increasing
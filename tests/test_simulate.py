@@ -6,6 +6,7 @@ from asreview.models.queriers import Random
 from asreview.models.queriers import TopDown
 from asreview.models.stoppers import IsFittable
 from asreview.simulation.cli import _cli_simulate
+from asreview.simulation.simulate import _ResultsBuffer
 from asreview.simulation.simulate import _assert_no_conflicts_in_groups
 
 
@@ -29,6 +30,28 @@ def test_assert_no_conflicts_in_groups(labels, groups, should_raise):
         _assert_no_conflicts_in_groups(labels, groups)
 
 
+def test_results_buffer():
+    results = _ResultsBuffer(capacity=2)
+    results.append([0, 9], [0, 1], (None, None, None, None), None, 1.0)
+    results.append([3], [1], ("svm", "max", "balanced", "tfidf"), 2, 2.0)
+    results.append([4, 5], [0, 0], ("svm", "max", "balanced", "tfidf"), 3, 3.0)
+
+    assert len(results) == 5
+    assert results["label"].sum() == 2
+    assert results.record_ids.tolist() == [0, 9, 3, 4, 5]
+
+    df = results.to_frame()
+    assert list(df.columns) == _ResultsBuffer.COLUMNS
+    assert df["classifier"].tolist() == [None, None, "svm", "svm", "svm"]
+    assert df["training_set"].dtype == object
+    assert df["training_set"].tolist() == [None, None, 2, 3, 3]
+    assert results.to_frame() is df
+
+    results = _ResultsBuffer()
+    results.append([3], [1], ("svm", "max", "balanced", "tfidf"), 2, 2.0)
+    assert results.to_frame()["training_set"].dtype == "int64"
+
+
 @pytest.mark.parametrize("balancer", ["balanced", None])
 def test_simulate_basic(demo_data, balancer):
     if balancer is not None:
@@ -52,6 +52,33 @@ def test_prior_record_ids(tmp_project, demo_data_path, tmpdir):
     assert results_table["querier"][2:].notnull().all()
 
 
+def test_incremental(tmp_project, demo_data_path, tmpdir):
+    argv = (
+        f"{demo_data_path} -o {tmp_project} -c nb -q max -b balanced -e tfidf"
+        " --prior-idx 0 9 --incremental"
+    ).split()
+    _cli_simulate(argv)
+
+    with asr.Project.load(tmp_project, tmpdir).db as db:
+        results_table = db.get_results_table()
+
+    assert results_table["label"].sum() == 10
+
+
+@pytest.mark.parametrize("n_query", ["geometric", "pool_fraction", "new_relevant"])
+def test_n_query_schedule(tmp_project, demo_data_path, tmpdir, n_query):
+    argv = (
+        f"{demo_data_path} -o {tmp_project} -c nb -q max -b balanced -e tfidf"
+        f" --prior-idx 0 9 --n-query {n_query}"
+    ).split()
+    _cli_simulate(argv)
+
+    with asr.Project.load(tmp_project, tmpdir).db as db:
+        results_table = db.get_results_table()
+
+    assert results_table["label"].sum() == 10
+
+
 def test_n_prior_included(tmp_project, demo_data_path, tmpdir):
     argv = f"{demo_data_path} -o {tmp_project} --n-prior-included 2 --prior-seed 535".split()
     _cli_simulate(argv)
@@ -244,3 +271,94 @@ def test_grouped_records(tmp_path, demo_data, tmp_project, tmpdir):
         "record_id"
     ].to_list()
     assert normal_records["label"].to_list() == duplicate_records["label"].to_list()
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_batch(tmpdir, demo_data_path, n_jobs):
+    batch_fp = Path(tmpdir, "batch.json")
+    with open(batch_fp, "w") as f:
+        json.dump(
+            {
+                "cycles": [
+                    {
+                        "querier": "max",
+                        "classifier": "nb",
+                        "feature_extractor": "tfidf",
+                    },
+                    {
+                        "querier": "max",
+                        "classifier": "svm",
+                        "feature_extractor": "tfidf",
+                    },
+                ],
+                "seeds": [535, 165],
+                "priors": [[0, 9]],
+            },
+            f,
+        )
+
+    output_dir = Path(tmpdir, "batch")
+    _cli_simulate(
+        f"{demo_data_path} -o {output_dir} --batch-file {batch_fp} --n-jobs {n_jobs}"
+        " --n-stop 20".split()
+    )
+
+    with open(Path(output_dir, "runs.json")) as f:
+        runs = json.load(f)
+    assert len(runs) == 4
+
+    for i, run in enumerate(runs):
+        project = asr.Project.load(
+            Path(output_dir, run["filename"]), Path(tmpdir, str(i))
+        )
+        assert project.get_model_config()["classifier"] == run["cycle"]["classifier"]
+        with project.db as db:
+            results = db.get_results_table()
+        assert results["record_id"].head(2).to_list() == [0, 9]
+        assert len(results) == 20
+
+
+def test_batch_seed(tmpdir, demo_data_path):
+    batch_fp = Path(tmpdir, "batch.json")
+    with open(batch_fp, "w") as f:
+        json.dump(
+            {
+                "cycles": [
+                    {
+                        "querier": "max_random",
+                        "classifier": "nb",
+                        "feature_extractor": "tfidf",
+                    }
+                ],
+                "seeds": [535, 535],
+            },
+            f,
+        )
+
+    output_dir = Path(tmpdir, "batch")
+    _cli_simulate(
+        f"{demo_data_path} -o {output_dir} --batch-file {batch_fp} --prior-idx 0 9"
+        " --n-stop 20".split()
+    )
+
+    record_ids = []
+    for i in range(2):
+        project = asr.Project.load(
+            Path(output_dir, f"run_{i}.asreview"), Path(tmpdir, str(i))
+        )
+        with project.db as db:
+            record_ids.append(db.get_results_table()["record_id"].to_list())
+    assert record_ids[0] == record_ids[1]
+
+
+def test_batch_prior_options(tmpdir, demo_data_path):
+    batch_fp = Path(tmpdir, "batch.json")
+    with open(batch_fp, "w") as f:
+        json.dump({"seeds": [535]}, f)
+
+    argv = (
+        f"{demo_data_path} -o {Path(tmpdir, 'batch')} --batch-file {batch_fp}"
+        " --n-prior-included 1 --n-prior-excluded 1"
+    ).split()
+    with pytest.raises(ValueError, match="--n-prior-included"):
+        _cli_simulate(argv)
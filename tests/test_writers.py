@@ -28,3 +28,26 @@ def test_asreview_ris(test_file, columns, tmpdir):
 
     for col in columns:
         pd.testing.assert_series_equal(data[col], written_data[col])
+
+
+@pytest.mark.parametrize(
+    "test_file,write_format",
+    [
+        ("baseline_tag-notes_labels.ris", ".ris"),
+        ("baseline_tag-notes_labels.ris", ".csv"),
+        ("generic_labels.csv", ".csv"),
+        ("generic_labels.csv", ".tsv"),
+    ],
+)
+def test_write_data_chunks(test_file, write_format, tmpdir):
+    fp_in = Path("tests", "demo_data", test_file)
+    data = _get_reader(fp_in).read_data(fp_in)
+    if "included" in data:
+        data["asreview_label"] = data["included"]
+
+    fp_out = Path(tmpdir, f"tmp{write_format}")
+    writer = _get_writer(fp_out)
+    writer.write_data(data, fp_out)
+
+    chunks = (data.iloc[i : i + 2] for i in range(0, len(data), 2))
+    assert "".join(writer.write_data_chunks(chunks)) == fp_out.read_text("utf8")